@@ -0,0 +1,37 @@
+"""add lookup indexes
+
+Revision ID: 0de82b717b6e
+Revises: 94bca7ce99ae
+Create Date: 2026-10-18 11:02:17.483920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0de82b717b6e'
+down_revision: Union[str, None] = '94bca7ce99ae'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_phone', 'users', ['phone'], unique=True)
+    op.create_index('ix_orders_user_id_is_placed', 'orders', ['user_id', 'is_placed'], unique=False)
+    op.create_index('ix_item_category_category_id', 'item_category', ['category_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # MySQL drops the indexes it implicitly created for foreign keys once the
+    # indexes above cover them, so single-column replacements are created
+    # first to keep orders.user_id and item_category.category_id indexed.
+    op.create_index('ix_orders_user_id', 'orders', ['user_id'], unique=False)
+    op.drop_index('ix_orders_user_id_is_placed', table_name='orders')
+    op.create_index('ix_item_category_category_id_fk', 'item_category', ['category_id'], unique=False)
+    op.drop_index('ix_item_category_category_id', table_name='item_category')
+    op.drop_index('ix_users_phone', table_name='users')
@@ -0,0 +1,46 @@
+"""add order status
+
+Revision ID: 5f3c9a1e7b24
+Revises: 0de82b717b6e
+Create Date: 2026-10-18 13:26:51.204718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3c9a1e7b24'
+down_revision: Union[str, None] = '0de82b717b6e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column(
+        'status',
+        sa.Enum(
+            'open', 'placed', 'claimed', 'dispatched', 'delivered', 'cancelled',
+            name='orderstatus',
+            native_enum=False,
+            length=16,
+        ),
+        server_default='open',
+        nullable=False,
+    ))
+    op.add_column('orders', sa.Column('operator_id', sa.Integer(), nullable=True))
+    op.create_foreign_key('fk_orders_operator_id_users', 'orders', 'users', ['operator_id'], ['id'])
+    op.create_index('ix_orders_status_id', 'orders', ['status', 'id'], unique=False)
+
+    op.execute("UPDATE orders SET status = 'placed' WHERE is_placed")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_orders_status_id', table_name='orders')
+    op.drop_constraint('fk_orders_operator_id_users', 'orders', type_='foreignkey')
+    op.drop_column('orders', 'operator_id')
+    op.drop_column('orders', 'status')
@@ -0,0 +1,43 @@
+"""add order placed seq
+
+Revision ID: a7d2f5c81b06
+Revises: e4b7a0c3d519
+Create Date: 2026-10-18 18:02:37.540219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2f5c81b06'
+down_revision: Union[str, None] = 'e4b7a0c3d519'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orders', sa.Column('placed_seq', sa.Integer(), nullable=True))
+    op.create_index('ix_orders_placed_seq', 'orders', ['placed_seq'], unique=True)
+    op.create_table('order_placement',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('last_seq', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Placement order of existing Orders is unknown, their IDs are the closest to it.
+    op.execute("UPDATE orders SET placed_seq = id WHERE is_placed")
+    op.execute(
+        "INSERT INTO order_placement (id, last_seq) "
+        "SELECT 1, COALESCE(MAX(placed_seq), 0) FROM orders"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('order_placement')
+    op.drop_index('ix_orders_placed_seq', table_name='orders')
+    op.drop_column('orders', 'placed_seq')
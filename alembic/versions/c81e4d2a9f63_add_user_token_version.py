@@ -0,0 +1,28 @@
+"""add user token version
+
+Revision ID: c81e4d2a9f63
+Revises: 5f3c9a1e7b24
+Create Date: 2026-10-18 15:12:08.731520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e4d2a9f63'
+down_revision: Union[str, None] = '5f3c9a1e7b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
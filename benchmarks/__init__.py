@@ -0,0 +1,4 @@
+"""
+Benchmark suite driving realistic traffic through main.build_app() in-process.
+Run with `python -m benchmarks.run --help` from the repository root.
+"""
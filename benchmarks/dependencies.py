@@ -0,0 +1,185 @@
+"""
+Measure resolving the dependencies of every route, the work FastAPI does before calling a handler.
+
+    python -m benchmarks.dependencies --repeat 2000
+
+Dependants of the routes of main.build_app() are resolved with fastapi solve_dependencies(),
+as for a request of a superuser with a valid access token. The database session is replaced
+by a stub, so the time is the one of building the dependency tree alone. Request bodies are
+not sent, their validation errors are counted but not timed apart.
+"""
+# pylint: disable=import-outside-toplevel
+import os
+import re
+import sys
+import asyncio
+import argparse
+from time import perf_counter, time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+
+PATH_PARAM = re.compile(r"{([^}:]+)(:[^}]+)?}")
+
+
+@dataclass
+class RouteResult:
+    dependencies: int
+    errors: int
+    microseconds: float
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.dependencies",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--repeat", type=int, default=2000, help="Resolutions of every route.")
+    parser.add_argument("--route", help="Only measure routes with paths containing this text.")
+    return parser.parse_args(argv)
+
+
+class StubSession:
+    """
+    Stands for AsyncSession: repositories only keep the session, nothing is queried
+    while dependencies are resolved.
+    """
+
+    async def __aenter__(self) -> "StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def count_dependencies(dependant) -> int:
+    """
+    Returns:
+        Amount of distinct dependencies called to resolve given dependant.
+    """
+    seen = set()
+    pending = list(dependant.dependencies)
+    while pending:
+        dependency = pending.pop()
+        if dependency.cache_key not in seen:
+            seen.add(dependency.cache_key)
+            pending.extend(dependency.dependencies)
+    return len(seen)
+
+
+def build_scope(app, route, token: str) -> dict:
+    """
+    Returns:
+        ASGI scope of a request to given route, with 1 as every path parameter.
+    """
+    path_params = {match.group(1): "1" for match in PATH_PARAM.finditer(route.path)}
+    return {
+        "type": "http",
+        "app": app,
+        "method": sorted(route.methods)[0],
+        "path": PATH_PARAM.sub("1", route.path),
+        "path_params": path_params,
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+async def measure(app, route, token: str, repeat: int) -> RouteResult:
+    """
+    Resolve dependencies of given route repeat times.
+
+    Returns:
+        RouteResult with mean microseconds per resolution.
+    """
+    from starlette.requests import Request
+    from fastapi.dependencies.utils import solve_dependencies
+
+    scope = build_scope(app, route, token)
+    # pylint: disable=protected-access
+    embed_body_fields = route._embed_body_fields
+
+    async def solve() -> int:
+        async with AsyncExitStack() as stack:
+            solved = await solve_dependencies(
+                request=Request(scope),
+                dependant=route.dependant,
+                async_exit_stack=stack,
+                embed_body_fields=embed_body_fields,
+            )
+        return len(solved.errors)
+
+    errors = await solve()
+    started_at = perf_counter()
+    for _ in range(repeat):
+        await solve()
+    elapsed = perf_counter() - started_at
+
+    return RouteResult(
+        dependencies=count_dependencies(route.dependant),
+        errors=errors,
+        microseconds=elapsed / repeat * 1_000_000,
+    )
+
+
+async def run(args: argparse.Namespace) -> dict[str, RouteResult]:
+    """
+    Measure every route of the application.
+
+    Returns:
+        RouteResult by method and path of the route.
+    """
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+
+    from fastapi.routing import APIRoute
+
+    from main import build_app
+    from ufo_delivery.core.dependencies.db import session_manager
+    from ufo_delivery.core.dependencies.cache import principal_cache
+    from ufo_delivery.core.dependencies.auth.key_manager import key_manager
+
+    app = build_app()
+    # Not replaced through dependency_overrides: with any override set, FastAPI rebuilds
+    # every sub-dependant on every request, which would dominate the measurement.
+    session_manager.session_factory = StubSession
+
+    # Token version of the User is cached, so checking the token does not query the database.
+    principal_cache.set(1, 0, principal_cache.version())
+    claims = {"sub": "1", "role": "superuser", "ver": 0, "exp": int(time()) + 3600}
+    token = key_manager.encode(claims)
+
+    results = {}
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        if args.route and args.route not in route.path:
+            continue
+
+        name = f"{sorted(route.methods)[0]} {route.path}"
+        results[name] = await measure(app, route, token, args.repeat)
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark and print the mean time of resolving dependencies of every route.
+    """
+    results = asyncio.run(run(parse_args(argv)))
+
+    print(f"{'Route':<40} {'Deps':>5} {'Errors':>7} {'Resolve':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<40} {result.dependencies:>5} {result.errors:>7} "
+            f"{result.microseconds:>7.1f} µs"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Pick the cost of password hashes verified in a target time on this machine.
+
+    python -m benchmarks.hash_cost --scheme bcrypt --target-ms 250
+
+Prints the measured costs and the settings to put into .env. Run it on the hardware serving
+logins: every verify occupies one of PASSWORD_HASHING_WORKERS threads for the measured time.
+"""
+import sys
+import argparse
+from time import perf_counter
+
+from passlib.context import CryptContext
+
+PASSWORD = "calibration-password"
+
+# Costs tried for bcrypt, log2 of rounds. pbkdf2_sha256 iterations scale linearly instead.
+BCRYPT_ROUNDS = range(8, 17)
+PBKDF2_ROUNDS = 100_000
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.hash_cost",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--scheme", choices=["bcrypt", "pbkdf2_sha256"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250, help="Target time of one verify.")
+    parser.add_argument("--repeat", type=int, default=5, help="Verifies timed for every cost.")
+    parser.add_argument("--workers", type=int, default=4, help="PASSWORD_HASHING_WORKERS.")
+    return parser.parse_args(argv)
+
+
+def verify_ms(scheme: str, rounds: int, repeat: int) -> float:
+    """
+    Returns:
+        Fastest verify of a hash with given cost in milliseconds, out of repeat.
+    """
+    context = CryptContext(schemes=[scheme], **{f"{scheme}__rounds": rounds})
+    hashed_password = context.hash(PASSWORD)
+
+    fastest = float("inf")
+    for _ in range(repeat):
+        started_at = perf_counter()
+        context.verify(PASSWORD, hashed_password)
+        fastest = min(fastest, perf_counter() - started_at)
+    return fastest * 1000
+
+
+def calibrate(args: argparse.Namespace) -> tuple[int, dict[int, float]]:
+    """
+    Measure costs of the scheme until the target time is exceeded.
+
+    Returns:
+        Highest cost verified within the target time, at least the lowest one tried,
+        and verify milliseconds by measured cost.
+    """
+    if args.scheme == "pbkdf2_sha256":
+        elapsed = verify_ms(args.scheme, PBKDF2_ROUNDS, args.repeat)
+        rounds = max(1000, int(PBKDF2_ROUNDS * args.target_ms / elapsed) // 1000 * 1000)
+        return rounds, {PBKDF2_ROUNDS: elapsed, rounds: verify_ms(args.scheme, rounds, args.repeat)}
+
+    results = {}
+    chosen = BCRYPT_ROUNDS[0]
+    for rounds in BCRYPT_ROUNDS:
+        results[rounds] = verify_ms(args.scheme, rounds, args.repeat)
+        if results[rounds] > args.target_ms:
+            break
+        chosen = rounds
+    return chosen, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the calibration and print the chosen settings.
+    """
+    args = parse_args(argv)
+    chosen, results = calibrate(args)
+
+    print(f"{'Rounds':>10} {'Verify':>10} {'Logins/s':>10}")
+    for rounds, elapsed in sorted(results.items()):
+        marker = " <" if rounds == chosen else ""
+        print(f"{rounds:>10} {elapsed:>7.1f} ms {args.workers * 1000 / elapsed:>10.1f}{marker}")
+
+    print()
+    print(f"PASSWORD_HASH_SCHEME={args.scheme}")
+    print(f"PASSWORD_HASH_ROUNDS={chosen}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
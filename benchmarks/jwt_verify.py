@@ -0,0 +1,147 @@
+"""
+Measure JWT Tokens verified per second for every signing algorithm.
+
+    python -m benchmarks.jwt_verify --tokens 20000
+
+Keys are generated into a temporary directory. Every algorithm is measured with KeyManager,
+which keeps keys parsed, and with jwt.decode() given the PEM or secret to parse on every call.
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+from functools import partial
+from time import perf_counter, time
+from collections.abc import Callable
+
+from jwt import decode
+from jwt.algorithms import get_default_algorithms
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from ufo_delivery.core.keys import KeyManager
+
+SECRET_KEY = "benchmark-secret-key-benchmark-secret-key"
+
+PRIVATE_KEYS: dict[str, Callable] = {
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate,
+}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.jwt_verify",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--tokens", type=int, default=20000, help="Tokens verified per verifier.")
+    parser.add_argument(
+        "--algorithms",
+        default="HS256,RS256,ES256,EdDSA",
+        help="Comma separated algorithms to measure.",
+    )
+    return parser.parse_args(argv)
+
+
+def write_keys(directory: str, algorithm: str) -> tuple[str | None, str | None, str | bytes]:
+    """
+    Generate a key pair of given algorithm and write its private key and JWKS files.
+
+    Returns:
+        Private key file, JWKS file and the key verifying tokens without KeyManager.
+        Files are None for HS* algorithms, which are signed and verified with SECRET_KEY.
+    """
+    if algorithm.startswith("HS"):
+        return None, None, SECRET_KEY
+
+    private_key = PRIVATE_KEYS[algorithm]()
+    private_key_file = os.path.join(directory, f"{algorithm}.pem")
+    with open(private_key_file, "wb") as file:
+        file.write(private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+
+    public_key = private_key.public_key()
+    jwk = get_default_algorithms()[algorithm].to_jwk(public_key, as_dict=True)
+    jwk.update(kid=algorithm, alg=algorithm, use="sig")
+    jwks_file = os.path.join(directory, f"{algorithm}.json")
+    with open(jwks_file, "w", encoding="utf-8") as file:
+        json.dump({"keys": [jwk]}, file)
+
+    public_pem = public_key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_key_file, jwks_file, public_pem
+
+
+def measure(verify: Callable[[str], dict], token: str, tokens: int) -> float:
+    """
+    Returns:
+        Tokens verified per second.
+    """
+    started_at = perf_counter()
+    for _ in range(tokens):
+        verify(token)
+    return tokens / (perf_counter() - started_at)
+
+
+def run(args: argparse.Namespace, directory: str) -> dict[str, dict[str, float]]:
+    """
+    Sign a token with every algorithm and measure both verifiers.
+
+    Returns:
+        Tokens per second by algorithm and verifier.
+    """
+    claims = {"sub": "1", "role": "user", "ver": 0, "exp": int(time()) + 3600}
+    options = {"require": ["sub", "exp"]}
+    results = {}
+    for algorithm in args.algorithms.split(","):
+        private_key_file, jwks_file, raw_key = write_keys(directory, algorithm)
+        key_manager = KeyManager(
+            algorithm=algorithm,
+            secret_key=SECRET_KEY,
+            private_key_file=private_key_file,
+            key_id=algorithm,
+            jwks_file=jwks_file,
+        )
+        token = key_manager.encode(claims)
+        assert key_manager.decode(token, options) == claims, f"{algorithm} token differs"
+
+        results[algorithm] = {
+            "cached": measure(partial(key_manager.decode, options=options), token, args.tokens),
+            "parsed": measure(
+                partial(decode, key=raw_key, algorithms=[algorithm], options=options),
+                token,
+                args.tokens,
+            ),
+        }
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark and print tokens verified per second.
+    """
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        results = run(args, directory)
+
+    print(f"{'Algorithm':<10} {'KeyManager':>12} {'jwt.decode':>12}")
+    for algorithm, result in results.items():
+        print(f"{algorithm:<10} {result['cached']:>10.0f}/s {result['parsed']:>10.0f}/s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
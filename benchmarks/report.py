@@ -0,0 +1,108 @@
+import math
+from collections import defaultdict
+
+from benchmarks.traffic import Recorder, Sample
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of given sorted values.
+    """
+    if not values:
+        return 0.0
+
+    rank = max(1, math.ceil(percent / 100 * len(values)))
+    return values[rank - 1]
+
+
+def _summarize(samples: list[Sample], duration: float) -> dict:
+    latencies = sorted(sample.elapsed * 1000 for sample in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(sample.error for sample in samples),
+        "rps": round(len(samples) / duration, 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "max_ms": round(latencies[-1], 3),
+        "queries_per_request": round(sum(sample.queries for sample in samples) / len(samples), 2),
+    }
+
+
+def build_report(recorder: Recorder, duration: float, meta: dict) -> dict:
+    """
+    Aggregate recorded samples into totals and per-endpoint statistics.
+    """
+    by_endpoint: dict[str, list[Sample]] = defaultdict(list)
+    for sample in recorder.samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    return {
+        "meta": meta,
+        "total": _summarize(recorder.samples, duration) if recorder.samples else {},
+        "endpoints": {
+            endpoint: _summarize(samples, duration)
+            for endpoint, samples in sorted(by_endpoint.items())
+        },
+        "checks": {
+            "double_claims": recorder.double_claims,
+        },
+    }
+
+
+def format_report(report: dict) -> str:
+    """
+    Render given report as a plain text table.
+    """
+    header = (
+        f"{'endpoint':<40} {'requests':>9} {'errors':>7} {'rps':>9} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    rows = list(report["endpoints"].items())
+    if report["total"]:
+        rows.append(("total", report["total"]))
+
+    for endpoint, stats in rows:
+        lines.append(
+            f"{endpoint:<40} {stats['requests']:>9} {stats['errors']:>7} {stats['rps']:>9.1f} "
+            f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} "
+            f"{stats['queries_per_request']:>8.2f}"
+        )
+
+    lines.append(f"double claims: {report['checks']['double_claims']}")
+    return "\n".join(lines)
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare given report with a baseline report of the same mix.
+    Throughput may drop and p95 latency may grow by tolerance, a share of the baseline value.
+    Queries per request barely depend on timing and may grow by 0.1 at most.
+
+    Returns:
+        Descriptions of regressions, empty if there are none.
+    """
+    regressions = []
+    if report["checks"]["double_claims"]:
+        regressions.append(f"{report['checks']['double_claims']} orders claimed more than once")
+
+    for endpoint, stats in report["endpoints"].items():
+        base = baseline["endpoints"].get(endpoint)
+        if base is None:
+            continue
+
+        if stats["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{endpoint}: rps {base['rps']} -> {stats['rps']}")
+        if stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{endpoint}: p95 {base['p95_ms']} ms -> {stats['p95_ms']} ms")
+        if stats["queries_per_request"] > base["queries_per_request"] + 0.1:
+            regressions.append(
+                f"{endpoint}: queries per request "
+                f"{base['queries_per_request']} -> {stats['queries_per_request']}"
+            )
+        if stats["errors"] and not base["errors"]:
+            regressions.append(f"{endpoint}: {stats['errors']} errors")
+
+    return regressions
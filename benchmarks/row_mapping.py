@@ -0,0 +1,159 @@
+"""
+Compare loading read-only DTOs through ORM instances with building them straight from rows.
+
+    python -m benchmarks.row_mapping --items 5000 --orders 500 --order-items 20
+
+A fresh SQLite file in a temporary directory is seeded, every repetition uses a new session.
+"""
+# pylint: disable=import-outside-toplevel
+import os
+import sys
+import random
+import asyncio
+import argparse
+import tempfile
+from time import perf_counter
+from collections.abc import Awaitable, Callable
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.row_mapping",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--items", type=int, default=5000, help="Items in the catalog.")
+    parser.add_argument("--orders", type=int, default=500, help="Placed Orders in a page.")
+    parser.add_argument("--order-items", type=int, default=20, help="Maximum Items in an Order.")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions of every loader.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace, db_url: str) -> dict[str, float]:  # pylint: disable=too-many-locals
+    """
+    Time every loader and check both loaders of the same data return equal DTOs.
+
+    Returns:
+        Mean milliseconds per call by loader.
+    """
+    from sqlalchemy import select
+    from sqlalchemy.orm import joinedload, selectinload
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    from benchmarks.seed import Sizes, seed
+    from ufo_delivery.repositories.db.items import ItemRepository
+    from ufo_delivery.repositories.db.orders import OrderRepository
+    from ufo_delivery.models.db.items import Item
+    from ufo_delivery.models.db.orders import Order, OrderItem
+    from ufo_delivery.models.db.users import User
+    from ufo_delivery.models.dto.orders import CustomerDTO, PlacedOrderDTO
+
+    engine = create_async_engine(db_url)
+    sizes = Sizes(
+        items=args.items,
+        users=args.orders,
+        operators=0,
+        orders=0,
+        queue=args.orders,
+        max_order_items=args.order_items,
+    )
+    await seed(engine, sizes, random.Random(args.seed))
+    session_maker = async_sessionmaker(engine)
+
+    async def orm_catalog(session):
+        # How the catalog was loaded before ItemRepository.read_all().
+        statement = select(Item).options(selectinload(Item.categories))
+        return [item.to_dto() for item in await session.scalars(statement)]
+
+    async def read_catalog(session):
+        return await ItemRepository(session).read_all()
+
+    def to_placed_dto(order: Order) -> PlacedOrderDTO:
+        return PlacedOrderDTO(
+            id=order.id,
+            items=[order_item.to_dto() for order_item in order.order_items],
+            is_placed=order.is_placed,
+            status=order.status,
+            customer=CustomerDTO(
+                id=order.user.id,
+                name=order.user.name,
+                phone=order.user.phone,
+                address=order.user.address.to_dto() if order.user.address else None,
+            ),
+            operator_id=order.operator_id,
+            placed_seq=order.placed_seq,
+        )
+
+    async def orm_orders(session):
+        # How placed Orders were loaded before OrderRepository.read_placed_page().
+        statement = (
+            select(Order)
+            .where(Order.is_placed == True)  # pylint: disable=singleton-comparison
+            .order_by(Order.id)
+            .limit(args.orders)
+            .options(
+                selectinload(Order.order_items)
+                .joinedload(OrderItem.item)
+                .selectinload(Item.categories),
+                joinedload(Order.user).joinedload(User.address),
+            )
+        )
+        return [to_placed_dto(order) for order in await session.scalars(statement)]
+
+    async def read_orders(session):
+        return await OrderRepository(session).read_placed_page(None, args.orders)
+
+    loaders: dict[str, Callable[..., Awaitable[list]]] = {
+        "catalog orm": orm_catalog,
+        "catalog rows": read_catalog,
+        "orders orm": orm_orders,
+        "orders rows": read_orders,
+    }
+
+    results = {}
+    dumps = {}
+    for name, loader in loaders.items():
+        async with session_maker() as session:
+            dtos = await loader(session)
+        dumps[name] = [dto.model_dump() for dto in dtos]
+        for dump in dumps[name]:
+            # Order of Items loaded by the ORM is not defined, compare them sorted.
+            if "customer" in dump:
+                dump["items"].sort(key=lambda order_item: order_item["item"]["id"])
+
+        started_at = perf_counter()
+        for _ in range(args.repeat):
+            async with session_maker() as session:
+                await loader(session)
+        results[name] = (perf_counter() - started_at) / args.repeat * 1000
+
+    await engine.dispose()
+    assert dumps["catalog orm"] == dumps["catalog rows"], "catalog loaders differ"
+    assert dumps["orders orm"] == dumps["orders rows"], "order loaders differ"
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark and print mean latency of every loader.
+    """
+    args = parse_args(argv)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_url = f"sqlite+aiosqlite:///{os.path.join(directory, 'benchmark.sqlite')}"
+        results = asyncio.run(run(args, db_url))
+
+    for name, elapsed in results.items():
+        print(f"{name:<14} {elapsed:>9.2f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Seed a database, start main.build_app() in-process and drive a traffic mix through it.
+
+    python -m benchmarks.run --mix default --duration 30 --output results.json
+    python -m benchmarks.run --output current.json --baseline baseline.json --tolerance 0.2
+
+Without --db-url a fresh SQLite file in a temporary directory is used.
+"""
+# pylint: disable=import-outside-toplevel
+import os
+import sys
+import json
+import random
+import asyncio
+import argparse
+import platform
+import tempfile
+from datetime import datetime, timezone
+
+from benchmarks.traffic import MIXES
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse and validate command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--mix", choices=sorted(MIXES), default="default")
+    parser.add_argument("--concurrency", type=int, default=20, help="Virtual users.")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds.")
+    parser.add_argument("--warmup", type=float, default=5, help="Seconds before measuring.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--operators", type=int, default=20, help="Users with superuser rights.")
+    parser.add_argument("--orders", type=int, default=20000, help="Orders in order history.")
+    parser.add_argument("--queue", type=int, default=5000, help="Placed Orders to claim.")
+    parser.add_argument("--db-url", help="SQLAlchemy URL of a throwaway database.")
+    parser.add_argument(
+        "--recreate-database",
+        action="store_true",
+        help="Confirm dropping every table of --db-url database.",
+    )
+    parser.add_argument("--output", help="Write JSON report to given file.")
+    parser.add_argument("--baseline", help="Compare with JSON report in given file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed share of throughput drop and p95 growth.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.db_url and not args.recreate_database:
+        parser.error("--db-url database is wiped and seeded, confirm with --recreate-database")
+    if args.operators >= args.users:
+        parser.error("--users has to be greater than --operators")
+
+    return args
+
+
+def configure_environment(args: argparse.Namespace, directory: str) -> str:
+    """
+    Point settings at the benchmark database before the application is imported.
+
+    Returns:
+        Database URL.
+    """
+    url = args.db_url or f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}?timeout=30"
+    os.environ["DB_URL"] = url
+    os.environ["DB_POOL_SIZE"] = os.environ.get("DB_POOL_SIZE", str(args.concurrency))
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+    # Virtual users log in again and again from one address, as no real client would.
+    os.environ.setdefault("LOGIN_LIMIT_PHONE_BURST", "0")
+    os.environ.setdefault("LOGIN_LIMIT_CLIENT_BURST", "0")
+    return url
+
+
+async def run(args: argparse.Namespace, url: str) -> dict:  # pylint: disable=too-many-locals
+    """
+    Seed the database, run the mix and build the report.
+    """
+    import httpx
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from main import build_app
+    from ufo_delivery.core.dependencies.db import session_manager
+    from benchmarks.seed import Sizes, seed
+    from benchmarks.traffic import (
+        BenchmarkClient,
+        Recorder,
+        VirtualUser,
+        count_query,
+        login,
+        run_virtual_user,
+    )
+    from benchmarks.report import build_report
+
+    rng = random.Random(args.seed)
+    sizes = Sizes(args.categories, args.items, args.users, args.operators, args.orders, args.queue)
+    engine = create_async_engine(url)
+    try:
+        dataset = await seed(engine, sizes, rng)
+    finally:
+        await engine.dispose()
+
+    app = build_app()
+    recorder = Recorder()
+    phones = dataset.operator_phones if args.mix == "operators" else dataset.customer_phones
+
+    async with app.router.lifespan_context(app):
+        event.listen(session_manager.engine.sync_engine, "before_cursor_execute", count_query)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            users = [
+                VirtualUser(
+                    BenchmarkClient(client, recorder),
+                    dataset,
+                    recorder,
+                    random.Random(rng.random()),
+                    phones[i % len(phones)],
+                )
+                for i in range(args.concurrency)
+            ]
+            await asyncio.gather(*(login(user) for user in users))
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + args.warmup + args.duration
+            tasks = [
+                asyncio.create_task(run_virtual_user(user, MIXES[args.mix], deadline))
+                for user in users
+            ]
+            await asyncio.sleep(args.warmup)
+            recorder.recording = True
+            started_at = loop.time()
+            await asyncio.gather(*tasks)
+            duration = loop.time() - started_at
+
+    meta = {
+        "mix": args.mix,
+        "weights": MIXES[args.mix],
+        "concurrency": args.concurrency,
+        "duration": round(duration, 3),
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "sizes": vars(sizes),
+        "database": url.split(":", 1)[0],
+        "python": platform.python_version(),
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    return build_report(recorder, duration, meta)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark and compare it with the baseline if given.
+
+    Returns:
+        Exit code, 1 if there are regressions.
+    """
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="ufo-bench-") as directory:
+        url = configure_environment(args, directory)
+        report = asyncio.run(run(args, url))
+
+    from benchmarks.report import compare, format_report
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        if baseline["meta"]["mix"] != report["meta"]["mix"]:
+            print(f"Baseline is of {baseline['meta']['mix']} mix, not {report['meta']['mix']}")
+            return 2
+
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+import random
+from dataclasses import dataclass, field
+from collections.abc import Iterator
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ufo_delivery.models.db import Base
+from ufo_delivery.models.db.items import Item, Category, ItemCategoryRelation
+from ufo_delivery.models.db.users import User, Address
+from ufo_delivery.models.db.orders import Order, OrderItem, OrderPlacement
+from ufo_delivery.models.dto.orders import OrderStatus
+
+PASSWORD = "benchmark"
+CHUNK_SIZE = 1000
+
+# Statuses of order history, the most of it delivered long ago.
+HISTORY_STATUSES = (
+    (OrderStatus.DELIVERED, 85),
+    (OrderStatus.CANCELLED, 10),
+    (OrderStatus.DISPATCHED, 5),
+)
+
+
+@dataclass
+class Sizes:
+    categories: int = 12
+    items: int = 300
+    users: int = 2000
+    operators: int = 20
+    orders: int = 20000
+    queue: int = 5000
+    max_order_items: int = 4
+
+
+@dataclass
+class Dataset:
+    """
+    IDs and credentials of seeded rows scenarios pick from.
+    """
+    category_ids: list[int] = field(default_factory=list)
+    item_ids: list[int] = field(default_factory=list)
+    available_item_ids: list[int] = field(default_factory=list)
+    customer_phones: list[str] = field(default_factory=list)
+    operator_phones: list[str] = field(default_factory=list)
+    password: str = PASSWORD
+
+
+def _chunks(rows: list[dict]) -> Iterator[list[dict]]:
+    for start in range(0, len(rows), CHUNK_SIZE):
+        yield rows[start:start + CHUNK_SIZE]
+
+
+def _phone(index: int) -> str:
+    return f"+1{index:010d}"
+
+
+async def seed(  # pylint: disable=too-many-locals
+        engine: AsyncEngine,
+        sizes: Sizes,
+        rng: random.Random,
+) -> Dataset:
+    """
+    Recreate the schema in the database of given engine and fill it with given amount of rows.
+    Every User gets the same password, hashed once with the application hashing context.
+
+    Returns:
+        Dataset describing seeded rows.
+    """
+    # The hashing context reads settings, which callers configure before seeding.
+    # pylint: disable-next=import-outside-toplevel
+    from ufo_delivery.core.dependencies.auth.context import context
+
+    dataset = Dataset()
+    password_hash = context.hash(PASSWORD)
+
+    categories = [{"id": i, "name": f"Category {i}"} for i in range(1, sizes.categories + 1)]
+    items = []
+    item_categories = []
+    for i in range(1, sizes.items + 1):
+        is_available = rng.random() >= 0.05
+        items.append({
+            "id": i,
+            "name": f"Item {i}",
+            "description": f"Description of item {i}",
+            "price": round(rng.uniform(1, 30), 2),
+            "image_path": f"/static/items/{i}.png",
+            "is_available": is_available,
+        })
+        for category_id in rng.sample(range(1, sizes.categories + 1), min(2, sizes.categories)):
+            item_categories.append({"item_id": i, "category_id": category_id})
+
+        dataset.item_ids.append(i)
+        if is_available:
+            dataset.available_item_ids.append(i)
+
+    users = []
+    addresses = []
+    for i in range(1, sizes.users + 1):
+        is_superuser = i <= sizes.operators
+        users.append({
+            "id": i,
+            "name": f"User {i}",
+            "phone": _phone(i),
+            "password": password_hash,
+            "is_superuser": is_superuser,
+        })
+        addresses.append({
+            "id": i,
+            "street": f"{i} Benchmark street",
+            "reference": "Green door",
+            "user_id": i,
+        })
+        (dataset.operator_phones if is_superuser else dataset.customer_phones).append(_phone(i))
+
+    customer_ids = range(sizes.operators + 1, sizes.users + 1)
+    statuses, weights = zip(*HISTORY_STATUSES)
+    orders = []
+    order_items = []
+    for i in range(1, sizes.orders + sizes.queue + 1):
+        in_queue = i > sizes.orders
+        orders.append({
+            "id": i,
+            "user_id": rng.choice(customer_ids),
+            "is_placed": True,
+            "status": OrderStatus.PLACED if in_queue else rng.choices(statuses, weights)[0],
+            "placed_seq": i,
+        })
+        amount = rng.randint(1, sizes.max_order_items)
+        for item_id in rng.sample(dataset.available_item_ids, amount):
+            order_items.append({"order_id": i, "item_id": item_id, "quantity": rng.randint(1, 3)})
+
+    dataset.category_ids = [category["id"] for category in categories]
+
+    async with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            # Lets readers run alongside the single writer SQLite allows.
+            await connection.execute(text("PRAGMA journal_mode=WAL"))
+
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+        for model, rows in (
+                (Category, categories),
+                (Item, items),
+                (ItemCategoryRelation, item_categories),
+                (User, users),
+                (Address, addresses),
+                (Order, orders),
+                (OrderItem, order_items),
+                (OrderPlacement, [{"id": 1, "last_seq": len(orders)}]),
+        ):
+            for chunk in _chunks(rows):
+                await connection.execute(insert(model), chunk)
+
+    return dataset
@@ -0,0 +1,111 @@
+"""
+Compare serialization of large DTO responses through FastAPI's response model
+with DTORoute, without a database.
+
+    python -m benchmarks.serialization --items 5000 --requests 50
+"""
+# pylint: disable=import-outside-toplevel
+import os
+import sys
+import asyncio
+import argparse
+from time import perf_counter
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.serialization",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--items", type=int, default=5000, help="Items in every response.")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per route.")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict[str, float]:  # pylint: disable=too-many-locals
+    """
+    Time GET requests of every route returning the same Items.
+
+    Returns:
+        Mean milliseconds per request by route.
+    """
+    import httpx
+    from fastapi import FastAPI, APIRouter
+
+    from ufo_delivery.models.dto.items import ItemDTO, CategoryDTO, ItemPage, PartialItemDTO
+    from ufo_delivery.utils.http_utils import DTORoute, page_response
+
+    categories = [CategoryDTO(id=1, name="Burgers"), CategoryDTO(id=2, name="Drinks")]
+    items = [
+        ItemDTO(
+            id=i,
+            name=f"Item {i}",
+            description=f"Description of item {i}",
+            price=9.99,
+            image_path=f"/static/items/{i}.png",
+            categories=categories,
+            is_available=True,
+        )
+        for i in range(1, args.items + 1)
+    ]
+    page = ItemPage(
+        items=[PartialItemDTO.model_validate(item.model_dump()) for item in items],
+        next_cursor=None,
+    )
+
+    default_router = APIRouter()
+    dto_router = APIRouter(route_class=DTORoute)
+
+    @default_router.get("/response-model")
+    async def response_model() -> list[ItemDTO]:
+        return items
+
+    @dto_router.get("/dto-route")
+    async def dto_route() -> list[ItemDTO]:
+        return items
+
+    @dto_router.get("/page-response")
+    async def page_route() -> list[PartialItemDTO]:
+        return page_response(page)
+
+    app = FastAPI()
+    app.include_router(default_router)
+    app.include_router(dto_router)
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for url in ("/response-model", "/dto-route", "/page-response"):
+            response = await client.get(url)
+            assert len(response.json()) == args.items
+
+            started_at = perf_counter()
+            for _ in range(args.requests):
+                await client.get(url)
+            results[url] = (perf_counter() - started_at) / args.requests * 1000
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the benchmark and print mean latency of every route.
+    """
+    args = parse_args(argv)
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-benchmark-secret-key")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+
+    results = asyncio.run(run(args))
+    baseline = results["/response-model"]
+    for url, elapsed in results.items():
+        print(f"{url:<20} {elapsed:>9.2f} ms {baseline / elapsed:>6.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
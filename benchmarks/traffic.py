@@ -0,0 +1,295 @@
+import random
+import asyncio
+from time import perf_counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from benchmarks.seed import Dataset
+
+# Queries executed for the request currently sent by this task.
+current_queries: ContextVar[list[int] | None] = ContextVar("current_queries", default=None)
+
+
+def count_query(*_) -> None:
+    """
+    before_cursor_execute listener counting queries of the request in flight.
+    """
+    queries = current_queries.get()
+    if queries is not None:
+        queries[0] += 1
+
+
+@dataclass
+class Sample:
+    endpoint: str
+    status: int
+    elapsed: float
+    queries: int
+    error: bool
+
+
+@dataclass
+class Recorder:
+    """
+    Collects samples once recording is enabled, so warmup traffic is left out.
+    """
+    recording: bool = False
+    samples: list[Sample] = field(default_factory=list)
+    claimed_order_ids: set[int] = field(default_factory=set)
+    double_claims: int = 0
+
+
+class BenchmarkClient:
+    """
+    Wrapper of httpx.AsyncClient timing every request and counting its queries.
+    Requests are labeled with route templates so reports group them by endpoint.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder):
+        self._client = client
+        self._recorder = recorder
+        self.headers: dict[str, str] = {}
+
+    async def request(
+            self,
+            endpoint: str,
+            url: str,
+            expected: tuple[int, ...] = (200,),
+            headers: dict[str, str] | None = None,
+            **kwargs,
+    ) -> httpx.Response | None:
+        """
+        Send request to given url with method taken from endpoint label, e.g. "GET /item/{item_id}".
+
+        Returns:
+            Response, None if the application raised.
+        """
+        method = endpoint.split(" ", 1)[0]
+        queries = [0]
+        token = current_queries.set(queries)
+        started_at = perf_counter()
+        try:
+            response = await self._client.request(
+                method, url, headers={**self.headers, **(headers or {})}, **kwargs
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            response = None
+        finally:
+            elapsed = perf_counter() - started_at
+            current_queries.reset(token)
+
+        if self._recorder.recording:
+            status = response.status_code if response is not None else 0
+            self._recorder.samples.append(
+                Sample(endpoint, status, elapsed, queries[0], status not in expected)
+            )
+
+        return response
+
+
+@dataclass
+class VirtualUser:
+    client: BenchmarkClient
+    dataset: Dataset
+    recorder: Recorder
+    rng: random.Random
+    phone: str
+    catalog_etag: str | None = None
+    refresh_token: str | None = None
+
+
+async def login(user: VirtualUser) -> None:
+    """
+    Log in as the User of given virtual user and keep its tokens.
+    """
+    response = await user.client.request(
+        "POST /auth/login",
+        "/auth/login",
+        json={"phone": user.phone, "password": user.dataset.password},
+    )
+    _keep_tokens(user, response)
+
+
+def _keep_tokens(user: VirtualUser, response: httpx.Response | None) -> None:
+    if response is not None and response.status_code == 200:
+        tokens = response.json()
+        user.client.headers["Authorization"] = f"Bearer {tokens['access_token']}"
+        user.refresh_token = tokens["refresh_token"]
+
+
+async def browse_menu(user: VirtualUser) -> None:
+    """
+    Open the menu, a category and a few Items. Revisits revalidate the catalog with its ETag.
+    """
+    await user.client.request("GET /item/categories", "/item/categories")
+
+    headers = {"If-None-Match": user.catalog_etag} if user.catalog_etag else {}
+    response = await user.client.request(
+        "GET /item/items", "/item/items", expected=(200, 304), headers=headers
+    )
+    if response is not None and "etag" in response.headers:
+        user.catalog_etag = response.headers["etag"]
+
+    await user.client.request(
+        "GET /item/items?category_id",
+        "/item/items",
+        params={"category_id": user.rng.choice(user.dataset.category_ids)},
+        expected=(200, 304),
+    )
+    for item_id in user.rng.sample(user.dataset.item_ids, 2):
+        await user.client.request("GET /item/{item_id}", f"/item/{item_id}")
+
+
+async def browse_pages(user: VirtualUser) -> None:
+    """
+    Page through the catalog with a sparse fieldset, as list views of mobile clients do.
+    """
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 50, "fields": "id,name,price"}
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        response = await user.client.request("GET /item/items?cursor", "/item/items", params=params)
+        cursor = response.headers.get("x-next-cursor") if response is not None else None
+        if not cursor:
+            return
+
+
+async def edit_cart(user: VirtualUser) -> None:
+    """
+    Add and remove Items one by one, change several at once and look at the cart.
+    """
+    items = user.rng.sample(user.dataset.available_item_ids, 3)
+    for item_id in items:
+        await user.client.request(
+            "PUT /order/add-item", "/order/add-item", json={"item_id": item_id}
+        )
+
+    await user.client.request(
+        "PUT /order/remove-item", "/order/remove-item", json={"item_id": items[0]}
+    )
+    await user.client.request(
+        "PUT /order/items",
+        "/order/items",
+        json={"items": [{"item_id": item_id, "quantity": 0} for item_id in items], "mode": "set"},
+    )
+    await user.client.request("GET /order", "/order")
+
+
+async def place_order(user: VirtualUser) -> None:
+    """
+    Fill the cart in one request and place it.
+    """
+    items = user.rng.sample(user.dataset.available_item_ids, user.rng.randint(1, 4))
+    await user.client.request(
+        "PUT /order/items",
+        "/order/items",
+        json={"items": [{"item_id": item_id, "quantity": 2} for item_id in items]},
+    )
+    await user.client.request("POST /order/place", "/order/place")
+
+
+async def profile(user: VirtualUser) -> None:
+    """
+    Look at the profile and address, mostly measuring authentication and dependency injection.
+    """
+    await user.client.request("GET /user", "/user")
+    await user.client.request("GET /user/address", "/user/address")
+
+
+async def relogin(user: VirtualUser) -> None:
+    """
+    Log in again, paying for password verification.
+    """
+    await login(user)
+
+
+async def refresh(user: VirtualUser) -> None:
+    """
+    Renew tokens with the refresh token, the cheap alternative to logging in again.
+    """
+    response = await user.client.request(
+        "POST /auth/refresh",
+        "/auth/refresh",
+        json={"refresh_token": user.refresh_token},
+    )
+    _keep_tokens(user, response)
+
+
+async def operate(user: VirtualUser) -> None:
+    """
+    Claim the next placed Order and deliver it. Every claimed Order ID is recorded
+    to detect Orders handed to several operators.
+    """
+    response = await user.client.request(
+        "POST /operator/orders/claim", "/operator/orders/claim", expected=(200, 404)
+    )
+    if response is None or response.status_code != 200:
+        await user.client.request(
+            "GET /operator/orders",
+            "/operator/orders",
+            params={"status": "placed", "limit": 20},
+        )
+        return
+
+    order_id = response.json()["id"]
+    if order_id in user.recorder.claimed_order_ids:
+        user.recorder.double_claims += 1
+    user.recorder.claimed_order_ids.add(order_id)
+
+    for status in ("dispatched", "delivered"):
+        await user.client.request(
+            "PUT /operator/orders/{order_id}/status",
+            f"/operator/orders/{order_id}/status",
+            json={"status": status},
+        )
+
+
+Scenario = Callable[[VirtualUser], Awaitable[None]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "browse_menu": browse_menu,
+    "browse_pages": browse_pages,
+    "edit_cart": edit_cart,
+    "place_order": place_order,
+    "profile": profile,
+    "login": relogin,
+    "refresh": refresh,
+    "operate": operate,
+}
+
+# Weights of scenarios every virtual user picks from. The operators mix is run by
+# virtual users logged in as superusers.
+MIXES: dict[str, dict[str, int]] = {
+    "default": {
+        "browse_menu": 45,
+        "browse_pages": 10,
+        "edit_cart": 20,
+        "place_order": 10,
+        "profile": 10,
+        "login": 5,
+    },
+    "browse": {"browse_menu": 80, "browse_pages": 20},
+    "cart": {"edit_cart": 70, "place_order": 30},
+    "login": {"login": 100},
+    "login_storm": {"login": 70, "browse_menu": 30},
+    "refresh": {"refresh": 100},
+    "profile": {"profile": 100},
+    "operators": {"operate": 100},
+}
+
+
+async def run_virtual_user(user: VirtualUser, mix: dict[str, int], deadline: float) -> None:
+    """
+    Run scenarios picked by weights of given mix until deadline of the event loop clock.
+    """
+    loop = asyncio.get_running_loop()
+    scenarios = [SCENARIOS[name] for name in mix]
+    weights = list(mix.values())
+
+    while loop.time() < deadline:
+        await user.rng.choices(scenarios, weights)[0](user)
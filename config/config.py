@@ -1,3 +1,5 @@
+from typing import Literal
+
 from dotenv import find_dotenv, load_dotenv
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,6 +11,36 @@ class Auth(BaseSettings):
     secret_key: str = Field(alias="JWT_SECRET_KEY")
     algorithm: str = Field(alias="JWT_ALGORITHM")
     access_token_ttl: int = Field(default=30, alias="JWT_ACCESS_TOKEN_TTL")  # In minutes
+    # PEM private key signing tokens with asymmetric algorithms, e.g. RS256, ES256 or EdDSA.
+    private_key_file: str | None = Field(default=None, alias="JWT_PRIVATE_KEY_FILE")
+    key_id: str | None = Field(default=None, alias="JWT_KEY_ID")  # `kid` header of issued tokens
+    # Local JWKS file with public keys verifying tokens, the signing key is used if it is not set.
+    jwks_file: str | None = Field(default=None, alias="JWT_JWKS_FILE")
+    jwks_check_interval: int = Field(default=30, alias="JWT_JWKS_CHECK_INTERVAL")  # In seconds
+    refresh_token_ttl: int = Field(default=30, alias="JWT_REFRESH_TOKEN_TTL")  # In days
+    # In seconds, 0 disables removal of expired refresh tokens by this process.
+    refresh_token_sweep_interval: int = Field(default=3600, alias="REFRESH_TOKEN_SWEEP_INTERVAL")
+
+    # Scheme of new password hashes, hashes of the other one are still verified and rehashed on login.
+    hash_scheme: Literal["bcrypt", "pbkdf2_sha256"] = Field(
+        default="bcrypt",
+        alias="PASSWORD_HASH_SCHEME",
+    )
+    # Cost of new password hashes: log2 of rounds for bcrypt, iterations for pbkdf2_sha256.
+    # 0 for the default of the scheme, see `python -m benchmarks.hash_cost`.
+    hash_rounds: int = Field(default=0, alias="PASSWORD_HASH_ROUNDS")
+    hashing_workers: int = Field(default=4, alias="PASSWORD_HASHING_WORKERS")
+    hashing_queue_size: int = Field(default=32, alias="PASSWORD_HASHING_QUEUE_SIZE")
+
+
+class Server(BaseSettings):
+    # Worker processes, each with its own event loop, database pool and in-process caches.
+    workers: int = Field(default=1, alias="APP_WORKERS")
+    backlog: int = Field(default=2048, alias="APP_BACKLOG")
+    keep_alive: int = Field(default=5, alias="APP_KEEP_ALIVE")  # In seconds
+    # Connections per worker above which requests are answered with 503, 0 for no limit.
+    limit_concurrency: int = Field(default=0, alias="APP_LIMIT_CONCURRENCY")
+    graceful_timeout: int = Field(default=30, alias="APP_GRACEFUL_TIMEOUT")  # In seconds
 
 
 class Database(BaseSettings):
@@ -18,13 +50,72 @@ class Database(BaseSettings):
     database: str = Field(default="db", alias="DB_DATABASE")
     username: str = Field(default="username", alias="DB_USER")
     password: str = Field(default="password", alias="DB_PASSWORD")
+    # Full SQLAlchemy URL overriding the fields above, e.g. sqlite+aiosqlite:///bench.db
+    dsn: str | None = Field(default=None, alias="DB_URL")
+
+    pool_size: int = Field(default=10, alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=10, alias="DB_POOL_MAX_OVERFLOW")
+    pool_timeout: float = Field(default=10, alias="DB_POOL_TIMEOUT")  # In seconds
+    pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")  # In seconds
+    pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    connect_timeout: int = Field(default=5, alias="DB_CONNECT_TIMEOUT")  # In seconds
+
+    slow_query_threshold: int = Field(default=200, alias="DB_SLOW_QUERY_THRESHOLD")  # In milliseconds
+    repeated_query_threshold: int = Field(default=5, alias="DB_REPEATED_QUERY_THRESHOLD")
 
     @computed_field
     @property
     def url(self) -> str:
+        if self.dsn:
+            return self.dsn
+
         return f"mysql+aiomysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
+class Cache(BaseSettings):
+    catalog_ttl: int = Field(default=300, alias="CATALOG_CACHE_TTL")  # In seconds
+    catalog_max_age: int = Field(default=30, alias="CATALOG_MAX_AGE")  # In seconds
+    invalidation_dir: str | None = Field(default=None, alias="CACHE_INVALIDATION_DIR")
+    principal_ttl: int = Field(default=30, alias="PRINCIPAL_CACHE_TTL")  # In seconds
+    principal_max_size: int = Field(default=10000, alias="PRINCIPAL_CACHE_MAX_SIZE")
+
+
+class Redis(BaseSettings):
+    url: str = Field(default="redis://127.0.0.1:6379/0", alias="REDIS_URL")
+    pool_size: int = Field(default=10, alias="REDIS_POOL_SIZE")
+
+
+class Cart(BaseSettings):
+    backend: Literal["sql", "memory", "redis"] = Field(default="sql", alias="CART_BACKEND")
+    ttl: int = Field(default=604800, alias="CART_TTL")  # In seconds, used by redis backend
+
+
+class LoginLimit(BaseSettings):
+    backend: Literal["memory", "redis"] = Field(default="memory", alias="LOGIN_LIMIT_BACKEND")
+    # Login attempts allowed at once and regained per minute, 0 attempts at once disables the limit.
+    phone_burst: int = Field(default=5, alias="LOGIN_LIMIT_PHONE_BURST")
+    phone_rate: float = Field(default=5, alias="LOGIN_LIMIT_PHONE_RATE")
+    client_burst: int = Field(default=30, alias="LOGIN_LIMIT_CLIENT_BURST")
+    client_rate: float = Field(default=30, alias="LOGIN_LIMIT_CLIENT_RATE")
+    # Buckets of every limit kept by the memory backend, least recently used are evicted.
+    max_keys: int = Field(default=100000, alias="LOGIN_LIMIT_MAX_KEYS")
+
+
+class Operator(BaseSettings):
+    feed_queue_size: int = Field(default=100, alias="OPERATOR_FEED_QUEUE_SIZE")
+    feed_max_subscribers: int = Field(default=500, alias="OPERATOR_FEED_MAX_SUBSCRIBERS")
+    feed_keepalive: int = Field(default=15, alias="OPERATOR_FEED_KEEPALIVE")  # In seconds
+    # Orders replayed to a reconnecting client at most, beyond that it is told to resync.
+    feed_replay_limit: int = Field(default=1000, alias="OPERATOR_FEED_REPLAY_LIMIT")
+    # Seconds between checks of every worker for Orders placed through any worker.
+    feed_poll_interval: float = Field(default=0.5, alias="OPERATOR_FEED_POLL_INTERVAL")
+
+
+class Pagination(BaseSettings):
+    default_limit: int = Field(default=50, alias="PAGINATION_DEFAULT_LIMIT")
+    max_limit: int = Field(default=200, alias="PAGINATION_MAX_LIMIT")
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -33,9 +124,18 @@ class Settings(BaseSettings):
 
     host: str = Field(default="127.0.0.1", alias="APP_HOST")
     port: int = Field(default=8080, alias="APP_PORT")
+    debug: bool = Field(default=False, alias="APP_DEBUG")
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
 
+    server: Server = Field(default_factory=Server)
     database: Database = Field(default_factory=Database)
     auth: Auth = Field(default_factory=Auth)
+    cache: Cache = Field(default_factory=Cache)
+    pagination: Pagination = Field(default_factory=Pagination)
+    redis: Redis = Field(default_factory=Redis)
+    cart: Cart = Field(default_factory=Cart)
+    login_limit: LoginLimit = Field(default_factory=LoginLimit)
+    operator: Operator = Field(default_factory=Operator)
 
 
 settings = Settings()
@@ -1,35 +1,113 @@
 # pylint: disable=missing-function-docstring
+# Settings groups are declared with Field(default_factory=...), which pylint takes for FieldInfo.
+# pylint: disable=no-member
+import os
+import sys
+import logging
+import tempfile
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from uvicorn import Server, Config
 
-from ufo_delivery.routes import orders, auth, users, items
+from ufo_delivery.routes import orders, auth, users, items, operator, metrics
+from ufo_delivery.core.dependencies.db import session_manager
+from ufo_delivery.core.dependencies.auth.authentication_manager import hashing_executor
+from ufo_delivery.core.dependencies.auth.password_rehash import password_rehashes
+from ufo_delivery.core.dependencies.auth.login_limiter import login_limiter
+from ufo_delivery.core.dependencies.repositories.cart_store import cart_store
+from ufo_delivery.core.dependencies.repositories.refresh_token_repository import (
+    refresh_token_sweeper,
+)
+from ufo_delivery.core.dependencies.order_feed import (
+    order_feed,
+    order_feed_relay,
+    order_feed_poller,
+)
+from ufo_delivery.core.query_stats import QueryStatsMiddleware
+from ufo_delivery.core.http_metrics import MetricsMiddleware
+from ufo_delivery.core.supervisor import RollingMultiprocess
 from config.config import settings
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    session_manager.start()
+    refresh_token_sweeper.start()
+    await order_feed_relay.start()
+    order_feed_poller.start()
+    try:
+        yield
+    finally:
+        await order_feed_poller.stop()
+        await refresh_token_sweeper.stop()
+        await password_rehashes.stop()
+        order_feed.close()
+        await session_manager.stop()
+        hashing_executor.shutdown()
+        await login_limiter.close()
+        if cart_store is not None:
+            await cart_store.close()
+
+
 def build_app() -> FastAPI:
     app = FastAPI(
         title="UFO Delivery",
         description="🍟 FastAPI backend service for a simple operator-assisted food delivery",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
+    app.add_middleware(QueryStatsMiddleware, debug_headers=settings.debug)
+    if settings.metrics_enabled:
+        # Added last to be the outermost and time the whole request.
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics.router)
+
     app.include_router(items.router)
     app.include_router(users.router)
     app.include_router(orders.router)
     app.include_router(auth.router)
+    app.include_router(operator.router)
 
     return app
 
 
 def main() -> None:
+    # Workers import the application themselves, so it is passed as an import string.
     config = Config(
-        app=build_app(),
+        app="main:build_app",
+        factory=True,
         host=settings.host,
         port=settings.port,
+        workers=settings.server.workers,
+        backlog=settings.server.backlog,
+        timeout_keep_alive=settings.server.keep_alive,
+        limit_concurrency=settings.server.limit_concurrency or None,
+        timeout_graceful_shutdown=settings.server.graceful_timeout,
     )
 
     server = Server(config)
-    server.run()
+    if config.workers == 1:
+        server.run()
+        return
+
+    if settings.cart.backend == "memory":
+        logging.getLogger("uvicorn.error").error(
+            "CART_BACKEND=memory keeps carts in a single process, "
+            "use sql or redis with APP_WORKERS > 1"
+        )
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory(prefix="ufo-delivery-") as directory:
+        # Caches of every worker have to see invalidations published by the others.
+        # Workers read settings when spawned, so the environment is enough to share it.
+        if not settings.cache.invalidation_dir:
+            os.environ["CACHE_INVALIDATION_DIR"] = directory
+
+        sock = config.bind_socket()
+        RollingMultiprocess(config, target=server.run, sockets=[sock]).run()
 
 
 if __name__ == '__main__':
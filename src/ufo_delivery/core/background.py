@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class KeyedTasks:
+    """
+    Fire-and-forget calls of given coroutine function, run in the event loop after the
+    caller has moved on. At most one call runs per key, further calls with a key which
+    is still running are dropped. Failures are logged.
+    """
+
+    def __init__(self, name: str, function: Callable[..., Awaitable[None]]):
+        self._name = name
+        self._function = function
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+
+    @property
+    def pending(self) -> int:
+        """
+        Amount of calls which have not finished yet.
+        """
+        return len(self._tasks)
+
+    def submit(self, key: Hashable, *args) -> bool:
+        """
+        Start calling the function with given arguments in the running event loop.
+
+        Returns:
+            False if a call with the same key is still running, otherwise True.
+        """
+        if key in self._tasks:
+            return False
+
+        self._tasks[key] = asyncio.create_task(self._run(key, args), name=f"{self._name}-{key}")
+        return True
+
+    async def stop(self) -> None:
+        """
+        Cancel running calls and wait for them to finish.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, key: Hashable, args: tuple) -> None:
+        try:
+            await self._function(*args)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Background task %s-%s failed", self._name, key)
+        finally:
+            del self._tasks[key]
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from typing import NamedTuple
+from collections.abc import Awaitable, Callable
+
+from ufo_delivery.core.invalidation import InvalidationChannel
+from ufo_delivery.core.metrics import registry, Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+FEED_SUBSCRIBERS = registry.register(Gauge(
+    "order_feed_subscribers",
+    "Operator consoles currently subscribed to the placed orders feed.",
+))
+FEED_DROPPED = registry.register(Counter(
+    "order_feed_dropped_subscribers_total",
+    "Subscribers disconnected from the placed orders feed for falling behind.",
+))
+
+_CLOSED = object()
+
+
+class FeedMessage(NamedTuple):
+    id: int
+    data: bytes
+
+
+class SubscriptionClosed(Exception):
+    """
+    Raised by Subscription.get() once the subscription is closed and drained.
+    """
+
+
+class Subscription:
+    """
+    Bounded queue of messages published to a Broadcaster for a single subscriber.
+    """
+
+    def __init__(self, max_size: int):
+        self._queue: asyncio.Queue = asyncio.Queue(max_size)
+        self.closed = False
+
+    async def get(self, timeout: float) -> FeedMessage | None:
+        """
+        Wait for the next message.
+
+        Raises:
+            SubscriptionClosed if the subscription was closed and every queued message was read.
+
+        Returns:
+            Next FeedMessage, None if there was none in timeout seconds.
+        """
+        if self.closed and self._queue.empty():
+            raise SubscriptionClosed
+
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+        if message is _CLOSED:
+            raise SubscriptionClosed
+
+        return message
+
+    def push(self, message: FeedMessage) -> bool:
+        """
+        Queue given message without waiting.
+
+        Returns:
+            False if the queue is full, otherwise True.
+        """
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+
+        return True
+
+    def close(self) -> None:
+        """
+        Close the subscription. Messages already queued are still delivered.
+        """
+        self.closed = True
+        try:
+            self._queue.put_nowait(_CLOSED)
+        except asyncio.QueueFull:
+            pass
+
+
+class Broadcaster:
+    """
+    In-process fan-out of messages to a bounded number of subscribers.
+
+    Publishing never waits: every subscriber has a queue of queue_size messages
+    and a subscriber whose queue is full is closed instead of slowing down the
+    publisher or growing without bound. Closed subscribers are expected to
+    reconnect and catch up from the database.
+    """
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self._queue_size = queue_size
+        self._max_subscribers = max_subscribers
+        self._subscriptions: set[Subscription] = set()
+
+    def subscribe(self) -> Subscription | None:
+        """
+        Add a new subscriber.
+
+        Returns:
+            Subscription, None if there are already max_subscribers subscribers.
+        """
+        if len(self._subscriptions) >= self._max_subscribers:
+            return None
+
+        subscription = Subscription(self._queue_size)
+        self._subscriptions.add(subscription)
+        FEED_SUBSCRIBERS.set(len(self._subscriptions))
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove given subscriber.
+        """
+        self._subscriptions.discard(subscription)
+        FEED_SUBSCRIBERS.set(len(self._subscriptions))
+
+    def publish(self, message: FeedMessage) -> None:
+        """
+        Queue given message for every subscriber, closing the ones falling behind.
+        """
+        for subscription in list(self._subscriptions):
+            if not subscription.push(message):
+                self.unsubscribe(subscription)
+                subscription.close()
+                FEED_DROPPED.inc()
+
+    def close(self) -> None:
+        """
+        Close every subscription, used on application shutdown.
+        """
+        for subscription in list(self._subscriptions):
+            self.unsubscribe(subscription)
+            subscription.close()
+
+
+class FeedRelay:
+    """
+    Publishes messages read from the database to a Broadcaster, so subscribers of every
+    worker receive messages published through any of them.
+
+    Publishers only call notify() once their message is committed, which bumps the topic
+    of an InvalidationChannel shared by the workers. poll() is called periodically and,
+    when the version of the topic changed, reads every message after the last relayed one
+    with read_since. Message IDs have to increase in the order messages become visible to
+    read_since, so none is skipped and subscribers receive them in ID order.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            broadcaster: Broadcaster,
+            channel: InvalidationChannel,
+            topic: str,
+            *,
+            read_last_id: Callable[[], Awaitable[int]],
+            read_since: Callable[[int], Awaitable[list[FeedMessage]]],
+    ):
+        self._broadcaster = broadcaster
+        self._channel = channel
+        self._topic = topic
+        self._read_last_id = read_last_id
+        self._read_since = read_since
+        self._version = 0
+        self._last_id: int | None = None
+
+    def notify(self) -> None:
+        """
+        Signal relays of all workers that a new message can be read.
+        """
+        self._channel.publish(self._topic)
+
+    async def start(self) -> None:
+        """
+        Remember ID of the last message, only later ones are relayed. If it can not be
+        read, the first successful poll() reads it instead.
+        """
+        try:
+            await self._reset()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Last message of feed %s could not be read", self._topic)
+
+    async def poll(self) -> None:
+        """
+        Publish messages added since the last poll, if the topic was notified since then.
+        """
+        if self._last_id is None:
+            await self._reset()
+            return
+
+        version = self._channel.version(self._topic)
+        if version == self._version:
+            return
+
+        while messages := await self._read_since(self._last_id):
+            for message in messages:
+                self._broadcaster.publish(message)
+                self._last_id = message.id
+
+        self._version = version
+
+    async def _reset(self) -> None:
+        # Version is read first: a message added meanwhile is either counted
+        # in the last ID or bumps the version again.
+        version = self._channel.version(self._topic)
+        self._last_id = await self._read_last_id()
+        self._version = version
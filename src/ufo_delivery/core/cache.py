@@ -0,0 +1,266 @@
+import asyncio
+from time import monotonic
+from hashlib import blake2b
+from typing import Generic, NamedTuple, TypeVar
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from ufo_delivery.core.invalidation import InvalidationChannel
+from ufo_delivery.models.dto.items import ItemDTO, CategoryDTO
+
+CATALOG_TOPIC = "catalog"
+PRINCIPALS_TOPIC = "principals"
+
+CatalogLoader = Callable[[], Awaitable[tuple[list[ItemDTO], list[CategoryDTO]]]]
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _serialize_list(fragments: list[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+class CatalogPayload(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class CatalogSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    Immutable view of the whole catalog with every response body serialized upfront.
+
+    All bodies of a snapshot share one strong ETag derived from its content, so the
+    tag changes with every catalog version that actually changes the catalog and
+    stays the same across worker processes and restarts.
+    """
+
+    def __init__(self, version: int, items: list[ItemDTO], categories: list[CategoryDTO]):
+        self.version = version
+
+        self.items = {item.id: item for item in sorted(items, key=lambda item: item.id)}
+        self.categories = categories
+        self.items_by_category: dict[int, list[ItemDTO]] = {
+            category.id: [] for category in categories
+        }
+        for item in self.items.values():
+            for category in item.categories:
+                self.items_by_category.setdefault(category.id, []).append(item)
+
+        self._item_json = {
+            item_id: item.model_dump_json().encode() for item_id, item in self.items.items()
+        }
+        self._items_json: dict[int | None, bytes] = {
+            category_id: _serialize_list([self._item_json[item.id] for item in items])
+            for category_id, items in self.items_by_category.items()
+        }
+        self._items_json[None] = _serialize_list(list(self._item_json.values()))
+        self._categories_json = _serialize_list(
+            [category.model_dump_json().encode() for category in categories]
+        )
+
+        digest = blake2b(self._items_json[None], digest_size=16)
+        digest.update(self._categories_json)
+        self.etag = f'"{digest.hexdigest()}"'
+
+    def get_item_json(self, item_id: int) -> CatalogPayload | None:
+        """
+        Get serialized Item with given ID, None if there is no such Item.
+        """
+        item_json = self._item_json.get(item_id)
+        if item_json is None:
+            return None
+
+        return CatalogPayload(item_json, self.etag)
+
+    def get_items_json(self, category_id: int | None = None) -> CatalogPayload:
+        """
+        Get serialized list of all Items, or of Items in given Category if category_id is specified.
+        """
+        return CatalogPayload(self._items_json.get(category_id, b"[]"), self.etag)
+
+    def get_categories_json(self) -> CatalogPayload:
+        """
+        Get serialized list of all Categories.
+        """
+        return CatalogPayload(self._categories_json, self.etag)
+
+
+class CatalogCache:
+    """
+    Process-wide holder of the current CatalogSnapshot.
+
+    A snapshot is served while it is younger than ttl seconds and was built from
+    the current version of the catalog topic in the invalidation channel. Writers
+    call invalidate() after committing, which also bumps the version for every
+    other process sharing the channel. ttl of 0 disables caching.
+    """
+
+    def __init__(self, ttl: int, channel: InvalidationChannel):
+        self._ttl = ttl
+        self._channel = channel
+        self._snapshot: CatalogSnapshot | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def get(self) -> CatalogSnapshot | None:
+        """
+        Get current snapshot if it is still valid, otherwise None.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+
+        if monotonic() >= self._expires_at:
+            return None
+
+        if snapshot.version != self._channel.version(CATALOG_TOPIC):
+            return None
+
+        return snapshot
+
+    async def get_or_build(self, loader: CatalogLoader) -> CatalogSnapshot:
+        """
+        Get current snapshot, building a new one with given loader if it is missing or stale.
+        Concurrent callers wait for a single rebuild instead of each querying the database.
+        """
+        if self._ttl <= 0:
+            return await self._build(loader)
+
+        snapshot = self.get()
+        if snapshot:
+            return snapshot
+
+        async with self._lock:
+            snapshot = self.get()
+            if snapshot:
+                return snapshot
+
+            snapshot = await self._build(loader)
+            self._snapshot = snapshot
+            self._expires_at = monotonic() + self._ttl
+            return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop current snapshot in this process and notify other processes sharing the channel.
+        """
+        self._snapshot = None
+        self._channel.publish(CATALOG_TOPIC)
+
+    async def _build(self, loader: CatalogLoader) -> CatalogSnapshot:
+        # Version is read before loading: if a write is committed while the
+        # loader runs, the snapshot is stored under the outdated version and
+        # gets rebuilt on the next read.
+        version = self._channel.version(CATALOG_TOPIC)
+        items, categories = await loader()
+        return CatalogSnapshot(version, items, categories)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Mapping bounded by size with least recently used eviction and per-entry TTL.
+    Entries expire by given clock, monotonic() by default.
+    """
+
+    def __init__(self, ttl: float, max_size: int, clock: Callable[[], float] = monotonic):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get value stored under given key, None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store given value under given key, evicting the least recently used entry if full.
+        """
+        if self._ttl <= 0 or self._max_size <= 0:
+            return
+
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """
+        Remove entry stored under given key if there is one.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._entries.clear()
+
+
+class PrincipalCache:
+    """
+    Process-wide cache of token versions of Users keyed by User ID.
+
+    Access tokens carry the token version of their User, a token is valid while it
+    matches the current one. Entries remember the version of the principals topic
+    they were loaded under, so invalidate() called by any process sharing the
+    invalidation channel makes every cached token version stale. Changes revoking
+    issued tokens (password, rights) must bump the User's token version in the
+    database and call invalidate().
+    """
+
+    def __init__(self, ttl: float, max_size: int, channel: InvalidationChannel):
+        self._channel = channel
+        self._entries: LRUCache[int, tuple[int, int]] = LRUCache(ttl, max_size)
+
+    def version(self) -> int:
+        """
+        Get current version of the principals topic. Callers loading a token version
+        read it before querying the database and pass it to set().
+        """
+        return self._channel.version(PRINCIPALS_TOPIC)
+
+    def get(self, user_id: int) -> int | None:
+        """
+        Get cached token version of User with given ID, None if missing or stale.
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        version, token_version = entry
+        if version != self.version():
+            self._entries.pop(user_id)
+            return None
+
+        return token_version
+
+    def set(self, user_id: int, token_version: int, version: int) -> None:
+        """
+        Cache token version of User with given ID,
+        loaded under given version of the principals topic.
+        """
+        self._entries.set(user_id, (version, token_version))
+
+    def invalidate(self, *users_id: int) -> None:
+        """
+        Drop given Users in this process and mark all token versions cached
+        by other processes sharing the channel as stale.
+        """
+        for user_id in users_id:
+            self._entries.pop(user_id)
+
+        self._channel.publish(PRINCIPALS_TOPIC)
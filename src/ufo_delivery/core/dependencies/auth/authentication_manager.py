@@ -1,14 +1,16 @@
-from fastapi import Depends
-from passlib.context import CryptContext
-
+from ufo_delivery.core.hashing import HashingExecutor
 from ufo_delivery.core.security import AuthenticationManager
-from ufo_delivery.core.dependencies.auth.context import get_context
+from ufo_delivery.core.dependencies.auth.context import context
+from ufo_delivery.core.dependencies.auth.key_manager import key_manager
+from config.config import settings
+
+hashing_executor = HashingExecutor(settings.auth.hashing_workers, settings.auth.hashing_queue_size)
+authentication_manager = AuthenticationManager(context, hashing_executor, key_manager)
+
 
-def get_authentication_manager(
-        context: CryptContext = Depends(get_context)
-) -> AuthenticationManager:
+async def get_authentication_manager() -> AuthenticationManager:
     """
-    Constructs an AuthenticationManager instance with injected
-    passlib.CryptContext.
+    Returns the process-wide AuthenticationManager instance with
+    passlib.CryptContext, HashingExecutor and KeyManager.
     """
-    return AuthenticationManager(context)
+    return authentication_manager
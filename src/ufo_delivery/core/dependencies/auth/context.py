@@ -1,12 +1,32 @@
 from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
 
+from config.config import settings
 
-def get_context() -> CryptContext:
+# Hashes of every supported scheme are verified; those of another scheme or
+# cost than the configured one are deprecated and rehashed on login.
+SCHEMES = ("bcrypt", "pbkdf2_sha256")
+
+schemes = [settings.auth.hash_scheme]
+schemes.extend(scheme for scheme in SCHEMES if scheme != settings.auth.hash_scheme)
+
+# passlib compares hashes with the cost only if it is set, so the default is set explicitly.
+rounds = settings.auth.hash_rounds or get_crypt_handler(settings.auth.hash_scheme).default_rounds
+
+context = CryptContext(
+    schemes=schemes,
+    default=settings.auth.hash_scheme,
+    deprecated="auto",
+    **{f"{settings.auth.hash_scheme}__rounds": rounds},
+)
+
+
+async def get_context() -> CryptContext:
     """
-    Constructs a passlib.CryptContext object needed for most
+    Returns the process-wide passlib.CryptContext object needed for most
     password operations, such as hashing, verifying etc.
 
     Returns:
-        New passlib.CryptContext object
+        passlib.CryptContext object
     """
-    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return context
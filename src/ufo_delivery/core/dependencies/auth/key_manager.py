@@ -0,0 +1,19 @@
+from ufo_delivery.core.keys import KeyManager
+from config.config import settings
+
+key_manager = KeyManager(
+    algorithm=settings.auth.algorithm,
+    secret_key=settings.auth.secret_key,
+    private_key_file=settings.auth.private_key_file or None,
+    key_id=settings.auth.key_id or None,
+    jwks_file=settings.auth.jwks_file or None,
+    check_interval=settings.auth.jwks_check_interval,
+)
+
+
+async def get_key_manager() -> KeyManager:
+    """
+    Returns the process-wide KeyManager instance holding parsed
+    keys which sign and verify JWT Tokens.
+    """
+    return key_manager
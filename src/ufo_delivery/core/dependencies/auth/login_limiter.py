@@ -0,0 +1,56 @@
+from ufo_delivery.core.redis import RedisClient
+from ufo_delivery.core.rate_limit import (
+    RateLimiter,
+    InMemoryRateLimiter,
+    RedisRateLimiter,
+    LoginLimiter,
+)
+from config.config import settings
+
+
+def _build_limiter(
+        client: RedisClient | None,
+        name: str,
+        burst: int,
+        rate_per_minute: float,
+) -> RateLimiter | None:
+    if burst <= 0 or rate_per_minute <= 0:
+        return None
+
+    if client is not None:
+        return RedisRateLimiter(client, burst, rate_per_minute / 60, f"login-limit:{name}")
+
+    return InMemoryRateLimiter(burst, rate_per_minute / 60, settings.login_limit.max_keys)
+
+
+def _build_login_limiter() -> LoginLimiter:
+    # Both limits share connections when buckets are kept in Redis.
+    client = None
+    if settings.login_limit.backend == "redis":
+        client = RedisClient(settings.redis.url, settings.redis.pool_size)
+
+    return LoginLimiter(
+        _build_limiter(
+            client,
+            "phone",
+            settings.login_limit.phone_burst,
+            settings.login_limit.phone_rate,
+        ),
+        _build_limiter(
+            client,
+            "client",
+            settings.login_limit.client_burst,
+            settings.login_limit.client_rate,
+        ),
+    )
+
+
+login_limiter = _build_login_limiter()
+
+
+async def get_login_limiter() -> LoginLimiter:
+    """
+    Returns the process-wide LoginLimiter instance limiting
+    login attempts by phone number and client address.
+    """
+    return login_limiter
@@ -0,0 +1,35 @@
+from ufo_delivery.core.background import KeyedTasks
+from ufo_delivery.core.metrics import registry, Counter
+from ufo_delivery.core.dependencies.db import session_manager
+from ufo_delivery.core.dependencies.auth.authentication_manager import authentication_manager
+from ufo_delivery.repositories.db.users import UserRepository
+
+PASSWORD_REHASHES = registry.register(Counter(
+    "password_rehashes_total",
+    "Password hashes of an outdated scheme or cost replaced after a successful login.",
+))
+
+
+async def _rehash_password(user_id: int, password: str, hashed_password: str) -> None:
+    new_hashed_password = await authentication_manager.hash_password(password)
+    async with session_manager.session_factory() as session:
+        # Skipped if the password was changed while the new hash was computed.
+        if await UserRepository(session).replace_password(
+                user_id,
+                hashed_password,
+                new_hashed_password,
+        ):
+            PASSWORD_REHASHES.inc()
+        await session.commit()
+
+
+# Cancelled with the application, a rehash which did not finish is retried on the next login.
+password_rehashes = KeyedTasks("password-rehash", _rehash_password)
+
+
+async def get_password_rehashes() -> KeyedTasks:
+    """
+    Returns the process-wide KeyedTasks rehashing passwords
+    of Users by their ID after the response to login is sent.
+    """
+    return password_rehashes
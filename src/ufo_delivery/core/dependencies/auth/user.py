@@ -1,60 +1,60 @@
-from jwt import decode
 from jwt.exceptions import InvalidTokenError
+from pydantic import ValidationError
 
 from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from ufo_delivery.models.dto.users import UserDTO
+from ufo_delivery.models.dto.users import Principal
+from ufo_delivery.core.keys import KeyManager
+from ufo_delivery.core.dependencies.auth.key_manager import get_key_manager
 from ufo_delivery.core.dependencies.services.user_service import get_user_service
 from ufo_delivery.services.user_service import UserService
 from ufo_delivery.core.exceptions import InvalidCredentialsException, InsufficientRightsException
-from config.config import settings
 
 scheme_factory = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
         token: HTTPAuthorizationCredentials = Depends(scheme_factory),
-        user_service: UserService = Depends(get_user_service)
-) -> UserDTO:
+        user_service: UserService = Depends(get_user_service),
+        key_manager: KeyManager = Depends(get_key_manager),
+) -> Principal:
     """
-    Retrieves current user from the request's JWT Token.
-    InvalidCredentialsException will be raised if token is invalid, expired, or missing.
+    Retrieves current user from claims of the request's JWT Token. Only the token version
+    of the user is checked against the database, through a cache, to honour revocation.
+    InvalidCredentialsException will be raised if token is invalid, expired, revoked or missing.
 
     Returns:
-        UserDTO: DTO object with current authenticated user's data.
+        Principal: DTO object with ID and role of current authenticated user.
     """
+    if token is None:
+        raise InvalidCredentialsException
+
     try:
-        decoded_token = decode(
-            token.credentials,
-            key=settings.auth.secret_key,
-            algorithms=[settings.auth.algorithm]
-        )
-        phone = decoded_token.get("sub")
-        if not phone:
-            raise InvalidCredentialsException
-    except InvalidTokenError as exc:
+        decoded_token = key_manager.decode(token.credentials, options={"require": ["sub", "exp"]})
+        principal = Principal.model_validate(decoded_token)
+    except (InvalidTokenError, ValidationError) as exc:
         raise InvalidCredentialsException from exc
 
-    user = await user_service.get_by_phone(phone)
-    if not user:
+    if not await user_service.is_token_current(principal):
         raise InvalidCredentialsException
 
-    return user
+    return principal
 
 
 async def get_current_superuser(
-        user: UserDTO = Depends(get_current_user)
-) -> UserDTO:
+        user: Principal = Depends(get_current_user)
+) -> Principal:
     """
-    Retrieves current user from the request's JWT Token and ensures it has rights of superuser.
+    Retrieves current user from claims of the request's JWT Token
+    and ensures it has rights of superuser.
 
     Raises:
         InvalidCredentialsException will be raised if token is invalid, expired, or missing.
         InsufficientRightsException will be raised if user is not superuser.
 
     Returns:
-        UserDTO: DTO object with current authenticated user's data.
+        Principal: DTO object with ID and role of current authenticated user.
     """
     if not user.is_superuser:
         raise InsufficientRightsException
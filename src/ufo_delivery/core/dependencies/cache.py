@@ -0,0 +1,37 @@
+from ufo_delivery.core.cache import CatalogCache, PrincipalCache
+from ufo_delivery.core.invalidation import (
+    InvalidationChannel,
+    LocalInvalidationChannel,
+    FileInvalidationChannel,
+)
+from config.config import settings
+
+
+def _build_invalidation_channel() -> InvalidationChannel:
+    if settings.cache.invalidation_dir:
+        return FileInvalidationChannel(settings.cache.invalidation_dir)
+
+    return LocalInvalidationChannel()
+
+
+invalidation_channel = _build_invalidation_channel()
+catalog_cache = CatalogCache(settings.cache.catalog_ttl, invalidation_channel)
+principal_cache = PrincipalCache(
+    settings.cache.principal_ttl,
+    settings.cache.principal_max_size,
+    invalidation_channel,
+)
+
+
+async def get_catalog_cache() -> CatalogCache:
+    """
+    Returns the process-wide CatalogCache instance.
+    """
+    return catalog_cache
+
+
+async def get_principal_cache() -> PrincipalCache:
+    """
+    Returns the process-wide PrincipalCache instance.
+    """
+    return principal_cache
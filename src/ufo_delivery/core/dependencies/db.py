@@ -1,16 +1,124 @@
+from time import perf_counter
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
+from ufo_delivery.core.metrics import registry, Gauge, Histogram
+from ufo_delivery.core.query_stats import QueryInstrumentation
 from config.config import settings
 
-engine = create_async_engine(settings.database.url)
+POOL_CHECKOUT_WAIT = registry.register(Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the database pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+))
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool recording how long each checkout waits for a connection,
+    including time spent opening a new one.
+    """
+
+    def _do_get(self):
+        started_at = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.observe(perf_counter() - started_at)
+
+
+query_instrumentation = QueryInstrumentation(
+    settings.database.slow_query_threshold,
+    settings.database.repeated_query_threshold,
+)
+
+
+class SessionManager:
+    """
+    Owns the process-wide AsyncEngine and session factory. Both are created by start()
+    when the application starts and disposed of by stop() on shutdown.
+    """
+
+    def __init__(self):
+        self.engine: AsyncEngine | None = None
+        self.session_factory: async_sessionmaker[AsyncSession] | None = None
+
+    def start(self) -> None:
+        """
+        Create engine with connection pool configured by settings.
+        """
+        connect_args = {}
+        if settings.database.url.startswith("mysql"):
+            connect_args["connect_timeout"] = settings.database.connect_timeout
+
+        self.engine = create_async_engine(
+            settings.database.url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.database.pool_size,
+            max_overflow=settings.database.max_overflow,
+            pool_timeout=settings.database.pool_timeout,
+            pool_recycle=settings.database.pool_recycle,
+            pool_pre_ping=settings.database.pool_pre_ping,
+            connect_args=connect_args,
+        )
+        query_instrumentation.attach(self.engine.sync_engine)
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+
+    async def stop(self) -> None:
+        """
+        Close all pooled connections and drop the engine.
+        """
+        if self.engine is not None:
+            await self.engine.dispose()
+
+        self.engine = None
+        self.session_factory = None
+
+    def checked_out(self) -> int:
+        """
+        Amount of connections currently checked out from the pool.
+        """
+        if self.engine is None:
+            return 0
+
+        return self.engine.pool.checkedout()
+
+    def saturation(self) -> float:
+        """
+        Share of the pool capacity, overflow included, currently checked out.
+        """
+        capacity = settings.database.pool_size + settings.database.max_overflow
+        return self.checked_out() / capacity if capacity else 0.0
+
+
+session_manager = SessionManager()
+
+registry.register(Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out from the database pool.",
+    callback=session_manager.checked_out,
+))
+registry.register(Gauge(
+    "db_pool_saturation",
+    "Share of the database pool capacity, overflow included, currently in use.",
+    callback=session_manager.saturation,
+))
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
     """
     Yields a fresh SQLAlchemy AsynsSession.
     """
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with session_factory() as session:
+    async with session_manager.session_factory() as session:
         yield session
@@ -0,0 +1,54 @@
+from ufo_delivery.core.broadcast import Broadcaster, FeedMessage, FeedRelay
+from ufo_delivery.core.periodic import PeriodicTask
+from ufo_delivery.core.dependencies.db import session_manager
+from ufo_delivery.core.dependencies.cache import invalidation_channel
+from ufo_delivery.repositories.db.orders import OrderRepository
+from config.config import settings
+
+PLACED_ORDERS_TOPIC = "placed-orders"
+
+order_feed = Broadcaster(settings.operator.feed_queue_size, settings.operator.feed_max_subscribers)
+
+
+async def _read_last_placed_seq() -> int:
+    async with session_manager.session_factory() as session:
+        return await OrderRepository(session).get_last_placed_seq()
+
+
+async def _read_placed_since(after_seq: int) -> list[FeedMessage]:
+    async with session_manager.session_factory() as session:
+        orders = await OrderRepository(session).read_placed_since(
+            after_seq, settings.pagination.max_limit
+        )
+
+    return [FeedMessage(order.placed_seq, order.model_dump_json().encode()) for order in orders]
+
+
+# Orders are placed through any worker, every worker reads them from the database
+# and publishes them to its own subscribers.
+order_feed_relay = FeedRelay(
+    order_feed,
+    invalidation_channel,
+    PLACED_ORDERS_TOPIC,
+    read_last_id=_read_last_placed_seq,
+    read_since=_read_placed_since,
+)
+order_feed_poller = PeriodicTask(
+    "order-feed-poller",
+    settings.operator.feed_poll_interval,
+    order_feed_relay.poll,
+)
+
+
+async def get_order_feed() -> Broadcaster:
+    """
+    Returns the process-wide Broadcaster of placed Orders.
+    """
+    return order_feed
+
+
+async def get_order_feed_relay() -> FeedRelay:
+    """
+    Returns the process-wide FeedRelay publishing placed Orders to the Broadcaster.
+    """
+    return order_feed_relay
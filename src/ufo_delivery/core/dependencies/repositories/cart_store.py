@@ -0,0 +1,38 @@
+from fastapi import Depends
+
+from ufo_delivery.core.redis import RedisClient
+from ufo_delivery.repositories.db.orders import OrderRepository
+from ufo_delivery.repositories.carts.base import CartStore
+from ufo_delivery.repositories.carts.memory import InMemoryCartStore
+from ufo_delivery.repositories.carts.redis import RedisCartStore
+from ufo_delivery.repositories.carts.sql import SQLCartStore
+from ufo_delivery.core.dependencies.repositories.order_repository import get_order_repository
+from config.config import settings
+
+
+def _build_cart_store() -> CartStore | None:
+    if settings.cart.backend == "memory":
+        return InMemoryCartStore()
+
+    if settings.cart.backend == "redis":
+        client = RedisClient(settings.redis.url, settings.redis.pool_size)
+        return RedisCartStore(client, settings.cart.ttl)
+
+    return None
+
+
+# Process-wide store, None when carts are kept in the database.
+cart_store = _build_cart_store()
+
+
+async def get_cart_store(
+        order_repository: OrderRepository = Depends(get_order_repository),
+) -> CartStore:
+    """
+    Returns the process-wide CartStore, or constructs an SQLCartStore with
+    injected OrderRepository if carts are kept in the database.
+    """
+    if cart_store is None:
+        return SQLCartStore(order_repository)
+
+    return cart_store
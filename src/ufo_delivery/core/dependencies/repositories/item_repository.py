@@ -5,7 +5,7 @@ from ufo_delivery.core.dependencies.db import get_session
 from ufo_delivery.repositories.db.items import ItemRepository
 
 
-def get_item_repository(
+async def get_item_repository(
         session: AsyncSession = Depends(get_session)
 ) -> ItemRepository:
     """
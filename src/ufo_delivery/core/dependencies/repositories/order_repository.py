@@ -5,7 +5,7 @@ from ufo_delivery.core.dependencies.db import get_session
 from ufo_delivery.repositories.db.orders import OrderRepository
 
 
-def get_order_repository(
+async def get_order_repository(
         session: AsyncSession = Depends(get_session),
 ) -> OrderRepository:
     """
@@ -0,0 +1,32 @@
+from time import time
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ufo_delivery.core.dependencies.db import get_session, session_manager
+from ufo_delivery.core.periodic import PeriodicTask
+from ufo_delivery.repositories.db.refresh_tokens import RefreshTokenRepository
+from config.config import settings
+
+
+async def _delete_expired_refresh_tokens() -> None:
+    async with session_manager.session_factory() as session:
+        await RefreshTokenRepository(session).delete_expired(int(time()))
+        await session.commit()
+
+
+# Started and stopped with the application, every worker sweeps on its own.
+refresh_token_sweeper = PeriodicTask(
+    "refresh-token-sweeper",
+    settings.auth.refresh_token_sweep_interval,
+    _delete_expired_refresh_tokens,
+)
+
+
+async def get_refresh_token_repository(
+        session: AsyncSession = Depends(get_session),
+) -> RefreshTokenRepository:
+    """
+    Constructs a RefreshTokenRepository instance with injected AsyncSession.
+    """
+    return RefreshTokenRepository(session)
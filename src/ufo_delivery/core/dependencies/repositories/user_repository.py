@@ -5,7 +5,7 @@ from ufo_delivery.core.dependencies.db import get_session
 from ufo_delivery.repositories.db.users import UserRepository
 
 
-def get_user_repository(
+async def get_user_repository(
         session: AsyncSession = Depends(get_session)
 ) -> UserRepository:
     """
@@ -2,16 +2,37 @@ from fastapi import Depends
 
 from ufo_delivery.services.auth_service import AuthService
 from ufo_delivery.repositories.db.users import UserRepository
+from ufo_delivery.repositories.db.refresh_tokens import RefreshTokenRepository
 from ufo_delivery.core.security import AuthenticationManager
+from ufo_delivery.core.background import KeyedTasks
+from ufo_delivery.core.rate_limit import LoginLimiter
 from ufo_delivery.core.dependencies.auth.authentication_manager import get_authentication_manager
+from ufo_delivery.core.dependencies.auth.password_rehash import get_password_rehashes
+from ufo_delivery.core.dependencies.auth.login_limiter import get_login_limiter
 from ufo_delivery.core.dependencies.repositories.user_repository import get_user_repository
+from ufo_delivery.core.dependencies.repositories.refresh_token_repository import (
+    get_refresh_token_repository,
+)
+from config.config import settings
 
 
-def get_auth_service(
+async def get_auth_service(
         user_repository: UserRepository = Depends(get_user_repository),
-        authentication_manager: AuthenticationManager = Depends(get_authentication_manager)
+        refresh_token_repository: RefreshTokenRepository = Depends(get_refresh_token_repository),
+        authentication_manager: AuthenticationManager = Depends(get_authentication_manager),
+        password_rehashes: KeyedTasks = Depends(get_password_rehashes),
+        login_limiter: LoginLimiter = Depends(get_login_limiter),
 ) -> AuthService:
     """
-    Constructs an AuthService instance with injected UserRepository and AuthenticationManager.
+    Constructs an AuthService instance with injected UserRepository,
+    RefreshTokenRepository, AuthenticationManager, password rehashing tasks
+    and LoginLimiter.
     """
-    return AuthService(user_repository, authentication_manager)
+    return AuthService(
+        user_repository,
+        refresh_token_repository,
+        authentication_manager,
+        password_rehashes,
+        login_limiter,
+        settings.auth.refresh_token_ttl * 24 * 60 * 60,
+    )
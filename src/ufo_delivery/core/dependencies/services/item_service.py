@@ -1,14 +1,17 @@
 from fastapi import Depends
 
+from ufo_delivery.core.cache import CatalogCache
 from ufo_delivery.repositories.db.items import ItemRepository
 from ufo_delivery.services.item_service import ItemService
+from ufo_delivery.core.dependencies.cache import get_catalog_cache
 from ufo_delivery.core.dependencies.repositories.item_repository import get_item_repository
 
 
-def get_item_service(
-        repository: ItemRepository = Depends(get_item_repository)
+async def get_item_service(
+        repository: ItemRepository = Depends(get_item_repository),
+        catalog_cache: CatalogCache = Depends(get_catalog_cache),
 ) -> ItemService:
     """
-    Constructs an ItemService instance with injected ItemRepository.
+    Constructs an ItemService instance with injected ItemRepository and CatalogCache.
     """
-    return ItemService(repository)
+    return ItemService(repository, catalog_cache)
@@ -1,17 +1,24 @@
 from fastapi import Depends
 
 from ufo_delivery.core.dependencies.repositories.order_repository import get_order_repository
-from ufo_delivery.core.dependencies.repositories.item_repository import get_item_repository
+from ufo_delivery.core.dependencies.repositories.cart_store import get_cart_store
+from ufo_delivery.core.dependencies.services.item_service import get_item_service
+from ufo_delivery.core.dependencies.order_feed import get_order_feed_relay
+from ufo_delivery.core.broadcast import FeedRelay
 from ufo_delivery.repositories.db.orders import OrderRepository
-from ufo_delivery.repositories.db.items import ItemRepository
+from ufo_delivery.repositories.carts.base import CartStore
+from ufo_delivery.services.item_service import ItemService
 from ufo_delivery.services.order_service import OrderService
 
 
-def get_order_service(
+async def get_order_service(
         repository: OrderRepository = Depends(get_order_repository),
-        item_repository: ItemRepository = Depends(get_item_repository),
+        item_service: ItemService = Depends(get_item_service),
+        cart_store: CartStore = Depends(get_cart_store),
+        order_feed: FeedRelay = Depends(get_order_feed_relay),
 ) -> OrderService:
     """
-    Constructs an OrderService instance with injected OrderRepository and ItemRepository.
+    Constructs an OrderService instance with injected OrderRepository,
+    ItemService, CartStore and FeedRelay of placed Orders.
     """
-    return OrderService(repository, item_repository)
+    return OrderService(repository, item_service, cart_store, order_feed)
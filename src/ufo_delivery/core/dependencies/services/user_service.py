@@ -4,14 +4,18 @@ from ufo_delivery.repositories.db.users import UserRepository
 from ufo_delivery.services.user_service import UserService
 from ufo_delivery.core.dependencies.repositories.user_repository import get_user_repository
 from ufo_delivery.core.dependencies.auth.authentication_manager import get_authentication_manager
+from ufo_delivery.core.dependencies.cache import get_principal_cache
 from ufo_delivery.core.security import AuthenticationManager
+from ufo_delivery.core.cache import PrincipalCache
 
 
-def get_user_service(
+async def get_user_service(
         repository: UserRepository = Depends(get_user_repository),
         authentication_manager: AuthenticationManager = Depends(get_authentication_manager),
+        principal_cache: PrincipalCache = Depends(get_principal_cache),
 ) -> UserService:
     """
-    Constructs a UserService instance with injected UserRepository and AuthenticationManager.
+    Constructs a UserService instance with injected UserRepository,
+    AuthenticationManager and PrincipalCache.
     """
-    return UserService(repository, authentication_manager)
+    return UserService(repository, authentication_manager, principal_cache)
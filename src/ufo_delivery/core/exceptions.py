@@ -30,6 +30,11 @@ class ItemNotFound(HTTPException):
         super().__init__(404, "Item not found")
 
 
+class UnknownItemField(HTTPException):
+    def __init__(self, field: str):
+        super().__init__(400, f"Unknown Item field: {field}")
+
+
 class OrderNotFound(HTTPException):
     def __init__(self):
         super().__init__(404, "Orden not found")
@@ -43,3 +48,27 @@ class ItemNotInOrder(HTTPException):
 class OrderIsEmpty(HTTPException):
     def __init__(self):
         super().__init__(400, "Order is empty")
+
+
+class NoOrdersToClaim(HTTPException):
+    def __init__(self):
+        super().__init__(404, "No placed Orders to claim")
+
+
+class InvalidOrderStatusChange(HTTPException):
+    def __init__(self, current: str, new: str):
+        super().__init__(409, f"Order status can not be changed from {current} to {new}")
+
+
+class OrderClaimedByAnotherOperator(HTTPException):
+    def __init__(self):
+        super().__init__(409, "Order is claimed by another operator")
+
+
+class TooManyRequestsException(HTTPException):
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            429,
+            "Too many requests, try again later",
+            headers={"Retry-After": str(retry_after)}
+        )
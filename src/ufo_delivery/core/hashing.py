@@ -0,0 +1,76 @@
+import asyncio
+from threading import Lock
+from typing import TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable
+
+from ufo_delivery.core.exceptions import TooManyRequestsException
+from ufo_delivery.core.metrics import registry, Counter, Gauge
+
+T = TypeVar("T")
+
+
+class HashingExecutor:
+    """
+    Bounded thread pool running CPU-heavy password hashing outside the event loop.
+    bcrypt releases the GIL, so hashes are computed in parallel with request handling.
+
+    At most max_queue calls wait for a free worker; further calls are rejected
+    with TooManyRequestsException instead of piling up behind the pool.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hashing")
+        self._capacity = workers + max_queue
+        self._pending = 0
+        # Calls are counted on the event loop and uncounted by worker threads.
+        self._lock = Lock()
+
+        self._rejected = registry.register(Counter(
+            "password_hashing_rejected_total",
+            "Password hashing calls rejected because the hashing queue was full.",
+        ))
+        registry.register(Gauge(
+            "password_hashing_pending",
+            "Password hashing calls running or waiting for a hashing worker.",
+            callback=lambda: self.pending,
+        ))
+
+    @property
+    def pending(self) -> int:
+        """
+        Amount of calls running or waiting for a worker.
+        """
+        return self._pending
+
+    async def run(self, function: Callable[..., T], *args) -> T:
+        """
+        Run given function with given arguments in the pool and wait for the result.
+        TooManyRequestsException will be raised if the queue is full.
+        A call whose caller is cancelled stays pending until it finishes, unless it
+        has not started yet, in which case it is cancelled as well.
+        """
+        with self._lock:
+            if self._pending >= self._capacity:
+                self._rejected.inc()
+                raise TooManyRequestsException
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._release(None)
+            raise
+
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future | None) -> None:  # pylint: disable=unused-argument
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """
+        Stop worker threads, cancelling calls which have not started yet.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,90 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ufo_delivery.core.metrics import registry, Counter, Gauge, Histogram
+
+SIZE_BUCKETS = (0, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+REQUESTS = registry.register(Counter(
+    "http_requests_total",
+    "HTTP requests handled, by response status code.",
+    labels=("method", "route", "status"),
+))
+DURATION = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving an HTTP request until its response is fully sent.",
+    labels=("method", "route"),
+))
+REQUEST_SIZE = registry.register(Histogram(
+    "http_request_size_bytes",
+    "Size of HTTP request bodies.",
+    labels=("method", "route"),
+    buckets=SIZE_BUCKETS,
+))
+RESPONSE_SIZE = registry.register(Histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies.",
+    labels=("method", "route"),
+    buckets=SIZE_BUCKETS,
+))
+IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+))
+
+
+def route_labels(scope: Scope) -> tuple[str, str]:
+    """
+    Method and route template of given request. Requests not matching any route share
+    a single label, so paths sent by clients never become metric labels.
+    """
+    route = scope.get("route")
+    return scope["method"], getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status code and body sizes of every HTTP request,
+    labeled by route template. Responses not started because of an unhandled exception
+    are counted as 500.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = perf_counter()
+        status = 500
+        request_size = 0
+        response_size = 0
+
+        async def counting_receive() -> Message:
+            nonlocal request_size
+            message = await receive()
+            request_size += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal status, response_size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+
+            await send(message)
+
+        IN_FLIGHT.inc()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            IN_FLIGHT.dec()
+            labels = route_labels(scope)
+            DURATION.observe(perf_counter() - started_at, *labels)
+            REQUESTS.inc(*labels, str(status))
+            REQUEST_SIZE.observe(request_size, *labels)
+            RESPONSE_SIZE.observe(response_size, *labels)
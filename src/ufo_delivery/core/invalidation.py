@@ -0,0 +1,80 @@
+import os
+import fcntl
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class InvalidationChannel(ABC):
+    """
+    Versioned invalidation signal shared between everything that caches data
+    of the same topic. Publishing bumps the topic's version; caches compare the
+    version they were built from with the current one before serving.
+    """
+
+    @abstractmethod
+    def publish(self, topic: str) -> int:
+        """
+        Bump version of given topic.
+
+        Returns:
+            New version of the topic.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def version(self, topic: str) -> int:
+        """
+        Get current version of given topic. Topics never published are at version 0.
+        """
+        raise NotImplementedError
+
+
+class LocalInvalidationChannel(InvalidationChannel):
+    """
+    Channel visible to the current process only.
+    """
+
+    def __init__(self):
+        self._versions: dict[str, int] = {}
+
+    def publish(self, topic: str) -> int:
+        version = self._versions.get(topic, 0) + 1
+        self._versions[topic] = version
+        return version
+
+    def version(self, topic: str) -> int:
+        return self._versions.get(topic, 0)
+
+
+class FileInvalidationChannel(InvalidationChannel):
+    """
+    Channel shared by all processes on the host through version files stored in
+    the given directory. Versions are written atomically, so readers never see a
+    partially written file, and increments are serialized with an exclusive lock.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def publish(self, topic: str) -> int:
+        path = self._directory / f"{topic}.version"
+        with open(self._directory / f"{topic}.lock", "wb") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            version = self._read(path) + 1
+
+            temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temporary_path.write_text(str(version))
+            os.replace(temporary_path, path)
+
+        return version
+
+    def version(self, topic: str) -> int:
+        return self._read(self._directory / f"{topic}.version")
+
+    @staticmethod
+    def _read(path: Path) -> int:
+        try:
+            return int(path.read_text() or 0)
+        except FileNotFoundError:
+            return 0
@@ -0,0 +1,169 @@
+import json
+import logging
+from os import stat
+from time import monotonic
+from pathlib import Path
+from typing import Any
+
+from jwt import PyJWK, PyJWKSet, encode, decode
+from jwt.utils import base64url_decode
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import DecodeError, InvalidTokenError, PyJWTError
+
+logger = logging.getLogger(__name__)
+
+# Tokens signed by the same key share their header segment, so keys are looked up by it
+# without decoding the header of every token. Headers are chosen by clients, the cache
+# is cleared once it holds this many of them.
+HEADER_CACHE_SIZE = 64
+
+
+class KeyManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Signs and verifies JWT Tokens with keys parsed once and kept in memory.
+
+    Tokens are signed with JWT_SECRET_KEY for HS* algorithms or with the PEM private key
+    of JWT_PRIVATE_KEY_FILE for asymmetric ones, and carry the key ID in their `kid` header.
+    Verification keys are taken from the local JWKS file if it is set, otherwise from the
+    signing key, so nodes holding only the JWKS file can verify tokens without being able
+    to issue them. Every verification key is bound to its own algorithm, which prevents
+    tokens signed with one algorithm from being checked with a key of another.
+
+    The JWKS file is checked for changes at most every check_interval seconds. Keys are
+    rotated by adding the new public key to the file, switching issuing nodes to the new
+    private key and removing the old public key once tokens signed with it have expired.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            algorithm: str,
+            secret_key: str,
+            *,
+            private_key_file: str | None = None,
+            key_id: str | None = None,
+            jwks_file: str | None = None,
+            check_interval: float = 30,
+    ):
+        algorithms = get_default_algorithms()
+        if algorithm not in algorithms or algorithm == "none":
+            raise ValueError(f"Unsupported JWT algorithm {algorithm}")
+
+        self._algorithm = algorithm
+        self._key_id = key_id
+        self._signing_key = None
+        if private_key_file:
+            private_key = Path(private_key_file).read_bytes()
+            self._signing_key = algorithms[algorithm].prepare_key(private_key)
+        elif algorithm.startswith("HS"):
+            self._signing_key = secret_key.encode()
+
+        self._jwks_file = jwks_file
+        self._check_interval = check_interval
+        self._next_check = monotonic() + check_interval
+        self._jwks_mtime: int | None = None
+        self._keys: dict[str | None, PyJWK] = {}
+        self._header_keys: dict[str, PyJWK] = {}
+
+        if jwks_file:
+            self._load_jwks()
+        elif self._signing_key is not None:
+            self._keys = {key_id: self._own_key(algorithms[algorithm])}
+        else:
+            raise ValueError(f"JWT_PRIVATE_KEY_FILE or JWT_JWKS_FILE has to be set for {algorithm}")
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """
+        Signs given claims with the signing key.
+        Args:
+            claims: Claims of the token.
+
+        Returns:
+            JWT Token with the ID of the signing key in its header.
+        """
+        if self._signing_key is None:
+            raise RuntimeError("JWT_PRIVATE_KEY_FILE is not set, this node can not issue tokens")
+
+        headers = {"kid": self._key_id} if self._key_id else None
+        return encode(claims, self._signing_key, algorithm=self._algorithm, headers=headers)
+
+    def decode(self, token: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Verifies given token with the key named by its `kid` header. Tokens without
+        `kid` are verified with the key without ID, or with the only key if there is one.
+        InvalidTokenError will be raised if the token is malformed, its key is unknown,
+        its signature is invalid or its claims are not valid.
+        Args:
+            token: JWT Token.
+            options: Options of jwt.decode().
+
+        Returns:
+            Claims of the token.
+        """
+        if self._jwks_file and monotonic() >= self._next_check:
+            self._reload_jwks()
+
+        header_segment = token.partition(".")[0]
+        key = self._header_keys.get(header_segment)
+        if key is None:
+            key = self._get_key(header_segment)
+            if len(self._header_keys) >= HEADER_CACHE_SIZE:
+                self._header_keys.clear()
+            self._header_keys[header_segment] = key
+
+        return decode(token, key, algorithms=[key.algorithm_name], options=options)
+
+    def _get_key(self, header_segment: str) -> PyJWK:
+        try:
+            header = json.loads(base64url_decode(header_segment))
+        except ValueError as exc:
+            raise DecodeError("Invalid header") from exc
+        if not isinstance(header, dict) or not isinstance(header.get("kid", ""), str):
+            raise DecodeError("Invalid header")
+
+        key_id = header.get("kid")
+        key = self._keys.get(key_id)
+        if key is None and key_id is None and len(self._keys) == 1:
+            key = next(iter(self._keys.values()))
+        if key is None:
+            raise InvalidTokenError(f"Unknown signing key {key_id!r}")
+
+        return key
+
+    def _own_key(self, algorithm) -> PyJWK:
+        public_key = self._signing_key
+        if not isinstance(public_key, bytes):
+            public_key = public_key.public_key()
+
+        jwk = algorithm.to_jwk(public_key, as_dict=True)
+        jwk["alg"] = self._algorithm
+        return PyJWK(jwk)
+
+    def _reload_jwks(self) -> None:
+        self._next_check = monotonic() + self._check_interval
+        try:
+            if stat(self._jwks_file).st_mtime_ns == self._jwks_mtime:
+                return
+            self._load_jwks()
+        except (OSError, ValueError, PyJWTError):
+            logger.exception("Failed to reload JWKS file %s, keeping old keys", self._jwks_file)
+
+    def _load_jwks(self) -> None:
+        mtime = stat(self._jwks_file).st_mtime_ns
+        with open(self._jwks_file, "rb") as file:
+            jwks = PyJWKSet.from_dict(json.load(file))
+
+        keys = {}
+        for key in jwks.keys:
+            if key.algorithm_name == "none":
+                continue
+            if key.public_key_use not in (None, "sig"):
+                continue
+            keys[key.key_id] = key
+
+        if not keys:
+            raise ValueError(f"JWKS file {self._jwks_file} has no signing keys")
+
+        self._keys = keys
+        self._header_keys = {}
+        self._jwks_mtime = mtime
+        logger.info("Loaded %d verification keys from %s", len(keys), self._jwks_file)
@@ -0,0 +1,47 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Background task calling given coroutine function every interval seconds until stopped.
+    Failures are logged and do not stop the task. interval of 0 disables the task.
+    """
+
+    def __init__(self, name: str, interval: float, function: Callable[[], Awaitable[None]]):
+        self._name = name
+        self._interval = interval
+        self._function = function
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """
+        Start calling the function in the running event loop.
+        """
+        if self._interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        """
+        Cancel the task and wait for it to finish.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self._function()
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Periodic task %s failed", self._name)
@@ -0,0 +1,214 @@
+import re
+import logging
+from time import perf_counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ufo_delivery.core.metrics import registry, Counter, Histogram
+from ufo_delivery.core.http_metrics import route_labels
+
+logger = logging.getLogger(__name__)
+
+STATEMENTS = registry.register(Histogram(
+    "db_statements_per_request",
+    "SQL statements executed while handling a request.",
+    labels=("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+))
+DURATION = registry.register(Histogram(
+    "db_duration_per_request_seconds",
+    "Time spent executing SQL statements while handling a request.",
+    labels=("method", "route"),
+))
+ROWS = registry.register(Histogram(
+    "db_rows_fetched_per_request",
+    "Rows fetched from the database while handling a request.",
+    labels=("method", "route"),
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000),
+))
+SLOW_STATEMENTS = registry.register(Counter(
+    "db_slow_statements_total",
+    "SQL statements slower than the slow query threshold.",
+    labels=("method", "route"),
+))
+REPEATED_STATEMENTS = registry.register(Counter(
+    "db_repeated_statements_total",
+    "Statements executed repeatedly while handling a single request, usually N+1 queries.",
+    labels=("method", "route"),
+))
+
+MAX_LOGGED_STATEMENT_LENGTH = 1000
+
+
+class QueryStats:
+    """
+    SQL statements executed while handling a single HTTP request.
+    """
+
+    def __init__(self, scope: Scope):
+        self._scope = scope
+        self.statements = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.repeated = 0
+        self._executions: dict[str, int] = {}
+
+    @property
+    def labels(self) -> tuple[str, str]:
+        """
+        Method and route template of the request.
+        """
+        return route_labels(self._scope)
+
+    def record(self, statement: str, duration: float) -> int:
+        """
+        Record execution of given statement.
+
+        Returns:
+            Times given statement was executed within the request.
+        """
+        self.statements += 1
+        self.duration += duration
+
+        executions = self._executions.get(statement, 0) + 1
+        self._executions[statement] = executions
+        return executions
+
+    def observe(self) -> None:
+        """
+        Record statistics of the finished request in metrics.
+        """
+        STATEMENTS.observe(self.statements, *self.labels)
+        DURATION.observe(self.duration, *self.labels)
+        ROWS.observe(self.rows, *self.labels)
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats",
+    default=None,
+)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _count_fetched_rows(orm_execute_state: ORMExecuteState) -> Result | None:
+    # Rows of SELECT statements executed through sessions are fetched here and
+    # counted, then handed to the caller as a result of their own. Results of
+    # async sessions are buffered anyway, so this does not fetch them earlier.
+    stats = current_query_stats.get()
+    if stats is None or not orm_execute_state.is_select:
+        return None
+
+    frozen = orm_execute_state.invoke_statement().freeze()
+    stats.rows += len(frozen.data)
+    return frozen()
+
+
+def _shorten(statement: str) -> str:
+    statement = re.sub(r"\s+", " ", statement).strip()
+    if len(statement) > MAX_LOGGED_STATEMENT_LENGTH:
+        return statement[:MAX_LOGGED_STATEMENT_LENGTH] + "..."
+
+    return statement
+
+
+class QueryInstrumentation:
+    """
+    Engine event listeners adding every executed statement to QueryStats of the current request.
+
+    Statements running longer than slow_threshold milliseconds are logged together with the
+    route that issued them. A statement executed repeated_threshold times within one request
+    is logged once as likely N+1 queries: the same SQL with different parameters in a loop.
+    Thresholds of 0 disable the corresponding log.
+    """
+
+    def __init__(self, slow_threshold: int, repeated_threshold: int):
+        self.slow_threshold = slow_threshold / 1000
+        self.repeated_threshold = repeated_threshold
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Listen to statements executed by given engine.
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        context.started_at = perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # pylint: disable=unused-argument,too-many-arguments,too-many-positional-arguments
+        duration = perf_counter() - context.started_at
+        stats = current_query_stats.get()
+        if stats is None:
+            if self.slow_threshold and duration >= self.slow_threshold:
+                logger.warning(
+                    "Slow query took %.1f ms outside of a request: %s",
+                    duration * 1000,
+                    _shorten(statement),
+                )
+            return
+
+        executions = stats.record(statement, duration)
+        labels = stats.labels
+
+        if self.slow_threshold and duration >= self.slow_threshold:
+            SLOW_STATEMENTS.inc(*labels)
+            logger.warning(
+                "Slow query took %.1f ms in %s %s: %s",
+                duration * 1000,
+                *labels,
+                _shorten(statement),
+            )
+
+        if self.repeated_threshold and executions == self.repeated_threshold:
+            stats.repeated += 1
+            REPEATED_STATEMENTS.inc(*labels)
+            logger.warning(
+                "Statement executed %d times in %s %s, possible N+1 queries: %s",
+                executions,
+                *labels,
+                _shorten(statement),
+            )
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware collecting QueryStats of every HTTP request and recording them in metrics.
+    With debug_headers, statistics are also sent in X-DB-* response headers. Statements
+    executed after response headers are sent, e.g. by streaming responses, are only in metrics.
+    """
+
+    def __init__(self, app: ASGIApp, debug_headers: bool = False):
+        self.app = app
+        self.debug_headers = debug_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Statements"] = str(stats.statements)
+                headers["X-DB-Duration"] = f"{stats.duration * 1000:.2f}"
+                headers["X-DB-Rows"] = str(stats.rows)
+                headers["X-DB-Repeated-Statements"] = str(stats.repeated)
+
+            await send(message)
+
+        token = current_query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_with_headers if self.debug_headers else send)
+        finally:
+            current_query_stats.reset(token)
+            stats.observe()
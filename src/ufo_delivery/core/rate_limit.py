@@ -0,0 +1,175 @@
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from hashlib import blake2b
+from math import ceil
+from time import monotonic
+
+from ufo_delivery.core.cache import LRUCache
+from ufo_delivery.core.exceptions import TooManyRequestsException
+from ufo_delivery.core.metrics import registry, Counter
+from ufo_delivery.core.redis import RedisClient, RedisError, RedisUnavailable
+
+logger = logging.getLogger(__name__)
+
+LOGIN_RATE_LIMITED = registry.register(Counter(
+    "login_rate_limited_total",
+    "Login attempts rejected before verifying credentials, by the exhausted limit.",
+    labels=("limit",),
+))
+
+
+class RateLimiter(ABC):
+    """
+    Token bucket per key: up to burst attempts at once, refilled by rate attempts per second.
+    """
+
+    def __init__(self, burst: int, rate: float):
+        self.burst = burst
+        self.rate = rate
+
+    @property
+    def refill_time(self) -> float:
+        """
+        Seconds an empty bucket takes to refill, after which it is the same as a missing one.
+        """
+        return self.burst / self.rate
+
+    @abstractmethod
+    async def acquire(self, key: bytes) -> float:
+        """
+        Take an attempt from the bucket of given key.
+
+        Returns:
+            0 if the attempt is allowed, otherwise seconds until the next one is.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release resources held by the limiter.
+        """
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """
+    Rate limiter keeping buckets in the worker process. Buckets idle for refill_time are
+    full again and expire; at most max_keys buckets are kept, least recently used first
+    evicted. Every worker counts attempts on its own. Time is read from given clock,
+    monotonic() by default.
+    """
+
+    def __init__(
+            self,
+            burst: int,
+            rate: float,
+            max_keys: int,
+            clock: Callable[[], float] = monotonic,
+    ):
+        super().__init__(burst, rate)
+        self._clock = clock
+        self._buckets: LRUCache[bytes, tuple[float, float]] = LRUCache(
+            self.refill_time, max_keys, clock
+        )
+
+    async def acquire(self, key: bytes) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        tokens = self.burst
+        if bucket is not None:
+            tokens, updated_at = bucket
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+        if tokens < 1:
+            return (1 - tokens) / self.rate
+
+        self._buckets.set(key, (tokens - 1, now))
+        return 0
+
+
+# KEYS[1] - bucket, ARGV[1] - burst, ARGV[2] - rate per second.
+# Time of the server is used, so buckets do not depend on clocks of workers.
+_ACQUIRE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local tokens = burst
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+if bucket[1] then
+    tokens = math.min(burst, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+end
+if tokens < 1 then
+    return tostring((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return '0'
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Rate limiter keeping buckets in a server speaking the Redis protocol, shared by
+    all workers. Buckets expire once they are full again. If the server is unavailable,
+    attempts are allowed rather than failing every login.
+    """
+
+    def __init__(self, client: RedisClient, burst: int, rate: float, prefix: str):
+        super().__init__(burst, rate)
+        self._client = client
+        self._prefix = prefix.encode()
+
+    async def acquire(self, key: bytes) -> float:
+        try:
+            reply = await self._client.execute(
+                "EVAL", _ACQUIRE_SCRIPT, 1, self._prefix + b":" + key, self.burst, self.rate
+            )
+        except (RedisUnavailable, RedisError):
+            logger.warning("Rate limiter %s is unavailable, attempt allowed", self._prefix.decode())
+            return 0
+
+        return float(reply)
+
+    async def close(self) -> None:
+        await self._client.close()
+
+
+class LoginLimiter:
+    """
+    Limits login attempts by phone number and by client address, so guessing passwords
+    is throttled both for one account and from one client. Checked before the User is
+    loaded and the password verified, rejected attempts cost neither a query nor a hash.
+    Keys are digests of fixed size, so memory does not depend on what clients send
+    and phone numbers are not stored.
+    """
+
+    def __init__(self, phone_limiter: RateLimiter | None, client_limiter: RateLimiter | None):
+        self._phone_limiter = phone_limiter
+        self._client_limiter = client_limiter
+
+    async def check(self, phone: str, client_host: str | None) -> None:
+        """
+        Take an attempt for given phone number and client address.
+        TooManyRequestsException will be raised if either limit is exhausted.
+        """
+        if self._client_limiter is not None and client_host is not None:
+            await self._acquire(self._client_limiter, "client", client_host)
+
+        if self._phone_limiter is not None:
+            await self._acquire(self._phone_limiter, "phone", phone)
+
+    async def close(self) -> None:
+        """
+        Release resources held by the limiters.
+        """
+        for limiter in (self._phone_limiter, self._client_limiter):
+            if limiter is not None:
+                await limiter.close()
+
+    @staticmethod
+    async def _acquire(limiter: RateLimiter, name: str, value: str) -> None:
+        retry_after = await limiter.acquire(blake2b(value.encode(), digest_size=16).digest())
+        if retry_after > 0:
+            LOGIN_RATE_LIMITED.inc(name)
+            raise TooManyRequestsException(ceil(retry_after))
@@ -0,0 +1,141 @@
+import asyncio
+from urllib.parse import urlsplit
+
+RESPReply = bytes | int | list | None
+
+
+class RedisError(Exception):
+    """
+    Error reply returned by the server.
+    """
+
+
+class RedisUnavailable(Exception):
+    """
+    The server could not be reached, did not reply in time or closed the connection.
+    """
+
+
+def _encode_command(args: tuple) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        value = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(f"${len(value)}\r\n".encode())
+        parts.append(value)
+        parts.append(b"\r\n")
+
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> RESPReply:
+    line = await reader.readuntil(b"\r\n")
+    prefix, payload = line[:1], line[1:-2]
+
+    if prefix == b"+":
+        return payload
+    if prefix == b"-":
+        raise RedisError(payload.decode())
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [await _read_reply(reader) for _ in range(length)]
+
+    raise RedisError(f"Unexpected reply prefix {prefix!r}")
+
+
+class RedisClient:
+    """
+    Minimal asyncio client for servers speaking the Redis protocol (RESP2):
+    Redis, Valkey, KeyDB, Dragonfly. Keeps up to pool_size connections opened
+    lazily from a URL like redis://:password@host:6379/0.
+    """
+
+    def __init__(self, url: str, pool_size: int = 10, timeout: float = 5.0):
+        parts = urlsplit(url)
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port or 6379
+        self._password = parts.password
+        self._db = int(parts.path.lstrip("/") or 0)
+        self._timeout = timeout
+
+        self._idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def execute(self, *args) -> RESPReply:
+        """
+        Send a single command and return its decoded reply.
+        RedisError is raised if the server replies with an error,
+        RedisUnavailable if no reply could be received.
+        """
+        async with self._slots:
+            try:
+                if not self._idle.empty():
+                    try:
+                        return await self._send(self._idle.get_nowait(), args)
+                    except TimeoutError:
+                        raise
+                    except (OSError, EOFError):
+                        # Servers close idle connections on timeout or restart,
+                        # the command is sent once more over a new connection.
+                        pass
+
+                return await self._send(await self._connect(), args)
+            except (OSError, EOFError) as exc:
+                raise RedisUnavailable(f"{self._host}:{self._port}: {exc!r}") from exc
+
+    async def _send(self, connection, args: tuple) -> RESPReply:
+        reader, writer = connection
+        try:
+            writer.write(_encode_command(args))
+            await writer.drain()
+            reply = await asyncio.wait_for(_read_reply(reader), self._timeout)
+        except RedisError:
+            self._idle.put_nowait(connection)
+            raise
+        except BaseException:
+            # The connection may be left in the middle of a reply, never reuse it.
+            writer.close()
+            raise
+
+        self._idle.put_nowait(connection)
+        return reply
+
+    async def close(self) -> None:
+        """
+        Close all idle connections.
+        """
+        while not self._idle.empty():
+            _, writer = self._idle.get_nowait()
+            writer.close()
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port),
+            self._timeout,
+        )
+
+        commands = []
+        if self._password:
+            commands.append(("AUTH", self._password))
+        if self._db:
+            commands.append(("SELECT", self._db))
+
+        try:
+            for command in commands:
+                writer.write(_encode_command(command))
+                await writer.drain()
+                await asyncio.wait_for(_read_reply(reader), self._timeout)
+        except BaseException:
+            writer.close()
+            raise
+
+        return reader, writer
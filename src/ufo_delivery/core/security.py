@@ -1,18 +1,32 @@
+import hmac
 from uuid import uuid4
+from hashlib import sha256
+from secrets import token_urlsafe
 from datetime import datetime, timedelta, timezone
 
 from passlib.context import CryptContext
-from jwt import encode
 
+from ufo_delivery.core.hashing import HashingExecutor
+from ufo_delivery.core.keys import KeyManager
 from config.config import settings
 
 
 class AuthenticationManager:
-    def __init__(self, context: CryptContext):
+    def __init__(
+            self,
+            context: CryptContext,
+            hashing_executor: HashingExecutor,
+            key_manager: KeyManager,
+    ):
         self._context = context
+        self._hashing_executor = hashing_executor
+        self._key_manager = key_manager
 
-    @staticmethod
-    def create_access_token(data: dict, expires_in: int = settings.auth.access_token_ttl) -> str:
+    def create_access_token(
+            self,
+            data: dict,
+            expires_in: int = settings.auth.access_token_ttl,
+    ) -> str:
         """
         Creates JWT Access Token.
 
@@ -32,20 +46,45 @@ class AuthenticationManager:
             }
         )
 
-        return encode(
-            data_to_encode,
-            key=settings.auth.secret_key,
-            algorithm=settings.auth.algorithm
-        )
+        return self._key_manager.encode(data_to_encode)
+
+    @staticmethod
+    def create_refresh_token() -> tuple[str, bytes]:
+        """
+        Creates opaque random Refresh Token.
+
+        Returns:
+            Refresh token for the client and its HMAC to store.
+        """
+        token = token_urlsafe(32)
+        return token, AuthenticationManager.hash_refresh_token(token)
 
-    def hash_password(self, password: str) -> str:
+    @staticmethod
+    def hash_refresh_token(token: str) -> bytes:
+        """
+        Computes HMAC of given Refresh Token used to look it up. Unlike passwords,
+        refresh tokens are random, so a keyed hash is enough and costs microseconds.
+        """
+        return hmac.new(settings.auth.secret_key.encode(), token.encode(), sha256).digest()
+
+    async def hash_password(self, password: str) -> str:
         """
-        Hashes given plain password.
+        Hashes given plain password in the hashing pool.
         """
-        return self._context.hash(password)
+        return await self._hashing_executor.run(self._context.hash, password)
 
-    def is_password_valid(self, plain_password: str, hashed_password: str) -> bool:
+    def needs_rehash(self, hashed_password: str) -> bool:
         """
-        Validates given plain password against hashed one.
+        Checks whether given hash was computed with another scheme or cost than the configured one.
         """
-        return self._context.verify(plain_password, hashed_password)
+        return self._context.needs_update(hashed_password)
+
+    async def is_password_valid(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Validates given plain password against hashed one in the hashing pool.
+        """
+        return await self._hashing_executor.run(
+            self._context.verify,
+            plain_password,
+            hashed_password
+        )
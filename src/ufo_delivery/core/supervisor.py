@@ -0,0 +1,32 @@
+import logging
+
+from uvicorn.supervisors.multiprocess import Multiprocess, Process
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class RollingMultiprocess(Multiprocess):
+    """
+    Uvicorn supervisor of worker processes sharing one listening socket.
+
+    Workers are spawned, not forked, so each of them imports the application and
+    creates its own engine, pool and caches from scratch. On SIGHUP workers are
+    replaced one at a time: the new worker is started before the old one is asked
+    to shut down gracefully, so the amount of workers accepting connections never
+    drops while the old one finishes requests it has already accepted. SIGTTIN and
+    SIGTTOU add and remove a worker.
+    """
+
+    def restart_all(self) -> None:
+        for idx, old_process in enumerate(self.processes):
+            new_process = Process(self.config, self.target, self.sockets)
+            new_process.start()
+            if not new_process.is_alive(timeout=self.config.timeout_graceful_shutdown or 5):
+                logger.error("Replacement of child process [%s] did not start", old_process.pid)
+                new_process.kill()
+                new_process.join()
+                continue
+
+            self.processes[idx] = new_process
+            old_process.terminate()
+            old_process.join()
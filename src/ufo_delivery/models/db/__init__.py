@@ -1,4 +1,4 @@
 from .base import Base
 from .orders import Order
-from .users import User, Address
+from .users import User, Address, RefreshToken
 from .items import Item, ItemCategoryRelation
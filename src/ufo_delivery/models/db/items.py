@@ -16,11 +16,11 @@ class Item(Base):
     categories: Mapped[list["Category"]] = relationship(
         back_populates="items",
         secondary="item_category",
-        lazy="joined"
+        lazy="raise",
     )
     order_items: Mapped[list["OrderItem"]] = relationship(
         back_populates="item",
-        lazy="joined",
+        lazy="raise",
     )
     is_available: Mapped[bool] = mapped_column()
 
@@ -46,7 +46,7 @@ class Category(Base):
     items: Mapped[list["Item"]] = relationship(
         back_populates="categories",
         secondary="item_category",
-        lazy="joined"
+        lazy="raise",
     )
 
     def to_dto(self) -> CategoryDTO:
@@ -60,4 +60,8 @@ class ItemCategoryRelation(Base):
     __tablename__ = "item_category"
 
     item_id: Mapped[int] = mapped_column(ForeignKey("items.id"), primary_key=True)
-    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"), primary_key=True)
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id"),
+        primary_key=True,
+        index=True,
+    )
@@ -1,31 +1,92 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import Enum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ufo_delivery.models.db import Base
-from ufo_delivery.models.dto.orders import OrderDTO, OrderItemDTO
+from ufo_delivery.models.dto.orders import (
+    OrderDTO,
+    OrderItemDTO,
+    OrderStatus,
+)
+
+# Statuses every status can be changed to. Non-placed Orders become placed only by
+# their User, every following change is made by an operator.
+ORDER_STATUS_TRANSITIONS: dict[OrderStatus, frozenset[OrderStatus]] = {
+    OrderStatus.OPEN: frozenset({OrderStatus.PLACED}),
+    OrderStatus.PLACED: frozenset({OrderStatus.CLAIMED, OrderStatus.CANCELLED}),
+    OrderStatus.CLAIMED: frozenset({
+        OrderStatus.PLACED,
+        OrderStatus.DISPATCHED,
+        OrderStatus.CANCELLED,
+    }),
+    OrderStatus.DISPATCHED: frozenset({OrderStatus.DELIVERED, OrderStatus.CANCELLED}),
+    OrderStatus.DELIVERED: frozenset(),
+    OrderStatus.CANCELLED: frozenset(),
+}
 
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_user_id_is_placed", "user_id", "is_placed"),
+        Index("ix_orders_status_id", "status", "id"),
+        Index("ix_orders_placed_seq", "placed_seq", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     order_items: Mapped[list["OrderItem"]] = relationship(
         back_populates="order",
-        lazy="joined",
+        lazy="raise",
     )
     is_placed: Mapped[bool] = mapped_column()
+    status: Mapped[OrderStatus] = mapped_column(
+        Enum(
+            OrderStatus,
+            native_enum=False,
+            length=16,
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
+        default=OrderStatus.OPEN,
+        server_default=OrderStatus.OPEN.value,
+    )
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
-    user: Mapped["User"] = relationship(back_populates="orders", lazy="joined")
+    user: Mapped["User"] = relationship(
+        back_populates="orders",
+        foreign_keys=[user_id],
+        lazy="raise",
+    )
+    operator_id: Mapped[int | None] = mapped_column(ForeignKey("users.id"))
+    # Number given when the Order is placed, increasing in the order placements are committed.
+    # IDs are given when carts are created, so they do not follow placements.
+    placed_seq: Mapped[int | None] = mapped_column()
+
+    @staticmethod
+    def can_change_status(current: OrderStatus, new: OrderStatus) -> bool:
+        """
+        Check if Order with current status can be moved to new status.
+        """
+        return new in ORDER_STATUS_TRANSITIONS[current]
 
     def to_dto(self) -> OrderDTO:
         return OrderDTO(
             id=self.id,
             items=[item.to_dto() for item in self.order_items],
             is_placed=self.is_placed,
+            status=self.status,
         )
 
 
+class OrderPlacement(Base):
+    """
+    Single row holding the last placed_seq given to an Order. Every placement locks it
+    until commit, so numbers are given in the order placements become visible.
+    """
+    __tablename__ = "order_placement"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    last_seq: Mapped[int] = mapped_column(default=0)
+
+
 class OrderItem(Base):
     __tablename__ = "order_items"
 
@@ -33,8 +94,8 @@ class OrderItem(Base):
     order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), primary_key=True)
     quantity: Mapped[int] = mapped_column(default=1)
 
-    order: Mapped["Order"] = relationship(back_populates="order_items", lazy="joined")
-    item: Mapped["Item"] = relationship(back_populates="order_items", lazy="joined")
+    order: Mapped["Order"] = relationship(back_populates="order_items", lazy="raise")
+    item: Mapped["Item"] = relationship(back_populates="order_items", lazy="raise")
 
     def to_dto(self) -> OrderItemDTO:
         return OrderItemDTO(
@@ -1,8 +1,10 @@
-from sqlalchemy import ForeignKey, String
+from secrets import token_bytes
+
+from sqlalchemy import BINARY, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ufo_delivery.models.db import Base
-from ufo_delivery.models.dto.users import UserDTO, AddressDTO
+from ufo_delivery.models.dto.users import UserDTO, AddressDTO, Role, Principal
 
 
 class User(Base):
@@ -11,10 +13,16 @@ class User(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(length=32))
     password: Mapped[str] = mapped_column(String(length=255))
-    phone: Mapped[str] = mapped_column(String(length=15))
-    address: Mapped["Address"] = relationship(back_populates="user", uselist=False, lazy="joined")
+    phone: Mapped[str] = mapped_column(String(length=15), unique=True, index=True)
+    address: Mapped["Address"] = relationship(back_populates="user", uselist=False, lazy="raise")
     is_superuser: Mapped[bool] = mapped_column(default=False)
-    orders: Mapped[list["Order"]] = relationship(back_populates="user")
+    # Bumped to revoke every access token issued before, e.g. on password change.
+    token_version: Mapped[int] = mapped_column(default=0, server_default="0")
+    orders: Mapped[list["Order"]] = relationship(
+        back_populates="user",
+        foreign_keys="Order.user_id",
+        lazy="raise",
+    )
 
     def to_dto(self) -> UserDTO:
         return UserDTO(
@@ -26,6 +34,19 @@ class User(Base):
             is_superuser=self.is_superuser,
         )
 
+    @property
+    def role(self) -> Role:
+        """
+        Role of this User derived from its rights.
+        """
+        return Role.SUPERUSER if self.is_superuser else Role.USER
+
+    def to_principal(self) -> Principal:
+        """
+        Convert this User to Principal describing claims of its access tokens.
+        """
+        return Principal(id=self.id, role=self.role, token_version=self.token_version)
+
 
 class Address(Base):
     __tablename__ = "addresses"
@@ -35,10 +56,32 @@ class Address(Base):
     reference: Mapped[str] = mapped_column(String(length=255), nullable=True)
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), unique=True, nullable=True)
-    user: Mapped["User"] = relationship(back_populates="address")
+    user: Mapped["User"] = relationship(back_populates="address", lazy="raise")
 
     def to_dto(self) -> AddressDTO:
         return AddressDTO(
             street=self.street,
             reference=self.reference,
         )
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # HMAC of the token, the token itself is only known to the client.
+    token_hash: Mapped[bytes] = mapped_column(BINARY(32), unique=True)
+    # Tokens rotated from the same login share a family, revoked together on reuse.
+    family: Mapped[bytes] = mapped_column(BINARY(16), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    # Token version of the User at login, the token is revoked together with access tokens.
+    token_version: Mapped[int]
+    expires_at: Mapped[int] = mapped_column(index=True)  # Unix time in seconds
+    is_used: Mapped[bool] = mapped_column(default=False)
+
+    @staticmethod
+    def new_family() -> bytes:
+        """
+        Generate identifier of a new token family, one per login.
+        """
+        return token_bytes(16)
@@ -16,6 +16,21 @@ class ItemDTO(BaseModel):
     is_available: bool
 
 
+class PartialItemDTO(BaseModel):
+    id: int
+    name: str | None = None
+    description: str | None = None
+    price: float | None = None
+    image_path: str | None = None
+    categories: list[CategoryDTO] | None = None
+    is_available: bool | None = None
+
+
+class ItemPage(BaseModel):
+    items: list[PartialItemDTO]
+    next_cursor: int | None
+
+
 class CreateItem(BaseModel):
     name: str
     description: str
@@ -1,6 +1,19 @@
-from pydantic import BaseModel
+from enum import Enum
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
 
 from ufo_delivery.models.dto.items import ItemDTO
+from ufo_delivery.models.dto.users import AddressDTO
+
+
+class OrderStatus(str, Enum):
+    OPEN = "open"
+    PLACED = "placed"
+    CLAIMED = "claimed"
+    DISPATCHED = "dispatched"
+    DELIVERED = "delivered"
+    CANCELLED = "cancelled"
 
 
 class OrderItemDTO(BaseModel):
@@ -9,9 +22,35 @@ class OrderItemDTO(BaseModel):
 
 
 class OrderDTO(BaseModel):
-    id: int
+    # None for non-placed Orders kept outside the database, see CART_BACKEND setting.
+    id: int | None
     items: list[OrderItemDTO]
     is_placed: bool
+    status: OrderStatus
+
+
+class CustomerDTO(BaseModel):
+    id: int
+    name: str
+    phone: str
+    address: AddressDTO | None
+
+
+class PlacedOrderDTO(OrderDTO):
+    customer: CustomerDTO
+    # ID of the operator who claimed the Order, None while nobody did.
+    operator_id: int | None
+    # Increases with every placed Order, see Last-Event-ID of the operator orders stream.
+    placed_seq: int
+
+
+class PlacedOrderPage(BaseModel):
+    items: list[PlacedOrderDTO]
+    next_cursor: int | None
+
+
+class ChangeOrderStatus(BaseModel):
+    status: OrderStatus
 
 
 class AddItemToOrder(BaseModel):
@@ -20,3 +59,24 @@ class AddItemToOrder(BaseModel):
 
 class RemoveItemFromOrder(BaseModel):
     item_id: int
+
+
+class OrderItemQuantity(BaseModel):
+    item_id: int
+    quantity: int
+
+
+class UpdateOrderItems(BaseModel):
+    items: list[OrderItemQuantity] = Field(min_length=1, max_length=100)
+    # "set" replaces quantities of given Items, "add" adds given (possibly negative) amounts.
+    mode: Literal["set", "add"] = "set"
+
+    @model_validator(mode="after")
+    def check_quantities(self) -> "UpdateOrderItems":
+        """
+        Absolute quantities can not be negative.
+        """
+        if self.mode == "set" and any(item.quantity < 0 for item in self.items):
+            raise ValueError("quantity must not be negative when mode is 'set'")
+
+        return self
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AddressDTO(BaseModel):
@@ -15,6 +17,36 @@ class UserDTO(BaseModel):
     is_superuser: bool
 
 
+class Role(str, Enum):
+    USER = "user"
+    SUPERUSER = "superuser"
+
+
+class Principal(BaseModel):
+    """
+    User authenticated by verified claims of an access token, without a database lookup.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: int = Field(alias="sub")
+    role: Role
+    # Tokens issued before the User's token version was bumped are revoked.
+    token_version: int = Field(alias="ver")
+
+    @property
+    def is_superuser(self) -> bool:
+        """
+        Whether the User has rights of superuser.
+        """
+        return self.role == Role.SUPERUSER
+
+    def to_claims(self) -> dict:
+        """
+        Get claims to encode in an access token. JWT subject has to be a string.
+        """
+        return {"sub": str(self.id), "role": self.role.value, "ver": self.token_version}
+
+
 class CreateUser(BaseModel):
     name: str
     phone: str
@@ -37,6 +69,11 @@ class LoginCredentials(BaseModel):
     password: str
 
 
+class RefreshCredentials(BaseModel):
+    refresh_token: str
+
+
 class LoginResponse(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
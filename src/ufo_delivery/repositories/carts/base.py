@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+
+class Cart(NamedTuple):
+    # ID of the non-placed Order backing the cart, None if the cart lives outside the database.
+    order_id: int | None
+    # Quantity for every Item ID, always positive.
+    items: dict[int, int]
+
+
+class CartStore(ABC):
+    """
+    Storage of non-placed Orders (carts), one per User.
+    Every operation is atomic for the User's cart.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: int) -> Cart:
+        """
+        Get cart of User with given ID. Empty cart is returned if User has none.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+            self,
+            user_id: int,
+            quantities: dict[int, int],
+            relative: bool = False,
+    ) -> Cart:
+        """
+        Set quantities of given Items in cart of User with given ID.
+        Items left without positive quantity are removed from the cart.
+
+        Args:
+            user_id: ID of User whose cart should be changed.
+            quantities: Quantity for every Item ID.
+            relative: Whether quantities are added to the current ones instead of replacing them.
+
+        Returns:
+            Changed cart.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_one(self, user_id: int, item_id: int) -> Cart | None:
+        """
+        Remove one unit of Item with given ID from cart of User with given ID.
+
+        Returns:
+            Changed cart, None if the Item is not in the cart.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def take(self, user_id: int) -> Cart:
+        """
+        Get cart of User with given ID for placing it. Once taken the cart
+        is no longer served to the User, stores backed by the database
+        leave this to the caller committing the placed Order.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release resources held by the store on application shutdown.
+        """
@@ -0,0 +1,53 @@
+from ufo_delivery.repositories.carts.base import Cart, CartStore
+
+
+class InMemoryCartStore(CartStore):
+    """
+    Cart store keeping carts in memory of the current process.
+    Meant for tests and single-process deployments, carts are lost on restart.
+    """
+
+    def __init__(self):
+        self._carts: dict[int, dict[int, int]] = {}
+
+    async def get(self, user_id: int) -> Cart:
+        return Cart(None, dict(self._carts.get(user_id, {})))
+
+    async def update(
+            self,
+            user_id: int,
+            quantities: dict[int, int],
+            relative: bool = False,
+    ) -> Cart:
+        items = self._carts.setdefault(user_id, {})
+        for item_id, quantity in quantities.items():
+            if relative:
+                quantity += items.get(item_id, 0)
+
+            if quantity > 0:
+                items[item_id] = quantity
+            else:
+                items.pop(item_id, None)
+
+        if not items:
+            del self._carts[user_id]
+
+        return await self.get(user_id)
+
+    async def remove_one(self, user_id: int, item_id: int) -> Cart | None:
+        items = self._carts.get(user_id, {})
+        quantity = items.get(item_id)
+        if quantity is None:
+            return None
+
+        if quantity > 1:
+            items[item_id] = quantity - 1
+        elif len(items) > 1:
+            del items[item_id]
+        else:
+            del self._carts[user_id]
+
+        return await self.get(user_id)
+
+    async def take(self, user_id: int) -> Cart:
+        return Cart(None, self._carts.pop(user_id, {}))
@@ -0,0 +1,97 @@
+from ufo_delivery.core.redis import RedisClient
+from ufo_delivery.repositories.carts.base import Cart, CartStore
+
+# Carts are hashes of Item ID to quantity. Scripts run atomically on the server,
+# so concurrent requests of the same User never interleave.
+
+# KEYS[1] - cart, ARGV[1] - "1" if relative, ARGV[2] - TTL, ARGV[3..] - Item ID, quantity pairs.
+_UPDATE_SCRIPT = """
+for i = 3, #ARGV, 2 do
+    local quantity
+    if ARGV[1] == '1' then
+        quantity = redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    else
+        quantity = tonumber(ARGV[i + 1])
+        redis.call('HSET', KEYS[1], ARGV[i], quantity)
+    end
+    if quantity <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+if tonumber(ARGV[2]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return redis.call('HGETALL', KEYS[1])
+"""
+
+# KEYS[1] - cart, ARGV[1] - Item ID.
+_REMOVE_ONE_SCRIPT = """
+local quantity = redis.call('HGET', KEYS[1], ARGV[1])
+if not quantity then
+    return false
+end
+if tonumber(quantity) > 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+else
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return redis.call('HGETALL', KEYS[1])
+"""
+
+# KEYS[1] - cart.
+_TAKE_SCRIPT = """
+local items = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return items
+"""
+
+
+def _to_cart(reply: list[bytes]) -> Cart:
+    return Cart(None, {
+        int(reply[i]): int(reply[i + 1]) for i in range(0, len(reply), 2)
+    })
+
+
+class RedisCartStore(CartStore):
+    """
+    Cart store keeping carts in a server speaking the Redis protocol, shared by
+    all workers. Carts expire ttl seconds after their last change, 0 keeps them forever.
+    """
+
+    def __init__(self, client: RedisClient, ttl: int = 0, prefix: str = "cart"):
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    async def get(self, user_id: int) -> Cart:
+        return _to_cart(await self._client.execute("HGETALL", self._key(user_id)))
+
+    async def update(
+            self,
+            user_id: int,
+            quantities: dict[int, int],
+            relative: bool = False,
+    ) -> Cart:
+        arguments = [1 if relative else 0, self._ttl]
+        for item_id, quantity in quantities.items():
+            arguments.extend((item_id, quantity))
+
+        reply = await self._client.execute(
+            "EVAL", _UPDATE_SCRIPT, 1, self._key(user_id), *arguments
+        )
+        return _to_cart(reply)
+
+    async def remove_one(self, user_id: int, item_id: int) -> Cart | None:
+        reply = await self._client.execute(
+            "EVAL", _REMOVE_ONE_SCRIPT, 1, self._key(user_id), item_id
+        )
+        return None if reply is None else _to_cart(reply)
+
+    async def take(self, user_id: int) -> Cart:
+        return _to_cart(await self._client.execute("EVAL", _TAKE_SCRIPT, 1, self._key(user_id)))
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}:{user_id}"
@@ -0,0 +1,66 @@
+from ufo_delivery.repositories.db.orders import OrderRepository
+from ufo_delivery.repositories.carts.base import Cart, CartStore
+
+
+class SQLCartStore(CartStore):
+    """
+    Cart store keeping carts as non-placed Orders in the database, in the session
+    of given OrderRepository. Every change locks the User row and is committed
+    before returning. take() locks the cart as well but leaves committing to the
+    caller, the cart is gone once its Order is committed as placed.
+    """
+
+    def __init__(self, repository: OrderRepository):
+        self._repository = repository
+
+    async def get(self, user_id: int) -> Cart:
+        order_id = await self._repository.get_open_order_id(user_id)
+        if order_id is None:
+            order_id = await self._get_open_order_id(user_id)
+            await self._repository.session.commit()
+
+        return await self._get_cart(order_id)
+
+    async def update(
+            self,
+            user_id: int,
+            quantities: dict[int, int],
+            relative: bool = False,
+    ) -> Cart:
+        order_id = await self._get_open_order_id(user_id)
+        await self._repository.set_item_quantities(order_id, quantities, relative)
+        await self._repository.session.commit()
+
+        return await self._get_cart(order_id)
+
+    async def remove_one(self, user_id: int, item_id: int) -> Cart | None:
+        order_id = await self._get_open_order_id(user_id)
+        if not await self._repository.decrement_item(order_id, item_id):
+            return None
+
+        await self._repository.session.commit()
+
+        return await self._get_cart(order_id)
+
+    async def take(self, user_id: int) -> Cart:
+        await self._repository.lock_user_orders(user_id)
+
+        order_id = await self._repository.get_open_order_id(user_id)
+        if order_id is None:
+            return Cart(None, {})
+
+        return await self._get_cart(order_id)
+
+    async def _get_open_order_id(self, user_id: int) -> int:
+        # Locking the User first keeps concurrent requests of the same
+        # User from creating several non-placed Orders.
+        await self._repository.lock_user_orders(user_id)
+
+        order_id = await self._repository.get_open_order_id(user_id)
+        if order_id is None:
+            order_id = await self._repository.add_open_order(user_id)
+
+        return order_id
+
+    async def _get_cart(self, order_id: int) -> Cart:
+        return Cart(order_id, await self._repository.get_item_quantities(order_id))
@@ -1,10 +1,46 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
+from sqlalchemy import ColumnCollection, Insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ufo_delivery.models.db.base import Base
 
 
+def upsert(
+        session: AsyncSession,
+        model: type[Base],
+        rows: list[dict],
+        on_conflict: Callable[[ColumnCollection], dict],
+) -> Insert:
+    """
+    Build INSERT statement which updates existing rows on primary key conflict,
+    rendered as ON DUPLICATE KEY UPDATE on MySQL and ON CONFLICT DO UPDATE on SQLite.
+
+    Args:
+        session: Session the statement will be executed in.
+        model: SQLAlchemy model to insert into.
+        rows: Rows to insert.
+        on_conflict: Receives columns of the row being inserted and
+            returns values to set on the existing row.
+
+    Returns:
+        Insert statement ready to execute.
+    """
+    is_sqlite = session.bind.dialect.name == "sqlite"
+    statement = (sqlite_insert if is_sqlite else mysql_insert)(model).values(rows)
+
+    if is_sqlite:
+        return statement.on_conflict_do_update(
+            index_elements=list(model.__table__.primary_key),
+            set_=on_conflict(statement.excluded),
+        )
+
+    return statement.on_duplicate_key_update(on_conflict(statement.inserted))
+
+
 class BaseSQLAlchemyRepository(ABC):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -1,7 +1,10 @@
 from sqlalchemy import select, update as sql_update
 
-from ufo_delivery.models.db.items import Item, Category
+from ufo_delivery.models.db.items import Item, Category, ItemCategoryRelation
+from ufo_delivery.models.dto.items import ItemDTO, CategoryDTO, PartialItemDTO
 from ufo_delivery.repositories.db.base import BaseSQLAlchemyRepository
+from ufo_delivery.repositories.db.loading import ITEM_WITH_CATEGORIES
+from ufo_delivery.repositories.db.rows import ITEM_COLUMNS, item_from_row, read_item_categories
 
 
 class ItemRepository(BaseSQLAlchemyRepository):
@@ -9,7 +12,7 @@ class ItemRepository(BaseSQLAlchemyRepository):
         self.session.add(model)
 
     async def get(self, id_: int) -> Item | None:
-        statement = select(Item).where(Item.id == id_)
+        statement = select(Item).where(Item.id == id_).options(*ITEM_WITH_CATEGORIES)
         result = await self.session.scalar(statement)
         return result
 
@@ -32,28 +35,71 @@ class ItemRepository(BaseSQLAlchemyRepository):
 
         await self.session.delete(item)
 
-    async def get_all(self) -> list[Item]:
+    async def read_all(self) -> list[ItemDTO]:
         """
-        Get all Items from database.
+        Get all Items in read mode, without loading them into the session.
         Returns:
-            Items as Item model instances.
+            Items as ItemDTOs ordered by ID.
         """
-        statement = select(Item)
-        result = await self.session.scalars(statement)
-        return list(result.unique())
+        result = await self.session.execute(select(*ITEM_COLUMNS).order_by(Item.id))
+        rows = result.all()
+        categories = await read_item_categories(self.session)
+        return [item_from_row(row, categories.get(row.id, [])) for row in rows]
 
-    async def get_all_in_category(self, category_id: int) -> list[Item]:
+    async def read_page(
+            self,
+            after_id: int | None,
+            limit: int,
+            fields: list[str],
+            category_id: int | None = None,
+    ) -> list[PartialItemDTO]:
         """
-        Get all Items in given category.
+        Get a page of Items ordered by ID in read mode, selecting only given columns.
+        Items are paginated by keyset, so the cost of a page does not depend on its position.
         Args:
+            after_id: ID of the last Item of the previous page, None for the first page.
+            limit: Maximum amount of Items in the page.
+            fields: Item fields to retrieve. ID is always retrieved.
+                "categories" is loaded with one additional query for the whole page.
             category_id: ID of category to get Items from.
 
         Returns:
-            Items as Item model instances.
+            Items as PartialItemDTOs with only requested fields set.
+        """
+        columns = [
+            getattr(Item, field) for field in fields if field not in ("id", "categories")
+        ]
+        statement = select(Item.id, *columns).order_by(Item.id).limit(limit)
+
+        if after_id is not None:
+            statement = statement.where(Item.id > after_id)
+
+        if category_id:
+            statement = statement.join(
+                ItemCategoryRelation, ItemCategoryRelation.item_id == Item.id
+            ).where(ItemCategoryRelation.category_id == category_id)
+
+        result = await self.session.execute(statement)
+        rows = result.mappings().all()
+
+        if "categories" not in fields or not rows:
+            return [PartialItemDTO.model_construct(**row) for row in rows]
+
+        categories = await read_item_categories(self.session, [row["id"] for row in rows])
+        return [
+            PartialItemDTO.model_construct(**row, categories=categories.get(row["id"], []))
+            for row in rows
+        ]
+
+    async def get_existing_ids(self, items_id: list[int]) -> set[int]:
+        """
+        Get which of given Item IDs exist, in a single query.
+        Returns:
+            Set of existing Item IDs.
         """
-        statement = select(Item).join(Item.categories).where(Category.id == category_id)
+        statement = select(Item.id).where(Item.id.in_(items_id))
         result = await self.session.scalars(statement)
-        return list(result.unique())
+        return set(result)
 
     async def get_categories(self, categories_id: list[int]) -> list[Category]:
         """
@@ -66,14 +112,14 @@ class ItemRepository(BaseSQLAlchemyRepository):
         """
         statement = select(Category).where(Category.id.in_(categories_id))
         result = await self.session.scalars(statement)
-        return list(result.unique())
+        return list(result)
 
-    async def get_all_categories(self) -> list[Category]:
+    async def read_all_categories(self) -> list[CategoryDTO]:
         """
-        Get all Categories.
+        Get all Categories in read mode, without loading them into the session.
         Returns:
-            categories as Category model instances.
+            Categories as CategoryDTOs ordered by ID.
         """
-        statement = select(Category)
-        result = await self.session.scalars(statement)
-        return list(result.unique())
+        statement = select(Category.id, Category.name).order_by(Category.id)
+        result = await self.session.execute(statement)
+        return [CategoryDTO.model_construct(id=id_, name=name) for id_, name in result]
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import joinedload, selectinload
+
+from ufo_delivery.models.db.items import Item
+from ufo_delivery.models.db.users import User
+
+# All relationships are declared with lazy="raise", so every query has to state
+# explicitly which parts of the object graph it needs. Repositories pass one of
+# the strategies below to Select.options().
+
+ITEM_WITH_CATEGORIES = (
+    selectinload(Item.categories),
+)
+
+USER_WITH_ADDRESS = (
+    joinedload(User.address),
+)
@@ -1,7 +1,17 @@
-from sqlalchemy import select, update as sql_update
+from sqlalchemy import (
+    select,
+    delete as sql_delete,
+    insert as sql_insert,
+    update as sql_update,
+)
 
-from ufo_delivery.repositories.db.base import BaseSQLAlchemyRepository
-from ufo_delivery.models.db.orders import Order, OrderItem
+from ufo_delivery.repositories.db.base import BaseSQLAlchemyRepository, upsert
+from ufo_delivery.repositories.db.rows import ITEM_COLUMNS, item_from_row, read_item_categories
+from ufo_delivery.models.db.items import Item
+from ufo_delivery.models.db.orders import Order, OrderItem, OrderPlacement
+from ufo_delivery.models.dto.orders import OrderStatus, OrderItemDTO, CustomerDTO, PlacedOrderDTO
+from ufo_delivery.models.db.users import User, Address
+from ufo_delivery.models.dto.users import AddressDTO
 
 
 class OrderRepository(BaseSQLAlchemyRepository):
@@ -22,67 +32,346 @@ class OrderRepository(BaseSQLAlchemyRepository):
 
         await self.session.delete(order)
 
-    async def get_by_user_id(self, user_id: int) -> Order | None:
+    async def read_placed(self, id_: int) -> PlacedOrderDTO | None:
         """
-        Get Order attached to User with given ID.
+        Get placed Order with given ID in read mode, without loading it into the session.
+        Returns:
+            PlacedOrderDTO if found, otherwise None.
+        """
+        orders = await self._read_placed(
+            (Order.id == id_) & (Order.is_placed == True)
+        )
+        return orders[0] if orders else None
+
+    async def read_placed_page(
+            self,
+            after_id: int | None,
+            limit: int,
+            status: OrderStatus | None = None,
+    ) -> list[PlacedOrderDTO]:
+        """
+        Get placed Orders ordered by ID in read mode, without loading them into the session.
+        Args:
+            after_id: Only Orders with greater ID are returned, all if None.
+            limit: Maximum amount of Orders to return.
+            status: Only Orders with this status are returned, Orders with any status if None.
+
+        Returns:
+            list of PlacedOrderDTOs.
+        """
+        condition = Order.is_placed == True
+        if status is not None:
+            condition &= Order.status == status
+        if after_id is not None:
+            condition &= Order.id > after_id
+
+        return await self._read_placed(condition, limit)
+
+    async def read_placed_since(self, after_seq: int | None, limit: int) -> list[PlacedOrderDTO]:
+        """
+        Get placed Orders in the order they were placed, without loading them into the session.
         Args:
-            user_id: ID of User whose Order should be returned.
+            after_seq: Only Orders with greater placed_seq are returned, all if None.
+            limit: Maximum amount of Orders to return.
+
+        Returns:
+            list of PlacedOrderDTOs.
+        """
+        condition = Order.is_placed == True
+        if after_seq is not None:
+            condition &= Order.placed_seq > after_seq
+
+        return await self._read_placed(condition, limit, Order.placed_seq)
+
+    async def get_last_placed_seq(self) -> int:
+        """
+        Returns:
+            placed_seq of the last placed Order, 0 if there is none.
+        """
+        statement = select(OrderPlacement.last_seq).where(OrderPlacement.id == 1)
+        return await self.session.scalar(statement) or 0
+
+    async def _read_placed(
+            self,
+            condition,
+            limit: int | None = None,
+            order_by=Order.id,
+    ) -> list[PlacedOrderDTO]:
+        # One row per Order with its customer, then one row per OrderItem of all the Orders
+        # and Categories of their Items: three queries whatever the amount of Orders.
+        statement = (
+            select(
+                Order.id,
+                Order.is_placed,
+                Order.status,
+                Order.operator_id,
+                Order.placed_seq,
+                User.id.label("user_id"),
+                User.name,
+                User.phone,
+                Address.id.label("address_id"),
+                Address.street,
+                Address.reference,
+            )
+            .join(User, User.id == Order.user_id)
+            .outerjoin(Address, Address.user_id == User.id)
+            .where(condition)
+            .order_by(order_by)
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        rows = result.all()
+        if not rows:
+            return []
+
+        orders_id = [row.id for row in rows]
+        result = await self.session.execute(
+            select(OrderItem.order_id, OrderItem.quantity, *ITEM_COLUMNS)
+            .join(Item, Item.id == OrderItem.item_id)
+            .where(OrderItem.order_id.in_(orders_id))
+            .order_by(OrderItem.order_id, OrderItem.item_id)
+        )
+        item_rows = result.all()
+        categories = await read_item_categories(
+            self.session, {row.id for row in item_rows}
+        )
+
+        items: dict[int, list[OrderItemDTO]] = {}
+        for row in item_rows:
+            items.setdefault(row.order_id, []).append(OrderItemDTO.model_construct(
+                item=item_from_row(row, categories.get(row.id, [])),
+                quantity=row.quantity,
+            ))
+
+        return [
+            PlacedOrderDTO.model_construct(
+                id=row.id,
+                items=items.get(row.id, []),
+                is_placed=row.is_placed,
+                status=row.status,
+                customer=CustomerDTO.model_construct(
+                    id=row.user_id,
+                    name=row.name,
+                    phone=row.phone,
+                    address=AddressDTO.model_construct(
+                        street=row.street,
+                        reference=row.reference,
+                    ) if row.address_id is not None else None,
+                ),
+                operator_id=row.operator_id,
+                placed_seq=row.placed_seq,
+            )
+            for row in rows
+        ]
 
+    async def lock_user_orders(self, user_id: int) -> None:
+        """
+        Lock row of User with given ID until the end of the current transaction.
+        Serializes concurrent changes to the User's Order, including creation of a new one.
+        """
+        statement = select(User.id).where(User.id == user_id).with_for_update()
+        await self.session.execute(statement)
+
+    async def get_open_order_id(self, user_id: int) -> int | None:
+        """
+        Get ID of non-placed Order attached to User with given ID.
         Returns:
-            Order model instance if found, otherwise None.
+            Order ID if found, otherwise None.
         """
-        statement = select(Order).where(
+        statement = select(Order.id).where(
             (Order.user_id == user_id) & (Order.is_placed == False)
         )
         return await self.session.scalar(statement)
 
-    async def add_item_to_order(self, order_id: int, new_order_item: OrderItem) -> None:
+    async def add_open_order(self, user_id: int) -> int:
         """
-        Add given OrderItem to Order with corresponding ID. If such OrderItem is already
-        attached to the Order, quantity field of existing OrderItem will be incremented.
-        Args:
-            order_id: ID of Order to which OrderItem should be attached.
-            new_order_item: OrderItem which should be added to Order.
+        Insert new non-placed Order for User with given ID.
+        This method does not commit the session - this should be done by caller.
+        Returns:
+            ID of inserted Order.
+        """
+        statement = sql_insert(Order).values(
+            user_id=user_id,
+            is_placed=False,
+            status=OrderStatus.OPEN,
+        )
+        result = await self.session.execute(statement)
+        return result.inserted_primary_key[0]
+
+    async def decrement_item(self, order_id: int, item_id: int) -> bool:
+        """
+        Remove one unit of Item with given ID from Order with given ID.
+        The OrderItem is deleted once its last unit is removed.
+        Returns:
+            False if the Item is not in the Order, otherwise True.
         """
-        order = await self.get(order_id)
+        in_order = (OrderItem.order_id == order_id) & (OrderItem.item_id == item_id)
 
-        order_item = await self.get_order_item(order_id, new_order_item.item_id)
-        if order_item:
-            order_item.quantity = order_item.quantity + 1
-            return
+        statement = sql_update(OrderItem).where(
+            in_order & (OrderItem.quantity > 1)
+        ).values(quantity=OrderItem.quantity - 1)
+        result = await self.session.execute(statement)
+        if result.rowcount > 0:
+            return True
 
-        order.order_items.append(new_order_item)
+        result = await self.session.execute(sql_delete(OrderItem).where(in_order))
+        return result.rowcount > 0
 
-    async def remove_item_from_order(self, order_id: int, order_item: OrderItem) -> None:
+    async def set_item_quantities(
+            self,
+            order_id: int,
+            quantities: dict[int, int],
+            relative: bool = False,
+    ) -> None:
         """
-        Removes given OrderItem from Order with corresponding ID. If amount of OrderItems in
-        given Order is more than 1, quantity field will be decremented.
+        Set quantities of several Items in Order with given ID using one multi-row upsert,
+        then delete every OrderItem of the Order left without positive quantity.
+        This method does not commit the session - this should be done by caller.
         Args:
-            order_id: ID of Order from which OrderItem should be removed.
-            order_item: OrderItem to remove from Order.
+            order_id: ID of Order to change.
+            quantities: Quantity for every Item ID.
+            relative: Whether quantities are added to the current ones instead of replacing them.
         """
-        order = await self.get(order_id)
+        rows = [
+            {"order_id": order_id, "item_id": item_id, "quantity": quantity}
+            for item_id, quantity in quantities.items()
+        ]
 
-        if order_item.quantity > 1:
-            order_item.quantity -= 1
-            return
+        def on_conflict(inserted) -> dict:
+            if relative:
+                return {"quantity": OrderItem.quantity + inserted.quantity}
+            return {"quantity": inserted.quantity}
 
-        order.order_items.remove(order_item)
-        await self.session.delete(order_item)
+        await self.session.execute(upsert(self.session, OrderItem, rows, on_conflict))
+        await self.session.execute(
+            sql_delete(OrderItem).where(
+                (OrderItem.order_id == order_id) & (OrderItem.quantity <= 0)
+            )
+        )
 
-    async def set_order_placed(self, order: Order) -> None:
+    async def get_item_quantities(self, order_id: int) -> dict[int, int]:
         """
-        Mark given Order as placed.
+        Get quantity of every Item in Order with given ID.
+        Returns:
+            Dictionary of Item ID to quantity.
         """
-        order.is_placed = True
+        statement = select(OrderItem.item_id, OrderItem.quantity).where(
+            OrderItem.order_id == order_id
+        )
+        result = await self.session.execute(statement)
+        return dict(result.tuples().all())
 
-    async def get_order_item(self, order_id: int, item_id: int) -> OrderItem | None:
+    async def _next_placed_seq(self) -> int:
         """
-        Get OrderItem with corresponding Order ID and Item ID from database.
+        Take the next placed_seq. The counter stays locked until the end of the current
+        transaction, so placements taking numbers are committed one after another.
+        This method does not commit the session - this should be done by caller.
         Returns:
-            OrderItem model instance.
+            placed_seq for the Order being placed.
         """
-        statement = select(OrderItem).where(
-            (OrderItem.order_id == order_id) & (OrderItem.item_id == item_id)
+        statement = sql_update(OrderPlacement).where(OrderPlacement.id == 1).values(
+            last_seq=OrderPlacement.last_seq + 1
         )
+        result = await self.session.execute(statement)
+        if result.rowcount == 0:
+            # Databases created without migrations start without the counter.
+            await self.session.execute(sql_insert(OrderPlacement).values(id=1, last_seq=1))
+            return 1
+
+        statement = select(OrderPlacement.last_seq).where(OrderPlacement.id == 1)
         return await self.session.scalar(statement)
+
+    async def set_order_placed(self, order_id: int) -> int:
+        """
+        Mark Order with given ID as placed.
+        This method does not commit the session - this should be done by caller.
+        Returns:
+            placed_seq given to the Order.
+        """
+        placed_seq = await self._next_placed_seq()
+        statement = sql_update(Order).where(Order.id == order_id).values(
+            is_placed=True,
+            status=OrderStatus.PLACED,
+            placed_seq=placed_seq,
+        )
+        await self.session.execute(statement)
+        return placed_seq
+
+    async def add_placed_order(self, user_id: int, quantities: dict[int, int]) -> int:
+        """
+        Insert placed Order for User with given ID with given Items.
+        This method does not commit the session - this should be done by caller.
+        Args:
+            user_id: ID of User who placed the Order.
+            quantities: Quantity for every Item ID, all positive.
+
+        Returns:
+            ID of inserted Order.
+        """
+        statement = sql_insert(Order).values(
+            user_id=user_id,
+            is_placed=True,
+            status=OrderStatus.PLACED,
+            placed_seq=await self._next_placed_seq(),
+        )
+        result = await self.session.execute(statement)
+        order_id = result.inserted_primary_key[0]
+
+        await self.session.execute(sql_insert(OrderItem), [
+            {"order_id": order_id, "item_id": item_id, "quantity": quantity}
+            for item_id, quantity in quantities.items()
+        ])
+        return order_id
+
+    async def claim_next(self, operator_id: int) -> int | None:
+        """
+        Assign the oldest placed Order nobody claimed yet to operator with given ID.
+        Rows locked by concurrent claims are skipped (SELECT ... FOR UPDATE SKIP LOCKED),
+        so operators claiming at the same time get different Orders without waiting.
+        This method does not commit the session - this should be done by caller.
+        Returns:
+            ID of claimed Order, None if there is nothing to claim.
+        """
+        candidate = (
+            select(Order.id)
+            .where(Order.status == OrderStatus.PLACED)
+            .order_by(Order.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        while True:
+            order_id = await self.session.scalar(candidate)
+            if order_id is None:
+                return None
+
+            # The status check guards databases without row locks, where a concurrent
+            # claim may have taken the same Order since it was selected.
+            statement = sql_update(Order).where(
+                (Order.id == order_id) & (Order.status == OrderStatus.PLACED)
+            ).values(status=OrderStatus.CLAIMED, operator_id=operator_id)
+            result = await self.session.execute(statement)
+            if result.rowcount > 0:
+                return order_id
+
+    async def lock_placed(self, order_id: int) -> tuple[OrderStatus, int | None] | None:
+        """
+        Lock placed Order with given ID until the end of the current transaction.
+        Returns:
+            Status of the Order and ID of operator who claimed it, None if there is no such Order.
+        """
+        statement = select(Order.status, Order.operator_id).where(
+            (Order.id == order_id) & (Order.is_placed == True)
+        ).with_for_update()
+        result = await self.session.execute(statement)
+        return result.tuples().one_or_none()
+
+    async def set_status(self, order_id: int, status: OrderStatus, operator_id: int | None) -> None:
+        """
+        Set status of Order with given ID and operator responsible for it.
+        This method does not commit the session - this should be done by caller.
+        """
+        statement = sql_update(Order).where(Order.id == order_id).values(
+            status=status,
+            operator_id=operator_id,
+        )
+        await self.session.execute(statement)
@@ -0,0 +1,66 @@
+from sqlalchemy import select, delete as sql_delete, update as sql_update
+
+from ufo_delivery.models.db.users import RefreshToken
+from ufo_delivery.repositories.db.base import BaseSQLAlchemyRepository
+
+
+class RefreshTokenRepository(BaseSQLAlchemyRepository):
+    async def add(self, model: RefreshToken) -> None:
+        self.session.add(model)
+
+    async def get(self, id_: int) -> RefreshToken | None:
+        return await self.session.get(RefreshToken, id_)
+
+    async def update(self, id_: int, updated_data: dict) -> RefreshToken:
+        statement = sql_update(RefreshToken).where(RefreshToken.id == id_).values(**updated_data)
+        await self.session.execute(statement)
+        return await self.get(id_)
+
+    async def delete(self, id_: int) -> None:
+        await self.session.execute(sql_delete(RefreshToken).where(RefreshToken.id == id_))
+
+    async def get_by_hash(self, token_hash: bytes) -> RefreshToken | None:
+        """
+        Get RefreshToken with given HMAC of the token.
+
+        Returns:
+            RefreshToken model instance if found, otherwise None.
+        """
+        statement = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+        return await self.session.scalar(statement)
+
+    async def mark_used(self, id_: int) -> bool:
+        """
+        Mark RefreshToken with given ID as used, unless it already is.
+        The check and the update are a single statement, so of concurrent
+        callers with the same token only one succeeds.
+        This method does not commit the session - this should be done by caller.
+
+        Returns:
+            False if the RefreshToken was already used, otherwise True.
+        """
+        statement = sql_update(RefreshToken).where(
+            (RefreshToken.id == id_) & (RefreshToken.is_used == False)
+        ).values(is_used=True)
+        result = await self.session.execute(statement)
+        return result.rowcount > 0
+
+    async def delete_family(self, family: bytes) -> None:
+        """
+        Delete every RefreshToken of given family.
+        This method does not commit the session - this should be done by caller.
+        """
+        statement = sql_delete(RefreshToken).where(RefreshToken.family == family)
+        await self.session.execute(statement)
+
+    async def delete_expired(self, now: int) -> int:
+        """
+        Delete every RefreshToken expired before given Unix time.
+        This method does not commit the session - this should be done by caller.
+
+        Returns:
+            Amount of deleted RefreshTokens.
+        """
+        statement = sql_delete(RefreshToken).where(RefreshToken.expires_at <= now)
+        result = await self.session.execute(statement)
+        return result.rowcount
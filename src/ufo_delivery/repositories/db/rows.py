@@ -0,0 +1,73 @@
+from collections.abc import Iterable
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ufo_delivery.models.db.items import Item, Category, ItemCategoryRelation
+from ufo_delivery.models.dto.items import ItemDTO, CategoryDTO
+
+# Read mode: repository methods named read_* select plain columns and assemble DTOs
+# straight from rows. Nothing is loaded into the session, so there is no identity map,
+# no relationship collections and no deduplication of joined rows. Values coming from
+# the database already have the right types, so DTOs are built with model_construct()
+# instead of being validated again.
+
+ITEM_COLUMNS = (
+    Item.id,
+    Item.name,
+    Item.description,
+    Item.price,
+    Item.image_path,
+    Item.is_available,
+)
+
+
+def item_from_row(row: Row, categories: list[CategoryDTO]) -> ItemDTO:
+    """
+    Build ItemDTO from row selected with ITEM_COLUMNS.
+    """
+    return ItemDTO.model_construct(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        price=row.price,
+        image_path=row.image_path,
+        categories=categories,
+        is_available=row.is_available,
+    )
+
+
+async def read_item_categories(
+        session: AsyncSession,
+        items_id: Iterable[int] | None = None,
+) -> dict[int, list[CategoryDTO]]:
+    """
+    Get Categories of Items with given IDs in one query.
+    Args:
+        session: Session to execute the query in.
+        items_id: IDs of Items, all Items if None.
+
+    Returns:
+        Dictionary of Item ID to list of CategoryDTOs ordered by ID.
+        Items without Categories are missing.
+    """
+    statement = (
+        select(ItemCategoryRelation.item_id, Category.id, Category.name)
+        .join(Category, Category.id == ItemCategoryRelation.category_id)
+        .order_by(ItemCategoryRelation.item_id, Category.id)
+    )
+    if items_id is not None:
+        statement = statement.where(ItemCategoryRelation.item_id.in_(items_id))
+
+    result = await session.execute(statement)
+
+    # Items share DTOs of the same Category.
+    dtos: dict[int, CategoryDTO] = {}
+    categories: dict[int, list[CategoryDTO]] = {}
+    for item_id, id_, name in result:
+        category = dtos.get(id_)
+        if category is None:
+            category = dtos[id_] = CategoryDTO.model_construct(id=id_, name=name)
+        categories.setdefault(item_id, []).append(category)
+
+    return categories
@@ -1,7 +1,9 @@
 from sqlalchemy import select, update as sql_update
 
 from ufo_delivery.models.db.users import User, Address
+from ufo_delivery.models.dto.users import Principal, Role
 from ufo_delivery.repositories.db.base import BaseSQLAlchemyRepository
+from ufo_delivery.repositories.db.loading import USER_WITH_ADDRESS
 
 
 class UserRepository(BaseSQLAlchemyRepository):
@@ -9,7 +11,7 @@ class UserRepository(BaseSQLAlchemyRepository):
         self.session.add(model)
 
     async def get(self, id_: int) -> User | None:
-        statement = select(User).where(User.id == id_)
+        statement = select(User).where(User.id == id_).options(*USER_WITH_ADDRESS)
         return await self.session.scalar(statement)
 
     async def get_by_phone(self, phone: str) -> User | None:
@@ -19,14 +21,60 @@ class UserRepository(BaseSQLAlchemyRepository):
         Returns:
             User model instance if found, otherwise None
         """
-        statement = select(User).where(User.phone == phone)
+        statement = select(User).where(User.phone == phone).options(*USER_WITH_ADDRESS)
         return await self.session.scalar(statement)
 
+    async def get_token_version(self, id_: int) -> int | None:
+        """
+        Get token version of User with given ID.
+
+        Returns:
+            Token version if User is found, otherwise None.
+        """
+        statement = select(User.token_version).where(User.id == id_)
+        return await self.session.scalar(statement)
+
+    async def read_principal(self, id_: int) -> Principal | None:
+        """
+        Get User with given ID as Principal, without loading it into the session.
+
+        Returns:
+            Principal if User is found, otherwise None.
+        """
+        statement = select(User.is_superuser, User.token_version).where(User.id == id_)
+        result = await self.session.execute(statement)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        role = Role.SUPERUSER if row.is_superuser else Role.USER
+        return Principal(id=id_, role=role, token_version=row.token_version)
+
     async def update(self, id_: int, updated_data: dict) -> User:
         statement = sql_update(User).where(User.id == id_).values(**updated_data)
         await self.session.execute(statement)
         return await self.get(id_)
 
+    async def replace_password(self, id_: int, old_password: str, new_password: str) -> bool:
+        """
+        Replace password hash of User with given ID, only if it did not change meanwhile.
+        This method does not commit the session - this should be done by caller.
+        Args:
+            id_: ID of User.
+            old_password: Hash the User is expected to have.
+            new_password: Hash to store instead.
+
+        Returns:
+            True if the hash was replaced, False if the User is missing or has another hash.
+        """
+        statement = (
+            sql_update(User)
+            .where(User.id == id_, User.password == old_password)
+            .values(password=new_password)
+        )
+        result = await self.session.execute(statement)
+        return result.rowcount > 0
+
     async def delete(self, id_: int) -> None:
         pass
 
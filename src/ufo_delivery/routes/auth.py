@@ -1,33 +1,60 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from ufo_delivery.models.dto.users import (
     LoginCredentials,
+    RefreshCredentials,
     LoginResponse,
 )
 from ufo_delivery.core.dependencies.services.auth_service import get_auth_service
 from ufo_delivery.services.auth_service import AuthService
+from ufo_delivery.utils.http_utils import DTORoute
 
 
 router = APIRouter(
     prefix="/auth",
     tags=["Auth"],
+    route_class=DTORoute,
 )
 
 
 @router.post("/login", summary="Login to existing account")
 async def login(
         credentials: LoginCredentials,
+        request: Request,
         auth_service: AuthService = Depends(get_auth_service)
 ) -> LoginResponse:
     """
-    Authenticate user with given credentials.
+    Authenticate user with given credentials. Attempts are limited
+    by phone number and by client address.
 
     Args:
         credentials: LoginCredentials model containing data mandatory for authentication.
+        request: Current request, to identify the client.
         auth_service: Injected business logic layer handling authentication.
 
     Returns:
-        LoginResponse model with access_token and token_type.
+        LoginResponse model with access_token, refresh_token and token_type.
     """
-    access_token = await auth_service.login(credentials)
-    return LoginResponse(access_token=access_token)
+    client_host = request.client.host if request.client else None
+    return await auth_service.login(credentials, client_host)
+
+
+@router.post("/refresh", summary="Renew tokens without password")
+async def refresh(
+        credentials: RefreshCredentials,
+        auth_service: AuthService = Depends(get_auth_service)
+) -> LoginResponse:
+    """
+    Exchange refresh token for new access token and refresh token. The given refresh
+    token can not be used again, using it again signs out every session started
+    from the same login.
+
+    Args:
+        credentials: RefreshCredentials model containing refresh token
+            received from login or the previous refresh.
+        auth_service: Injected business logic layer handling authentication.
+
+    Returns:
+        LoginResponse model with access_token, refresh_token and token_type.
+    """
+    return await auth_service.refresh(credentials.refresh_token)
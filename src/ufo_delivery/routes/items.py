@@ -1,10 +1,11 @@
 # pylint: disable=unused-argument
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Query
 
 from ufo_delivery.core.dependencies.services.item_service import get_item_service
 from ufo_delivery.core.dependencies.auth.user import get_current_superuser
 from ufo_delivery.services.item_service import ItemService
-from ufo_delivery.models.dto.users import UserDTO
+from ufo_delivery.models.dto.users import Principal
+from ufo_delivery.utils.http_utils import catalog_response, page_response, DTORoute
 from ufo_delivery.models.dto.items import (
     ItemDTO,
     CreateItem,
@@ -12,72 +13,101 @@ from ufo_delivery.models.dto.items import (
     DeleteItemResponse,
     CategoryDTO,
 )
+from config.config import settings
 
 router = APIRouter(
     prefix="/item",
     tags=["Items"],
+    route_class=DTORoute,
 )
 
 
 @router.get("/items", summary="Get Items")
-async def get_items(
+async def get_items(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        request: Request,
         category_id: int | None = None,
+        cursor: int | None = None,
+        limit: int | None = Query(default=None, ge=1, le=settings.pagination.max_limit),
+        fields: str | None = None,
         item_service: ItemService = Depends(get_item_service),
 ) -> list[ItemDTO]:
     """
     Get all Items. Items in corresponding Category will
     be returned if category_id is specified.
+    Responds with 304 Not Modified if If-None-Match matches current catalog ETag.
+
+    If any of cursor, limit or fields is specified, a single page of Items ordered by ID
+    is returned instead, with cursor of the next page in X-Next-Cursor header.
     Args:
+        request: Incoming request carrying conditional headers.
         category_id: ID of category to get Items from.
+        cursor: X-Next-Cursor of the previous page.
+        limit: Maximum amount of Items in the page.
+        fields: Comma-separated Item fields to include. ID is always included.
         item_service: Injected business logic layer handling Item operations.
 
     Returns:
         List of ItemDTOs representing Items.
     """
-    items = await item_service.get_all(category_id)
-    return items
+    if cursor is None and limit is None and fields is None:
+        items = await item_service.get_all_json(category_id)
+        return catalog_response(request, items)
+
+    page = await item_service.get_page(
+        cursor,
+        limit or settings.pagination.default_limit,
+        [field.strip() for field in fields.split(",") if field.strip()] if fields else None,
+        category_id,
+    )
+    return page_response(page)
 
 
 @router.get("/categories", summary="Get Categories")
 async def get_categories(
+        request: Request,
         item_service: ItemService = Depends(get_item_service),
 ) -> list[CategoryDTO]:
     """
     Get all Categories.
+    Responds with 304 Not Modified if If-None-Match matches current catalog ETag.
     Args:
+        request: Incoming request carrying conditional headers.
         item_service: Injected business logic layer handling Item operations.
 
     Returns:
         List of CategoryDTOs representing Categories.
     """
-    categories = await item_service.get_all_categories()
-    return categories
+    categories = await item_service.get_all_categories_json()
+    return catalog_response(request, categories)
 
 
 @router.get("/{item_id}", summary="Get Item by ID")
 async def get_item(
+        request: Request,
         item_id: int,
         item_service: ItemService = Depends(get_item_service)
 ) -> ItemDTO:
     """
     Get Item by given ID.
+    Responds with 304 Not Modified if If-None-Match matches current catalog ETag.
 
     Args:
+        request: Incoming request carrying conditional headers.
         item_id: ID of Item to retrieve.
         item_service: Injected business logic layer handling Item operations.
 
     Returns:
         ItemDTO representing Item instance.
     """
-    item = await item_service.get(item_id)
-    return item
+    item = await item_service.get_json(item_id)
+    return catalog_response(request, item)
 
 
 @router.post("", summary="Create new Item")
 async def create_item(
         item_data: CreateItem,
         item_service: ItemService = Depends(get_item_service),
-        user: UserDTO = Depends(get_current_superuser)
+        user: Principal = Depends(get_current_superuser)
 ) -> ItemDTO:
     """
     Create new Item instance.
@@ -99,7 +129,7 @@ async def edit_item(
         item_id: int,
         edited_data: EditItem,
         item_service: ItemService = Depends(get_item_service),
-        user: UserDTO = Depends(get_current_superuser)
+        user: Principal = Depends(get_current_superuser)
 ) -> ItemDTO:
     """
     Edit Item data.
@@ -122,7 +152,7 @@ async def edit_item(
 async def delete_item(
         item_id: int,
         item_service: ItemService = Depends(get_item_service),
-        user: UserDTO = Depends(get_current_superuser)
+        user: Principal = Depends(get_current_superuser)
 ) -> DeleteItemResponse:
     """
     Delete Item with given ID.
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ufo_delivery.core.metrics import registry
+
+router = APIRouter(
+    tags=["Metrics"],
+)
+
+
+@router.get("/metrics", summary="Get metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Get all metrics of this worker in Prometheus text exposition format.
+
+    Returns:
+        text/plain response with metrics.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
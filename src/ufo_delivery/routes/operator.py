@@ -0,0 +1,154 @@
+# pylint: disable=unused-argument
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+
+from ufo_delivery.core.dependencies.auth.user import get_current_superuser
+from ufo_delivery.core.dependencies.services.order_service import get_order_service
+from ufo_delivery.core.dependencies.order_feed import get_order_feed
+from ufo_delivery.core.broadcast import Broadcaster, FeedMessage
+from ufo_delivery.core.exceptions import TooManyRequestsException
+from ufo_delivery.services.order_service import OrderService
+from ufo_delivery.models.dto.users import Principal
+from ufo_delivery.models.dto.orders import PlacedOrderDTO, OrderStatus, ChangeOrderStatus
+from ufo_delivery.utils.http_utils import page_response, DTORoute
+from ufo_delivery.utils.sse import stream_events
+from config.config import settings
+
+router = APIRouter(
+    prefix="/operator",
+    tags=["Operator"],
+    route_class=DTORoute,
+)
+
+
+@router.get("/orders", summary="Get placed Orders")
+async def get_placed_orders(
+        cursor: int | None = None,
+        status: OrderStatus | None = None,
+        limit: int = Query(
+            default=settings.pagination.default_limit,
+            ge=1,
+            le=settings.pagination.max_limit,
+        ),
+        user: Principal = Depends(get_current_superuser),
+        order_service: OrderService = Depends(get_order_service),
+) -> list[PlacedOrderDTO]:
+    """
+    Get a page of placed Orders ordered by ID, with cursor of the next page in X-Next-Cursor header.
+    Args:
+        cursor: X-Next-Cursor of the previous page.
+        status: Status of Orders to include, all placed Orders if not specified.
+        limit: Maximum amount of Orders in the page.
+        user: Dependency Injection responsible for
+            extracting User with superuser rights from Authorization header.
+        order_service: Injected business logic layer handling Order operations.
+
+    Returns:
+        List of PlacedOrderDTOs representing Orders.
+    """
+    page = await order_service.get_placed_page(cursor, limit, status)
+    return page_response(page)
+
+
+@router.post("/orders/claim", summary="Claim the next placed Order")
+async def claim_order(
+        user: Principal = Depends(get_current_superuser),
+        order_service: OrderService = Depends(get_order_service),
+) -> PlacedOrderDTO:
+    """
+    Claim the oldest placed Order nobody claimed yet. Concurrent claims
+    of several operators never return the same Order.
+    Args:
+        user: Dependency Injection responsible for
+            extracting User with superuser rights from Authorization header.
+        order_service: Injected business logic layer handling Order operations.
+
+    Returns:
+        PlacedOrderDTO representing claimed Order.
+    """
+    return await order_service.claim_next(user.id)
+
+
+@router.put("/orders/{order_id}/status", summary="Change status of placed Order")
+async def change_order_status(
+        order_id: int,
+        data: ChangeOrderStatus,
+        user: Principal = Depends(get_current_superuser),
+        order_service: OrderService = Depends(get_order_service),
+) -> PlacedOrderDTO:
+    """
+    Move placed Order to the next status: placed → claimed → dispatched → delivered,
+    or cancelled before delivery. Claimed Order can be released by changing its status
+    back to placed.
+    Args:
+        order_id: ID of Order to change.
+        data: ChangeOrderStatus model containing new status.
+        user: Dependency Injection responsible for
+            extracting User with superuser rights from Authorization header.
+        order_service: Injected business logic layer handling Order operations.
+
+    Returns:
+        PlacedOrderDTO representing changed Order.
+    """
+    return await order_service.change_status(order_id, user.id, data.status)
+
+
+@router.get("/orders/stream", summary="Stream newly placed Orders")
+async def stream_placed_orders(
+        last_event_id: int | None = Header(default=None),
+        user: Principal = Depends(get_current_superuser),
+        order_service: OrderService = Depends(get_order_service),
+        order_feed: Broadcaster = Depends(get_order_feed),
+) -> StreamingResponse:
+    """
+    Stream Orders placed through any worker as Server-Sent Events, with placed_seq of the
+    Order as event ID. Reconnecting clients pass ID of the last received event in Last-Event-ID
+    header to first receive Orders placed after it, or a "resync" event if they missed more
+    than OPERATOR_FEED_REPLAY_LIMIT Orders.
+    Args:
+        last_event_id: ID of the last event received before reconnecting.
+        user: Dependency Injection responsible for
+            extracting User with superuser rights from Authorization header.
+        order_service: Injected business logic layer handling Order operations.
+        order_feed: Injected Broadcaster of placed Orders.
+
+    Returns:
+        text/event-stream response with "order" events carrying PlacedOrderDTOs.
+    """
+    # Subscribing before reading the backlog makes sure no Order falls in between.
+    subscription = order_feed.subscribe()
+    if subscription is None:
+        raise TooManyRequestsException(retry_after=settings.operator.feed_keepalive)
+
+    backlog = []
+    resync_id = None
+    try:
+        cursor = last_event_id
+        while cursor is not None:
+            if len(backlog) >= settings.operator.feed_replay_limit:
+                backlog = []
+                resync_id = await order_service.get_last_placed_seq()
+                break
+
+            page = await order_service.get_placed_since(cursor, settings.pagination.max_limit)
+            backlog.extend(
+                FeedMessage(order.placed_seq, order.model_dump_json().encode())
+                for order in page.items
+            )
+            cursor = page.next_cursor
+    except BaseException:
+        order_feed.unsubscribe(subscription)
+        raise
+
+    return StreamingResponse(
+        stream_events(
+            order_feed,
+            subscription,
+            backlog,
+            "order",
+            settings.operator.feed_keepalive,
+            resync_id=resync_id,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,19 +4,26 @@ from fastapi import APIRouter, Depends
 from ufo_delivery.core.dependencies.auth.user import get_current_user
 from ufo_delivery.core.dependencies.services.order_service import get_order_service
 from ufo_delivery.services.order_service import OrderService
-from ufo_delivery.models.dto.users import UserDTO
-from ufo_delivery.models.dto.orders import OrderDTO, AddItemToOrder, RemoveItemFromOrder
+from ufo_delivery.models.dto.users import Principal
+from ufo_delivery.models.dto.orders import (
+    OrderDTO,
+    AddItemToOrder,
+    RemoveItemFromOrder,
+    UpdateOrderItems,
+)
+from ufo_delivery.utils.http_utils import DTORoute
 
 
 router = APIRouter(
     prefix="/order",
     tags=["Orders"],
+    route_class=DTORoute,
 )
 
 
 @router.get("", summary="Get current user's Order")
 async def get_order(
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         order_service: OrderService = Depends(get_order_service),
 ) -> OrderDTO:
     """
@@ -36,7 +43,7 @@ async def get_order(
 @router.put("/add-item", summary="Add Item to current user's Order")
 async def add_item_to_order(
         data: AddItemToOrder,
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         order_service: OrderService = Depends(get_order_service),
 ) -> OrderDTO:
     """
@@ -50,14 +57,13 @@ async def add_item_to_order(
     Returns:
         OrderDTO representing Order with added Item.
     """
-    order = await order_service.get(user.id)
-    return await order_service.add_item_to_order(order.id, user.id, data)
+    return await order_service.add_item_to_order(user.id, data)
 
 
 @router.put("/remove-item", summary="Remove Item from current user's Order")
 async def remove_item_from_order(
         data: RemoveItemFromOrder,
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         order_service: OrderService = Depends(get_order_service),
 ) -> OrderDTO:
     """
@@ -71,13 +77,32 @@ async def remove_item_from_order(
     Returns:
         OrderDTO representing Order without removed Item.
     """
-    order = await order_service.get(user.id)
-    return await order_service.remove_item_from_order(order.id, data)
+    return await order_service.remove_item_from_order(user.id, data)
+
+
+@router.put("/items", summary="Change quantities of several Items in current user's Order")
+async def update_order_items(
+        data: UpdateOrderItems,
+        user: Principal = Depends(get_current_user),
+        order_service: OrderService = Depends(get_order_service),
+) -> OrderDTO:
+    """
+    Change quantities of several Items in current user's Order at once.
+    Args:
+        data: UpdateOrderItems model containing Items, their quantities and update mode.
+        user: Dependency Injection responsible for
+            extracting User data from Authorization header.
+        order_service: Injected business logic layer handling Order operations.
+
+    Returns:
+        OrderDTO representing changed Order.
+    """
+    return await order_service.update_items(user.id, data)
 
 
 @router.post("/place", summary="Place current user's Order")
 async def place_order(
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         order_service: OrderService = Depends(get_order_service),
 ) -> OrderDTO:
     """
@@ -2,18 +2,22 @@ from fastapi import APIRouter, Depends
 
 from ufo_delivery.models.dto.users import (
     UserDTO,
+    Principal,
     CreateUser,
     EditUser,
     AddressDTO,
     EditAddress,
 )
 from ufo_delivery.core.dependencies.auth.user import get_current_user
+from ufo_delivery.core.exceptions import UserNotFound
 from ufo_delivery.core.dependencies.services.user_service import get_user_service
 from ufo_delivery.services.user_service import UserService
+from ufo_delivery.utils.http_utils import DTORoute
 
 router = APIRouter(
     prefix="/user",
     tags=["User"],
+    route_class=DTORoute,
 )
 
 
@@ -37,24 +41,32 @@ async def create_user(
 
 
 @router.get("", summary="Get current user's information")
-async def get_user(user: UserDTO = Depends(get_current_user)):
+async def get_user(
+        user: Principal = Depends(get_current_user),
+        user_service: UserService = Depends(get_user_service),
+):
     """
-    Get User from Authorization header.
+    Get User authenticated by Authorization header.
 
     Args:
         user: Dependency Injection responsible for
             extracting User data from Authorization header.
+        user_service:  Injected business logic layer handling User operations.
 
     Returns:
         UserDTO representing authenticated user.
     """
+    user = await user_service.get(user.id)
+    if not user:
+        raise UserNotFound
+
     return user
 
 
 @router.put("", summary="Edit current user's information")
 async def edit_user(
         edited_data: EditUser,
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         user_service: UserService = Depends(get_user_service),
 ) -> UserDTO:
     """
@@ -75,7 +87,7 @@ async def edit_user(
 
 @router.get("/address", summary="Get current user's address")
 async def get_address(
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         user_service: UserService = Depends(get_user_service)
 ) -> AddressDTO:
     """
@@ -95,7 +107,7 @@ async def get_address(
 @router.put("/address", summary="Edit current user's address")
 async def edit_address(
         address_data: EditAddress,
-        user: UserDTO = Depends(get_current_user),
+        user: Principal = Depends(get_current_user),
         user_service: UserService = Depends(get_user_service)
 ) -> AddressDTO:
     """
@@ -1,43 +1,120 @@
-from ufo_delivery.models.dto.users import LoginCredentials
+from time import time
+
+from ufo_delivery.models.db.users import User, RefreshToken
+from ufo_delivery.models.dto.users import LoginCredentials, LoginResponse, Principal
 from ufo_delivery.repositories.db.users import UserRepository
+from ufo_delivery.repositories.db.refresh_tokens import RefreshTokenRepository
 from ufo_delivery.core.exceptions import InvalidCredentialsException
+from ufo_delivery.core.metrics import registry, Counter
+from ufo_delivery.core.background import KeyedTasks
+from ufo_delivery.core.rate_limit import LoginLimiter
 from ufo_delivery.core.security import AuthenticationManager
 
+REFRESH_TOKEN_REUSE = registry.register(Counter(
+    "refresh_token_reuse_total",
+    "Refresh tokens presented again after rotation, every one revoking its token family.",
+))
+
 
 class AuthService:
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
             self,
             user_repository: UserRepository,
+            refresh_token_repository: RefreshTokenRepository,
             auth_manager: AuthenticationManager,
+            password_rehashes: KeyedTasks,
+            login_limiter: LoginLimiter,
+            refresh_token_ttl: int,
     ):
         self._user_repository = user_repository
+        self._refresh_token_repository = refresh_token_repository
         self._auth_manager = auth_manager
+        self._password_rehashes = password_rehashes
+        self._login_limiter = login_limiter
+        self._refresh_token_ttl = refresh_token_ttl
 
-    async def login(self, credentials: LoginCredentials) -> str:
+    async def login(self, credentials: LoginCredentials, client_host: str | None) -> LoginResponse:
         """
         Authenticates given credentials. InvalidCredentialsException
-        will be raised if authentication process failed.
+        will be raised if authentication process failed. A password hash of
+        an outdated scheme or cost is replaced in the background, without
+        delaying the response. TooManyRequestsException will be raised before
+        anything is loaded if attempts for the phone or client are exhausted.
         Args:
             credentials: LoginCredentials model containing data mandatory for authentication.
+            client_host: Address of the client, None if unknown.
 
         Returns:
-            Generated JWT Token.
+            LoginResponse with generated JWT Token and Refresh Token of a new token family.
         """
-        is_authenticated = await self._is_user_authenticated(
-            credentials.phone,
-            credentials.password
-        )
-        if not is_authenticated:
+        await self._login_limiter.check(credentials.phone, client_host)
+
+        user = await self._authenticate(credentials.phone, credentials.password)
+        if not user:
+            raise InvalidCredentialsException
+
+        return await self._issue_tokens(user.to_principal(), RefreshToken.new_family())
+
+    async def refresh(self, refresh_token: str) -> LoginResponse:
+        """
+        Exchanges given Refresh Token for a new JWT Token and Refresh Token, without
+        verifying the password. Every Refresh Token can be used once: presenting a
+        rotated one again means it was stolen or replayed, so its whole token family
+        is revoked. InvalidCredentialsException will be raised if the token is unknown,
+        expired, already used or issued before the User's token version changed.
+        Args:
+            refresh_token: Refresh Token received from login or the previous refresh.
+
+        Returns:
+            LoginResponse with generated JWT Token and the next Refresh Token of the family.
+        """
+        token_hash = self._auth_manager.hash_refresh_token(refresh_token)
+        token = await self._refresh_token_repository.get_by_hash(token_hash)
+        if not token or token.expires_at <= time():
+            raise InvalidCredentialsException
+
+        if not await self._refresh_token_repository.mark_used(token.id):
+            REFRESH_TOKEN_REUSE.inc()
+            await self._revoke_family(token.family)
+            raise InvalidCredentialsException
+
+        principal = await self._user_repository.read_principal(token.user_id)
+        if not principal or principal.token_version != token.token_version:
+            await self._revoke_family(token.family)
             raise InvalidCredentialsException
 
-        return self._auth_manager.create_access_token({"sub": credentials.phone})
+        return await self._issue_tokens(principal, token.family)
 
-    async def _is_user_authenticated(self, phone: str, password: str) -> bool:
+    async def _authenticate(self, phone: str, password: str) -> User | None:
         user = await self._user_repository.get_by_phone(phone)
         if not user:
-            return False
+            return None
 
-        if not self._auth_manager.is_password_valid(password, user.password):
-            return False
+        if not await self._auth_manager.is_password_valid(password, user.password):
+            return None
+
+        if self._auth_manager.needs_rehash(user.password):
+            self._password_rehashes.submit(user.id, user.id, password, user.password)
+
+        return user
+
+    async def _issue_tokens(self, principal: Principal, family: bytes) -> LoginResponse:
+        refresh_token, token_hash = self._auth_manager.create_refresh_token()
+        await self._refresh_token_repository.add(RefreshToken(
+            token_hash=token_hash,
+            family=family,
+            user_id=principal.id,
+            token_version=principal.token_version,
+            expires_at=int(time()) + self._refresh_token_ttl,
+            is_used=False,
+        ))
+        await self._refresh_token_repository.session.commit()
+
+        return LoginResponse(
+            access_token=self._auth_manager.create_access_token(principal.to_claims()),
+            refresh_token=refresh_token,
+        )
 
-        return True
+    async def _revoke_family(self, family: bytes) -> None:
+        await self._refresh_token_repository.delete_family(family)
+        await self._refresh_token_repository.session.commit()
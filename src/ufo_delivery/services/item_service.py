@@ -4,19 +4,33 @@ from ufo_delivery.models.dto.items import (
     CreateItem,
     EditItem,
     CategoryDTO,
+    PartialItemDTO,
+    ItemPage,
 )
 from ufo_delivery.repositories.db.items import ItemRepository
-from ufo_delivery.core.exceptions import ItemNotFound
+from ufo_delivery.core.cache import CatalogCache, CatalogSnapshot, CatalogPayload
+from ufo_delivery.core.exceptions import ItemNotFound, UnknownItemField
 from ufo_delivery.utils.dto_utils import is_empty, dump_non_null_fields
 
 
 class ItemService:
-    def __init__(self, repository: ItemRepository):
+    def __init__(self, repository: ItemRepository, catalog_cache: CatalogCache):
         self._repository = repository
+        self._catalog_cache = catalog_cache
+
+    async def get_catalog(self) -> CatalogSnapshot:
+        """
+        Get current catalog snapshot. Database is queried only
+        if cached snapshot is missing, expired or invalidated.
+
+        Returns:
+            CatalogSnapshot with all Items and Categories.
+        """
+        return await self._catalog_cache.get_or_build(self._load_catalog)
 
     async def get(self, item_id: int) -> ItemDTO:
         """
-        Get Item from database.
+        Get Item from catalog.
 
         Args:
             item_id: ID of the Item to retrieve.
@@ -24,11 +38,40 @@ class ItemService:
         Returns:
             ItemDTO representing Item if found, otherwise None.
         """
-        item = await self._repository.get(item_id)
+        catalog = await self.get_catalog()
+
+        item = catalog.items.get(item_id)
         if not item:
             raise ItemNotFound
 
-        return item.to_dto()
+        return item
+
+    async def get_existing_ids(self, items_id: list[int]) -> set[int]:
+        """
+        Check which of given Item IDs exist, straight from database.
+
+        Returns:
+            Set of existing Item IDs.
+        """
+        return await self._repository.get_existing_ids(items_id)
+
+    async def get_json(self, item_id: int) -> CatalogPayload:
+        """
+        Get serialized Item from catalog. ItemNotFound will be raised if there is no such Item.
+
+        Args:
+            item_id: ID of the Item to retrieve.
+
+        Returns:
+            JSON representation of ItemDTO with ETag of current catalog.
+        """
+        catalog = await self.get_catalog()
+
+        item_json = catalog.get_item_json(item_id)
+        if item_json is None:
+            raise ItemNotFound
+
+        return item_json
 
     async def get_all(self, category_id: int | None = None) -> list[ItemDTO]:
         """
@@ -40,12 +83,62 @@ class ItemService:
         Returns:
             List of ItemDTOs representing Items.
         """
+        catalog = await self.get_catalog()
+
         if category_id:
-            items = await self._repository.get_all_in_category(category_id)
-        else:
-            items = await self._repository.get_all()
+            return list(catalog.items_by_category.get(category_id, []))
+
+        return list(catalog.items.values())
 
-        return [item.to_dto() for item in items]
+    async def get_all_json(self, category_id: int | None = None) -> CatalogPayload:
+        """
+        Get serialized list of all Items. Items in corresponding Category will
+        be returned if category_id is specified.
+        Args:
+            category_id: ID of category to get Items from.
+
+        Returns:
+            JSON representation of list of ItemDTOs with ETag of current catalog.
+        """
+        catalog = await self.get_catalog()
+        return catalog.get_items_json(category_id or None)
+
+    async def get_page(
+            self,
+            cursor: int | None,
+            limit: int,
+            fields: list[str] | None = None,
+            category_id: int | None = None,
+    ) -> ItemPage:
+        """
+        Get a page of Items ordered by ID straight from database, with only requested fields.
+        UnknownItemField will be raised if fields contain a name ItemDTO does not have.
+        Args:
+            cursor: next_cursor of the previous page, None for the first page.
+            limit: Maximum amount of Items in the page.
+            fields: Item fields to include. ID is always included, all fields if None.
+            category_id: ID of category to get Items from.
+
+        Returns:
+            ItemPage with Items and cursor of the next page, None if this page is the last one.
+        """
+        item_fields = list(PartialItemDTO.model_fields.keys())
+        if fields is None:
+            fields = item_fields
+
+        for field in fields:
+            if field not in item_fields:
+                raise UnknownItemField(field)
+
+        # One extra row tells whether there is a next page.
+        items = await self._repository.read_page(cursor, limit + 1, fields, category_id)
+        has_next = len(items) > limit
+        items = items[:limit]
+
+        return ItemPage.model_construct(
+            items=items,
+            next_cursor=items[-1].id if has_next else None,
+        )
 
     async def get_all_categories(self) -> list[CategoryDTO]:
         """
@@ -54,8 +147,18 @@ class ItemService:
         Returns:
             List of CategoryDTOs representing Categories.
         """
-        categories = await self._repository.get_all_categories()
-        return [category.to_dto() for category in categories]
+        catalog = await self.get_catalog()
+        return list(catalog.categories)
+
+    async def get_all_categories_json(self) -> CatalogPayload:
+        """
+        Get serialized list of all Categories.
+
+        Returns:
+            JSON representation of list of CategoryDTOs with ETag of current catalog.
+        """
+        catalog = await self.get_catalog()
+        return catalog.get_categories_json()
 
     async def add(self, data: CreateItem) -> ItemDTO:
         """
@@ -79,7 +182,7 @@ class ItemService:
 
         await self._repository.add(item)
         await self._repository.session.commit()
-        await self._repository.session.refresh(item)
+        self._catalog_cache.invalidate()
 
         return item.to_dto()
 
@@ -103,6 +206,7 @@ class ItemService:
 
         updated_item = await self._repository.update(item_id, dump_non_null_fields(data))
         await self._repository.session.commit()
+        self._catalog_cache.invalidate()
 
         return updated_item.to_dto()
 
@@ -119,3 +223,9 @@ class ItemService:
 
         await self._repository.delete(item.id)
         await self._repository.session.commit()
+        self._catalog_cache.invalidate()
+
+    async def _load_catalog(self) -> tuple[list[ItemDTO], list[CategoryDTO]]:
+        items = await self._repository.read_all()
+        categories = await self._repository.read_all_categories()
+        return items, categories
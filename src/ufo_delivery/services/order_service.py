@@ -1,119 +1,283 @@
 from ufo_delivery.repositories.db.orders import OrderRepository
-from ufo_delivery.repositories.db.items import ItemRepository
-from ufo_delivery.models.dto.orders import OrderDTO, AddItemToOrder, RemoveItemFromOrder
-from ufo_delivery.models.db.orders import Order, OrderItem
+from ufo_delivery.repositories.carts.base import Cart, CartStore
+from ufo_delivery.services.item_service import ItemService
+from ufo_delivery.models.dto.orders import (
+    OrderDTO,
+    OrderItemDTO,
+    AddItemToOrder,
+    RemoveItemFromOrder,
+    UpdateOrderItems,
+    PlacedOrderDTO,
+    PlacedOrderPage,
+    OrderStatus,
+)
+from ufo_delivery.models.db.orders import Order
+from ufo_delivery.core.cache import CatalogSnapshot
+from ufo_delivery.core.broadcast import FeedRelay
 from ufo_delivery.core.exceptions import (
     ItemNotFound,
     ItemNotInOrder,
     OrderIsEmpty,
+    OrderNotFound,
+    NoOrdersToClaim,
+    InvalidOrderStatusChange,
+    OrderClaimedByAnotherOperator,
 )
 
 
 class OrderService():
-    def __init__(self, repository: OrderRepository, item_repository: ItemRepository):
+    def __init__(
+            self,
+            repository: OrderRepository,
+            item_service: ItemService,
+            cart_store: CartStore,
+            order_feed: FeedRelay,
+    ):
         self._repository = repository
-        self._item_repository = item_repository
+        self._item_service = item_service
+        self._cart_store = cart_store
+        self._order_feed = order_feed
 
     async def get(self, user_id: int) -> OrderDTO:
         """
-        Get Order from database. New one will be created if User
-        with given ID does not have existing non-placed order.
+        Get non-placed Order (cart) of User with given ID.
         Args:
             user_id: ID of User whose order should be retrieved.
 
         Returns:
             OrderDTO representing Order.
         """
-        order = await self._repository.get_by_user_id(user_id)
-
-        if not order:
-            order = await self._create_new_order(user_id)
-
-        return order.to_dto()
+        cart = await self._cart_store.get(user_id)
+        return self._to_dto(cart, await self._item_service.get_catalog())
 
-    async def add_item_to_order(
-            self,
-            order_id: int,
-            user_id: int,
-            data: AddItemToOrder
-    ) -> OrderDTO:
+    async def add_item_to_order(self, user_id: int, data: AddItemToOrder) -> OrderDTO:
         """
-        Add Item to Order with given ID. New Order with added Item will be
-        created if User with given ID does not have existing non-placed order.
+        Add one unit of Item to Order of User with given ID.
 
         Args:
-            order_id: ID of Order to which Item should be added.
             user_id: ID of User to whose Order Item should be added.
             data: AddItemToOrder model containing data mandatory for adding Item to Order.
 
         Returns:
             OrderDTO representing Order with added Item.
         """
-        item = await self._item_repository.get(data.item_id)
-        if not item:
+        catalog = await self._item_service.get_catalog()
+        if data.item_id not in catalog.items:
             raise ItemNotFound
 
-        order = await self._repository.get_by_user_id(user_id)
-        if not order:
-            order = await self._create_new_order(user_id)
-            order_id = order.id
-
-        order_item = OrderItem(order=order, item=item, quantity=1)
-        await self._repository.add_item_to_order(order_id, order_item)
-        await self._repository.session.commit()
-
-        order = await self._repository.get(order_id)
-        return order.to_dto()
+        cart = await self._cart_store.update(user_id, {data.item_id: 1}, relative=True)
+        return self._to_dto(cart, catalog)
 
-    async def remove_item_from_order(self, order_id: int, data: RemoveItemFromOrder) -> OrderDTO:
+    async def remove_item_from_order(self, user_id: int, data: RemoveItemFromOrder) -> OrderDTO:
         """
-        Remove Item from current user's Order.
+        Remove one unit of Item from Order of User with given ID.
 
         Args:
-            order_id: ID of Order to which Item should be added.
+            user_id: ID of User from whose Order Item should be removed.
             data: RemoveItemToOrder model containing data mandatory for removing Item from Order.
 
         Returns:
             OrderDTO representing Order without removed Item.
         """
-        order_item = await self._repository.get_order_item(order_id, data.item_id)
-        if not order_item:
+        cart = await self._cart_store.remove_one(user_id, data.item_id)
+        if cart is None:
             raise ItemNotInOrder
 
-        try:
-            await self._repository.remove_item_from_order(order_id, order_item)
-        except ValueError as exc:
-            raise ItemNotInOrder from exc
+        return self._to_dto(cart, await self._item_service.get_catalog())
 
-        await self._repository.session.commit()
+    async def update_items(self, user_id: int, data: UpdateOrderItems) -> OrderDTO:
+        """
+        Change quantities of several Items in Order of User with given ID at once.
+        Items left with zero or negative quantity are removed from the Order.
+        ItemNotFound will be raised if any of given Items with positive quantity does not exist.
 
-        order = await self._repository.get(order_id)
-        return order.to_dto()
+        Args:
+            user_id: ID of User whose Order should be changed.
+            data: UpdateOrderItems model containing Items, their quantities and update mode.
 
-    async def place_order(self, user_id: int) -> OrderDTO:
+        Returns:
+            OrderDTO representing changed Order.
         """
-        Mark Order of User with given ID as placed.
+        quantities: dict[int, int] = {}
+        for change in data.items:
+            if data.mode == "add":
+                quantities[change.item_id] = quantities.get(change.item_id, 0) + change.quantity
+            else:
+                quantities[change.item_id] = change.quantity
+
+        catalog = await self._item_service.get_catalog()
+        # Items deleted from the catalog can still be removed from the cart.
+        if any(
+                item_id not in catalog.items and quantity > 0
+                for item_id, quantity in quantities.items()
+        ):
+            raise ItemNotFound
+
+        cart = await self._cart_store.update(user_id, quantities, relative=data.mode == "add")
+        return self._to_dto(cart, catalog)
+
+    async def place_order(self, user_id: int) -> PlacedOrderDTO:
+        """
+        Place Order of User with given ID and publish it to the operators feed. Items are
+        checked against the database, the ones which no longer exist are dropped from the cart.
+        OrderIsEmpty will be raised if no Item is left.
         Args:
             user_id: ID of User whose Order should be placed.
 
         Returns:
             OrderDTO representing placed Order
         """
-        order = await self._repository.get_by_user_id(user_id)
-        if not order:
-            order = await self._create_new_order(user_id)
-
-        if not order.order_items:
+        cart = await self._cart_store.take(user_id)
+        if not cart.items:
             raise OrderIsEmpty
 
-        await self._repository.set_order_placed(order)
+        items = cart.items
+        try:
+            existing_ids = await self._item_service.get_existing_ids(list(cart.items))
+            items = {
+                item_id: quantity
+                for item_id, quantity in cart.items.items()
+                if item_id in existing_ids
+            }
+            removed = {item_id: 0 for item_id in cart.items if item_id not in existing_ids}
+            if removed and cart.order_id is not None:
+                await self._repository.set_item_quantities(cart.order_id, removed)
+
+            if not items:
+                await self._repository.session.commit()
+                raise OrderIsEmpty
+
+            if cart.order_id is not None:
+                order_id = cart.order_id
+                await self._repository.set_order_placed(order_id)
+            else:
+                order_id = await self._repository.add_placed_order(user_id, items)
+
+            await self._repository.session.commit()
+        except BaseException:
+            # Carts kept outside the database are removed by take(), put the Items
+            # back on top of whatever the User has added in the meantime.
+            if cart.order_id is None and items:
+                await self._cart_store.update(user_id, items, relative=True)
+            raise
+
+        self._order_feed.notify()
+        return await self._repository.read_placed(order_id)
+
+    async def get_placed_page(
+            self,
+            cursor: int | None,
+            limit: int,
+            status: OrderStatus | None = None,
+    ) -> PlacedOrderPage:
+        """
+        Get a page of placed Orders ordered by ID.
+        Args:
+            cursor: next_cursor of the previous page, None for the first page.
+            limit: Maximum amount of Orders in the page.
+            status: Only Orders with this status are included, Orders with any status if None.
+
+        Returns:
+            PlacedOrderPage with Orders and cursor of the next page,
+            None if this page is the last one.
+        """
+        # One extra row tells whether there is a next page.
+        orders = await self._repository.read_placed_page(cursor, limit + 1, status)
+        has_next = len(orders) > limit
+        orders = orders[:limit]
+
+        return PlacedOrderPage.model_construct(
+            items=orders,
+            next_cursor=orders[-1].id if has_next else None,
+        )
+
+    async def get_placed_since(self, cursor: int | None, limit: int) -> PlacedOrderPage:
+        """
+        Get a page of placed Orders in the order they were placed.
+        Args:
+            cursor: placed_seq of the last Order already received, None for the first page.
+            limit: Maximum amount of Orders in the page.
+
+        Returns:
+            PlacedOrderPage with Orders and cursor of the next page,
+            None if this page is the last one.
+        """
+        orders = await self._repository.read_placed_since(cursor, limit + 1)
+        has_next = len(orders) > limit
+        orders = orders[:limit]
+
+        return PlacedOrderPage.model_construct(
+            items=orders,
+            next_cursor=orders[-1].placed_seq if has_next else None,
+        )
+
+    async def get_last_placed_seq(self) -> int:
+        """
+        Returns:
+            placed_seq of the last placed Order, 0 if there is none.
+        """
+        return await self._repository.get_last_placed_seq()
+
+    async def claim_next(self, operator_id: int) -> PlacedOrderDTO:
+        """
+        Claim the oldest placed Order nobody claimed yet for operator with given ID.
+        NoOrdersToClaim will be raised if there is no such Order.
+
+        Returns:
+            PlacedOrderDTO representing claimed Order.
+        """
+        order_id = await self._repository.claim_next(operator_id)
         await self._repository.session.commit()
-        await self._repository.session.refresh(order)
+        if order_id is None:
+            raise NoOrdersToClaim
+
+        return await self._repository.read_placed(order_id)
+
+    async def change_status(
+            self,
+            order_id: int,
+            operator_id: int,
+            status: OrderStatus,
+    ) -> PlacedOrderDTO:
+        """
+        Change status of placed Order with given ID on behalf of operator with given ID.
+        Orders claimed by an operator can only be changed by that operator. Changing status
+        back to placed releases the Order for other operators.
 
-        return order.to_dto()
+        Raises:
+            OrderNotFound if there is no placed Order with given ID.
+            InvalidOrderStatusChange if the Order can not be moved to given status.
+            OrderClaimedByAnotherOperator if the Order is claimed by someone else.
 
-    async def _create_new_order(self, user_id: int) -> Order:
-        order = Order(user_id=user_id, is_placed=False, order_items=[])
-        await self._repository.add(order)
+        Returns:
+            PlacedOrderDTO representing changed Order.
+        """
+        locked = await self._repository.lock_placed(order_id)
+        if locked is None:
+            raise OrderNotFound
+
+        current_status, current_operator_id = locked
+        if not Order.can_change_status(current_status, status):
+            raise InvalidOrderStatusChange(current_status.value, status.value)
+
+        if current_operator_id not in (None, operator_id):
+            raise OrderClaimedByAnotherOperator
+
+        new_operator_id = None if status == OrderStatus.PLACED else operator_id
+        await self._repository.set_status(order_id, status, new_operator_id)
         await self._repository.session.commit()
-        return order
+
+        return await self._repository.read_placed(order_id)
+
+    @staticmethod
+    def _to_dto(cart: Cart, catalog: CatalogSnapshot) -> OrderDTO:
+        return OrderDTO(
+            id=cart.order_id,
+            items=[
+                OrderItemDTO(item=catalog.items[item_id], quantity=quantity)
+                for item_id, quantity in sorted(cart.items.items())
+                if item_id in catalog.items
+            ],
+            is_placed=False,
+            status=OrderStatus.OPEN,
+        )
@@ -1,21 +1,31 @@
+from sqlalchemy.exc import IntegrityError
+
 from ufo_delivery.models.db.users import User, Address
 from ufo_delivery.models.dto.users import (
     UserDTO,
     AddressDTO,
+    Principal,
     EditAddress,
     CreateUser,
     EditUser,
 )
 from ufo_delivery.repositories.db.users import UserRepository
+from ufo_delivery.core.cache import PrincipalCache
 from ufo_delivery.core.security import AuthenticationManager
 from ufo_delivery.core.exceptions import UserAlreadyExistsException, UserNotFound
 from ufo_delivery.utils.dto_utils import is_empty, dump_non_null_fields
 
 
 class UserService:
-    def __init__(self, repository: UserRepository, auth_manager: AuthenticationManager):
+    def __init__(
+            self,
+            repository: UserRepository,
+            auth_manager: AuthenticationManager,
+            principal_cache: PrincipalCache,
+    ):
         self._repository = repository
         self._auth_manager = auth_manager
+        self._principal_cache = principal_cache
 
     async def get(self, user_id: int) -> UserDTO | None:
         """
@@ -41,6 +51,24 @@ class UserService:
 
         return user.to_dto()
 
+    async def is_token_current(self, principal: Principal) -> bool:
+        """
+        Check that access token of given Principal was not revoked by bumping the token version.
+        Served from PrincipalCache, falling back to database on a miss.
+        Returns:
+            False if the User no longer exists or the token version changed, otherwise True.
+        """
+        token_version = self._principal_cache.get(principal.id)
+        if token_version is None:
+            version = self._principal_cache.version()
+            token_version = await self._repository.get_token_version(principal.id)
+            if token_version is None:
+                return False
+
+            self._principal_cache.set(principal.id, token_version, version)
+
+        return token_version == principal.token_version
+
     async def add(self, data: CreateUser) -> UserDTO:
         """
         Creates new User. UserAlreadyExistsException will be
@@ -56,7 +84,7 @@ class UserService:
         if user:
             raise UserAlreadyExistsException
 
-        hashed_password = self._auth_manager.hash_password(data.password)
+        hashed_password = await self._auth_manager.hash_password(data.password)
         data.password = hashed_password
 
         user = User(
@@ -66,9 +94,13 @@ class UserService:
             address=Address(street=None, reference=None),
         )
 
-        await self._repository.add(user)
-        await self._repository.session.commit()
-        await self._repository.session.refresh(user)
+        # users.phone is unique, a concurrent registration with the same phone fails here.
+        try:
+            await self._repository.add(user)
+            await self._repository.session.commit()
+        except IntegrityError as exc:
+            await self._repository.session.rollback()
+            raise UserAlreadyExistsException from exc
 
         return user.to_dto()
 
@@ -90,12 +122,21 @@ class UserService:
         if is_empty(data):
             return user.to_dto()
 
+        updated_data = dump_non_null_fields(data)
         if data.password:
-            hashed_password = self._auth_manager.hash_password(data.password)
-            data.password = hashed_password
+            updated_data["password"] = await self._auth_manager.hash_password(data.password)
+            # Changing password signs out every session, including the current one.
+            updated_data["token_version"] = User.token_version + 1
 
-        updated_user = await self._repository.update(user_id, dump_non_null_fields(data))
-        await self._repository.session.commit()
+        try:
+            updated_user = await self._repository.update(user_id, updated_data)
+            await self._repository.session.commit()
+        except IntegrityError as exc:
+            await self._repository.session.rollback()
+            raise UserAlreadyExistsException from exc
+
+        if data.password:
+            self._principal_cache.invalidate(user_id)
 
         return updated_user.to_dto()
 
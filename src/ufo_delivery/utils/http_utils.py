@@ -0,0 +1,148 @@
+import inspect
+from functools import wraps
+from typing import Any, get_args, get_origin, get_type_hints
+from collections.abc import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+from ufo_delivery.core.cache import CatalogPayload
+from ufo_delivery.models.dto.items import ItemPage
+from ufo_delivery.models.dto.orders import PlacedOrderPage
+from config.config import settings
+
+_PAGE_ADAPTERS: dict[type, TypeAdapter] = {
+    page: TypeAdapter(get_type_hints(page)["items"])
+    for page in (ItemPage, PlacedOrderPage)
+}
+
+# Route options changing what FastAPI serializes, routes using any of them keep the usual path.
+_RESPONSE_MODEL_OPTIONS = (
+    "response_model_include",
+    "response_model_exclude",
+    "response_model_exclude_unset",
+    "response_model_exclude_defaults",
+    "response_model_exclude_none",
+)
+
+
+class DTOResponse(Response):
+    """
+    JSON response serializing already validated DTOs, or a list of them, in a single pass
+    of pydantic-core with given TypeAdapter. Models are serialized as the adapter's type,
+    so fields of subclasses not declared there are left out just like FastAPI does.
+    """
+    media_type = "application/json"
+
+    def __init__(
+            self,
+            content: Any,
+            adapter: TypeAdapter,
+            exclude_unset: bool = False,
+            **kwargs,
+    ):
+        self._adapter = adapter
+        self._exclude_unset = exclude_unset
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        return self._adapter.dump_json(content, by_alias=True, exclude_unset=self._exclude_unset)
+
+
+class DTORoute(APIRoute):
+    """
+    APIRoute answering with DTOResponse when the handler returns an instance of its response
+    model or a list of them. FastAPI would dump such DTOs to dicts, validate them against the
+    response model again and encode the result, which dominates the time of large responses.
+
+    Anything else returned by the handler, e.g. a Response, goes through the usual path, as do
+    routes excluding fields of the response model or setting headers through a Response parameter.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        self._dto_adapter: TypeAdapter | None = None
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._with_dto_response(endpoint)
+
+        super().__init__(path, endpoint, **kwargs)
+
+        if self._dto_type() is not None and not self.dependant.response_param_name and not any(
+                getattr(self, option) for option in _RESPONSE_MODEL_OPTIONS
+        ):
+            self._dto_adapter = TypeAdapter(self.response_model)
+
+    def _dto_type(self) -> type[BaseModel] | None:
+        model = self.response_model
+        if get_origin(model) is list:
+            model = get_args(model)[0]
+
+        return model if inspect.isclass(model) and issubclass(model, BaseModel) else None
+
+    def _is_dto(self, content: Any) -> bool:
+        dto_type = self._dto_type()
+        if get_origin(self.response_model) is list:
+            return isinstance(content, list) and all(isinstance(item, dto_type) for item in content)
+
+        return isinstance(content, dto_type)
+
+    def _with_dto_response(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        # FastAPI reads parameters and return annotation through __wrapped__ set by wraps().
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            content = await endpoint(*args, **kwargs)
+            if self._dto_adapter is None or not self._is_dto(content):
+                return content
+
+            return DTOResponse(content, self._dto_adapter, status_code=self.status_code or 200)
+
+        return wrapper
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check if If-None-Match header of given request matches given ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    candidates = (candidate.strip().removeprefix("W/") for candidate in if_none_match.split(","))
+    return etag in candidates
+
+
+def catalog_response(request: Request, payload: CatalogPayload) -> Response:
+    """
+    Build a cacheable JSON response from given catalog payload.
+    304 Not Modified with empty body is returned if client already has this version.
+    """
+    headers = {
+        "ETag": payload.etag,
+        "Cache-Control": f"public, max-age={settings.cache.catalog_max_age}, must-revalidate",
+    }
+
+    if is_not_modified(request, payload.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(payload.body, media_type="application/json", headers=headers)
+
+
+def page_response(page: ItemPage | PlacedOrderPage) -> Response:
+    """
+    Build a JSON response with list of entries from given page. Only fields set on the entries
+    are serialized. Cursor of the next page, if any, is sent in X-Next-Cursor header.
+    """
+    headers = {}
+    if page.next_cursor is not None:
+        headers["X-Next-Cursor"] = str(page.next_cursor)
+
+    return DTOResponse(
+        page.items,
+        _PAGE_ADAPTERS[type(page)],
+        exclude_unset=True,
+        headers=headers,
+    )
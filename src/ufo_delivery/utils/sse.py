@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterator
+
+from ufo_delivery.core.broadcast import (
+    Broadcaster,
+    FeedMessage,
+    Subscription,
+    SubscriptionClosed,
+)
+
+
+def format_event(message: FeedMessage, event: str) -> bytes:
+    """
+    Format given message as a Server-Sent Event with message ID as event ID.
+    """
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (message.id, event.encode(), message.data)
+
+
+async def stream_events(  # pylint: disable=too-many-arguments
+        broadcaster: Broadcaster,
+        subscription: Subscription,
+        backlog: list[FeedMessage],
+        event: str,
+        keepalive: float,
+        *,
+        resync_id: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream given backlog followed by messages of given subscription as Server-Sent Events.
+    Message IDs have to increase in the order messages become visible to the backlog query
+    and messages of the subscription have to arrive in ID order, messages published while
+    the backlog query ran are then skipped if the backlog already has them.
+
+    If resync_id is given, the backlog was too long to be sent: a "resync" event with
+    resync_id as its ID is sent instead, after which the client should reload what it missed.
+
+    A comment is sent after keepalive seconds without messages so proxies keep the connection
+    open. The subscription is removed from the broadcaster when the stream ends or the client
+    disconnects.
+    """
+    try:
+        if resync_id is not None:
+            last_id = resync_id
+            yield format_event(FeedMessage(resync_id, b"{}"), "resync")
+        else:
+            last_id = max((message.id for message in backlog), default=0)
+            for message in backlog:
+                yield format_event(message, event)
+
+        while True:
+            try:
+                message = await subscription.get(keepalive)
+            except SubscriptionClosed:
+                return
+
+            if message is None:
+                yield b": keepalive\n\n"
+            elif message.id > last_id:
+                last_id = message.id
+                yield format_event(message, event)
+    finally:
+        broadcaster.unsubscribe(subscription)
@@ -0,0 +1,93 @@
+import os
+import random
+import shutil
+import asyncio
+from typing import Any, NamedTuple
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+# Settings are read on import of the application modules.
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-test-secret-key-test-secret")
+os.environ.setdefault("JWT_ALGORITHM", "HS256")
+# Seeding hashes one password, the lowest bcrypt cost keeps it fast.
+os.environ.setdefault("PASSWORD_HASH_ROUNDS", "4")
+
+# pylint: disable=wrong-import-position
+from sqlalchemy import make_url
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.seed import Dataset, Sizes, seed
+from ufo_delivery.core.query_stats import QueryInstrumentation, QueryStats, current_query_stats
+
+SIZES = Sizes(
+    categories=4,
+    items=20,
+    users=10,
+    operators=2,
+    orders=30,
+    queue=5,
+    max_order_items=3,
+)
+
+
+class SeededDatabase(NamedTuple):
+    url: str
+    sizes: Sizes
+    dataset: Dataset
+
+
+@pytest.fixture(name="database", scope="session")
+def fixture_database(tmp_path_factory) -> SeededDatabase:
+    """
+    SQLite file with a small catalog and order history, shared by all tests which only read it.
+    """
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('db') / 'test.sqlite'}"
+
+    async def run() -> Dataset:
+        engine = create_async_engine(url)
+        try:
+            return await seed(engine, SIZES, random.Random(0))
+        finally:
+            await engine.dispose()
+
+    return SeededDatabase(url, SIZES, asyncio.run(run()))
+
+
+@pytest.fixture(name="writable_database")
+def fixture_writable_database(database, tmp_path) -> SeededDatabase:
+    """
+    Copy of the seeded database for a test changing it.
+    """
+    path = tmp_path / "test.sqlite"
+    shutil.copyfile(make_url(database.url).database, path)
+    return database._replace(url=f"sqlite+aiosqlite:///{path}")
+
+
+QueryCounter = Callable[[Callable[[AsyncSession], Awaitable]], tuple[Any, QueryStats]]
+
+
+@pytest.fixture
+def count_queries(database) -> QueryCounter:
+    """
+    Runs given coroutine function with a new session of the seeded database.
+    Returns its result and QueryStats of statements it executed.
+    """
+    def count(call: Callable[[AsyncSession], Awaitable]) -> tuple[Any, QueryStats]:
+        async def run() -> tuple[Any, QueryStats]:
+            engine = create_async_engine(database.url, poolclass=NullPool)
+            QueryInstrumentation(slow_threshold=0, repeated_threshold=0).attach(engine.sync_engine)
+            stats = QueryStats({"type": "http", "method": "TEST"})
+            token = current_query_stats.set(stats)
+            try:
+                async with AsyncSession(engine) as session:
+                    result = await call(session)
+            finally:
+                current_query_stats.reset(token)
+                await engine.dispose()
+            return result, stats
+
+        return asyncio.run(run())
+
+    return count
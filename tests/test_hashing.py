@@ -0,0 +1,44 @@
+import asyncio
+from threading import Event
+
+import pytest
+
+from ufo_delivery.core.exceptions import TooManyRequestsException
+from ufo_delivery.core.hashing import HashingExecutor
+
+
+def test_cancelled_call_stays_pending_until_it_finishes():
+    """
+    Cancelling the caller does not free the worker, so the call is counted until it returns.
+    """
+    executor = HashingExecutor(workers=1, max_queue=0)
+    started = Event()
+    release = Event()
+
+    def work() -> None:
+        started.set()
+        release.wait(5)
+
+    async def run() -> list[int]:
+        task = asyncio.create_task(executor.run(work))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        pending = [executor.pending]
+
+        with pytest.raises(TooManyRequestsException):
+            await executor.run(work)
+
+        release.set()
+        for _ in range(500):
+            if not executor.pending:
+                break
+            await asyncio.sleep(0.01)
+        pending.append(executor.pending)
+        return pending
+
+    try:
+        assert asyncio.run(run()) == [1, 0]
+    finally:
+        release.set()
+        executor.shutdown()
@@ -0,0 +1,98 @@
+import asyncio
+
+from fastapi import Request
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from ufo_delivery.core.cache import CatalogCache, CatalogPayload
+from ufo_delivery.core.invalidation import LocalInvalidationChannel
+from ufo_delivery.models.dto.items import EditItem
+from ufo_delivery.repositories.db.items import ItemRepository
+from ufo_delivery.services.item_service import ItemService
+from ufo_delivery.utils.http_utils import catalog_response, is_not_modified
+
+ETAG = '"0123456789abcdef"'
+PAYLOAD = CatalogPayload(b"[]", ETAG)
+
+
+def build_request(if_none_match: str | None = None) -> Request:
+    """
+    Returns:
+        GET request with given If-None-Match header, without it if None.
+    """
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/items", "headers": headers})
+
+
+def test_is_not_modified():
+    """
+    If-None-Match matches the ETag itself, its weak form, any ETag of a list and *.
+    """
+    assert is_not_modified(build_request(ETAG), ETAG)
+    assert is_not_modified(build_request(f"W/{ETAG}"), ETAG)
+    assert is_not_modified(build_request(f'"other", {ETAG}'), ETAG)
+    assert is_not_modified(build_request(f'W/"other",W/{ETAG}'), ETAG)
+    assert is_not_modified(build_request("*"), ETAG)
+
+
+def test_is_modified():
+    """
+    Missing If-None-Match or one with other ETags does not match.
+    """
+    assert not is_not_modified(build_request(), ETAG)
+    assert not is_not_modified(build_request(""), ETAG)
+    assert not is_not_modified(build_request('"other"'), ETAG)
+    assert not is_not_modified(build_request('"other", W/"another"'), ETAG)
+    # An ETag without quotes is a different one.
+    assert not is_not_modified(build_request(ETAG.strip('"')), ETAG)
+
+
+def test_catalog_response():
+    """
+    The body is sent with its ETag unless the client has it, then 304 is sent without a body.
+    """
+    response = catalog_response(build_request('"other"'), PAYLOAD)
+    assert response.status_code == 200
+    assert response.body == PAYLOAD.body
+    assert response.headers["ETag"] == ETAG
+    assert "must-revalidate" in response.headers["Cache-Control"]
+
+    response = catalog_response(build_request(ETAG), PAYLOAD)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == ETAG
+
+
+def test_etag_changes_after_invalidation(writable_database):
+    """
+    Changing an Item invalidates the catalog, clients holding the previous ETag get the new body.
+    """
+    item_id = writable_database.dataset.item_ids[0]
+
+    async def run() -> tuple[CatalogPayload, CatalogPayload, CatalogPayload]:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service = ItemService(
+                    ItemRepository(session),
+                    CatalogCache(ttl=60, channel=LocalInvalidationChannel()),
+                )
+                before = await service.get_all_json()
+                cached = await service.get_all_json()
+                await service.edit(item_id, EditItem(name="Renamed"))
+                after = await service.get_all_json()
+        finally:
+            await engine.dispose()
+        return before, cached, after
+
+    before, cached, after = asyncio.run(run())
+    assert cached.etag == before.etag
+    assert after.etag != before.etag
+    assert b"Renamed" in after.body
+
+    assert catalog_response(build_request(before.etag), before).status_code == 304
+    response = catalog_response(build_request(before.etag), after)
+    assert response.status_code == 200
+    assert response.headers["ETag"] == after.etag
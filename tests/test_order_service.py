@@ -0,0 +1,287 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from ufo_delivery.core.cache import CatalogCache
+from ufo_delivery.core.broadcast import Broadcaster, FeedMessage, FeedRelay
+from ufo_delivery.core.exceptions import (
+    ItemNotFound,
+    OrderIsEmpty,
+    OrderNotFound,
+    InvalidOrderStatusChange,
+    OrderClaimedByAnotherOperator,
+)
+from ufo_delivery.core.invalidation import (
+    InvalidationChannel,
+    LocalInvalidationChannel,
+    FileInvalidationChannel,
+)
+from ufo_delivery.models.dto.items import CreateItem
+from ufo_delivery.models.dto.orders import OrderItemQuantity, OrderStatus, UpdateOrderItems
+from ufo_delivery.repositories.carts.base import CartStore
+from ufo_delivery.repositories.carts.memory import InMemoryCartStore
+from ufo_delivery.repositories.db.items import ItemRepository
+from ufo_delivery.models.db.orders import Order
+from ufo_delivery.repositories.db.orders import OrderRepository
+from ufo_delivery.services.item_service import ItemService
+from ufo_delivery.services.order_service import OrderService
+
+
+def build_relay(
+        session: AsyncSession,
+        broadcaster: Broadcaster,
+        channel: InvalidationChannel,
+) -> FeedRelay:
+    """
+    Returns:
+        FeedRelay of placed Orders read in given session to given Broadcaster.
+    """
+    repository = OrderRepository(session)
+
+    async def read_since(after_seq: int) -> list[FeedMessage]:
+        orders = await repository.read_placed_since(after_seq, 100)
+        return [FeedMessage(order.placed_seq, order.model_dump_json().encode()) for order in orders]
+
+    return FeedRelay(
+        broadcaster,
+        channel,
+        "placed-orders",
+        read_last_id=repository.get_last_placed_seq,
+        read_since=read_since,
+    )
+
+
+def build_services(
+        session: AsyncSession,
+        cart_store: CartStore,
+        order_feed: FeedRelay | None = None,
+) -> tuple[OrderService, ItemService]:
+    """
+    Returns:
+        OrderService over given session and cart store and its ItemService,
+        with a catalog cache and, unless given, a feed of their own.
+    """
+    item_service = ItemService(
+        ItemRepository(session),
+        CatalogCache(ttl=60, channel=LocalInvalidationChannel()),
+    )
+    order_service = OrderService(
+        OrderRepository(session),
+        item_service,
+        cart_store,
+        order_feed or build_relay(
+            session,
+            Broadcaster(queue_size=10, max_subscribers=10),
+            LocalInvalidationChannel(),
+        ),
+    )
+    return order_service, item_service
+
+
+async def add_item(item_service: ItemService, category_id: int) -> int:
+    """
+    Returns:
+        ID of a new Item, which unlike seeded ones is in no placed Order and can be deleted.
+    """
+    item = await item_service.add(CreateItem(
+        name="Deleted soon",
+        description="",
+        price=1.0,
+        image_path="",
+        categories=[category_id],
+    ))
+    return item.id
+
+
+def test_item_deleted_from_cart(writable_database):
+    """
+    An Item deleted from the catalog while in a cart is dropped when the Order is placed.
+    """
+    customer_id = writable_database.sizes.operators + 1
+    kept_id = writable_database.dataset.item_ids[0]
+    category_id = writable_database.dataset.category_ids[0]
+
+    async def run() -> tuple:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        cart_store = InMemoryCartStore()
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service, item_service = build_services(session, cart_store)
+                deleted_id = await add_item(item_service, category_id)
+                await cart_store.update(customer_id, {kept_id: 2, deleted_id: 1})
+                await item_service.delete(deleted_id)
+
+                placed = await service.place_order(customer_id)
+                left = await cart_store.get(customer_id)
+        finally:
+            await engine.dispose()
+        return placed, left
+
+    placed, left = asyncio.run(run())
+    assert [(item.item.id, item.quantity) for item in placed.items] == [(kept_id, 2)]
+    assert not left.items
+
+
+def test_only_deleted_items_in_cart(writable_database):
+    """
+    A cart left without existing Items is emptied, and deleted Items can be removed from a cart.
+    """
+    customer_id = writable_database.sizes.operators + 1
+    other_id = writable_database.dataset.item_ids[0]
+    category_id = writable_database.dataset.category_ids[0]
+
+    async def run() -> tuple:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        cart_store = InMemoryCartStore()
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service, item_service = build_services(session, cart_store)
+                deleted_id = await add_item(item_service, category_id)
+                await cart_store.update(customer_id, {deleted_id: 1})
+                await item_service.delete(deleted_id)
+
+                with pytest.raises(OrderIsEmpty):
+                    await service.place_order(customer_id)
+                emptied = await cart_store.get(customer_id)
+
+                await cart_store.update(customer_id, {deleted_id: 1, other_id: 1})
+                with pytest.raises(ItemNotFound):
+                    await service.update_items(customer_id, UpdateOrderItems(
+                        items=[OrderItemQuantity(item_id=deleted_id, quantity=1)],
+                    ))
+                await service.update_items(customer_id, UpdateOrderItems(
+                    items=[OrderItemQuantity(item_id=deleted_id, quantity=0)],
+                ))
+                left = await cart_store.get(customer_id)
+        finally:
+            await engine.dispose()
+        return emptied, left
+
+    emptied, left = asyncio.run(run())
+    assert not emptied.items
+    assert left.items == {other_id: 1}
+
+
+def test_placed_order_relayed_to_every_worker(writable_database, tmp_path):
+    """
+    An Order placed through one worker reaches subscribers of every worker once, in order.
+    """
+    customer_id = writable_database.sizes.operators + 1
+    item_id = writable_database.dataset.item_ids[0]
+
+    async def run() -> tuple:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        feeds = [Broadcaster(queue_size=10, max_subscribers=10) for _ in range(2)]
+        try:
+            async with (
+                AsyncSession(engine, expire_on_commit=False) as session,
+                AsyncSession(engine, expire_on_commit=False) as other_session,
+            ):
+                # Workers share the directory of version files, not the channel instance.
+                relays = [
+                    build_relay(session, feeds[0], FileInvalidationChannel(str(tmp_path))),
+                    build_relay(other_session, feeds[1], FileInvalidationChannel(str(tmp_path))),
+                ]
+                for relay in relays:
+                    await relay.start()
+                subscriptions = [feed.subscribe() for feed in feeds]
+
+                cart_store = InMemoryCartStore()
+                service, _ = build_services(session, cart_store, relays[0])
+                placed = []
+                for _ in range(2):
+                    await cart_store.update(customer_id, {item_id: 1})
+                    placed.append(await service.place_order(customer_id))
+
+                for relay in relays:
+                    await relay.poll()
+                    await relay.poll()
+                received = [
+                    [await subscription.get(0.01) for _ in range(3)]
+                    for subscription in subscriptions
+                ]
+        finally:
+            await engine.dispose()
+        return placed, received
+
+    placed, received = asyncio.run(run())
+    for messages in received:
+        assert [message.id for message in messages[:2]] == [order.placed_seq for order in placed]
+        assert messages[2] is None
+
+
+def test_claim_next(writable_database):
+    """
+    Operators claim the oldest placed Orders one by one, each Order once.
+    """
+    operator_ids = [1, 2]
+
+    async def run() -> tuple:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                placed_ids = list(await session.scalars(
+                    select(Order.id).where(Order.status == OrderStatus.PLACED).order_by(Order.id)
+                ))
+                service, _ = build_services(session, InMemoryCartStore())
+                claimed = [await service.claim_next(operator_id) for operator_id in operator_ids]
+        finally:
+            await engine.dispose()
+        return placed_ids, claimed
+
+    placed_ids, claimed = asyncio.run(run())
+    assert [order.id for order in claimed] == placed_ids[:2]
+    assert [order.operator_id for order in claimed] == operator_ids
+    assert all(order.status == OrderStatus.CLAIMED for order in claimed)
+
+
+def test_change_status(writable_database):
+    """
+    Claimed Orders are changed only by their operator and only along allowed transitions.
+    Releasing an Order back to placed lets other operators claim it.
+    """
+    operator_id, other_operator_id = 1, 2
+
+    async def run() -> tuple:
+        engine = create_async_engine(writable_database.url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service, _ = build_services(session, InMemoryCartStore())
+                order = await service.claim_next(operator_id)
+
+                errors = []
+                expected = (InvalidOrderStatusChange, OrderClaimedByAnotherOperator)
+                for changing_operator_id, status in (
+                        (operator_id, OrderStatus.DELIVERED),
+                        (operator_id, OrderStatus.OPEN),
+                        (other_operator_id, OrderStatus.DISPATCHED),
+                ):
+                    with pytest.raises(expected) as error:
+                        await service.change_status(order.id, changing_operator_id, status)
+                    errors.append((type(error.value), error.value.status_code))
+
+                with pytest.raises(OrderNotFound):
+                    await service.change_status(0, operator_id, OrderStatus.CANCELLED)
+
+                released = await service.change_status(order.id, operator_id, OrderStatus.PLACED)
+                reclaimed = await service.claim_next(other_operator_id)
+                dispatched = await service.change_status(
+                    order.id, other_operator_id, OrderStatus.DISPATCHED
+                )
+        finally:
+            await engine.dispose()
+        return order, errors, released, reclaimed, dispatched
+
+    order, errors, released, reclaimed, dispatched = asyncio.run(run())
+    assert errors == [
+        (InvalidOrderStatusChange, 409),
+        (InvalidOrderStatusChange, 409),
+        (OrderClaimedByAnotherOperator, 409),
+    ]
+    assert (released.status, released.operator_id) == (OrderStatus.PLACED, None)
+    assert (reclaimed.id, reclaimed.operator_id) == (order.id, other_operator_id)
+    assert dispatched.status == OrderStatus.DISPATCHED
+    assert dispatched.operator_id == other_operator_id
@@ -0,0 +1,86 @@
+from ufo_delivery.repositories.db.items import ItemRepository
+from ufo_delivery.repositories.db.orders import OrderRepository
+
+# Every seeded Item is in this many categories.
+ITEM_CATEGORIES = 2
+
+
+def test_read_all_items(database, count_queries):
+    """
+    Items and their categories are read with one query each, whatever the amount of Items.
+    """
+    items, stats = count_queries(lambda session: ItemRepository(session).read_all())
+
+    assert len(items) == database.sizes.items
+    assert stats.statements == 2
+    assert stats.rows == database.sizes.items * (1 + ITEM_CATEGORIES)
+
+
+def test_read_item_page_in_category(database, count_queries):
+    """
+    A page of Items of a category and their categories are read with one query each.
+    """
+    category_id = database.dataset.category_ids[0]
+    page, stats = count_queries(
+        lambda session: ItemRepository(session).read_page(
+            None, database.sizes.items, ["name", "categories"], category_id
+        )
+    )
+
+    assert page
+    assert stats.statements == 2
+    assert stats.rows == len(page) * (1 + ITEM_CATEGORIES)
+
+
+def test_get_item(database, count_queries):
+    """
+    An Item is loaded with its categories in two queries.
+    """
+    item_id = database.dataset.item_ids[0]
+    item, stats = count_queries(lambda session: ItemRepository(session).get(item_id))
+
+    assert item.id == item_id
+    assert stats.statements == 2
+    assert stats.rows == 1 + ITEM_CATEGORIES
+
+
+def test_read_all_categories(database, count_queries):
+    """
+    Categories are read with a single query.
+    """
+    categories, stats = count_queries(
+        lambda session: ItemRepository(session).read_all_categories()
+    )
+
+    assert len(categories) == database.sizes.categories
+    assert stats.statements == 1
+    assert stats.rows == database.sizes.categories
+
+
+def test_read_item_page(count_queries):
+    """
+    A page of sparse fields takes one query, categories of the page one more.
+    """
+    page, stats = count_queries(
+        lambda session: ItemRepository(session).read_page(None, 10, ["name", "price"])
+    )
+    assert len(page) == 10
+    assert (stats.statements, stats.rows) == (1, 10)
+
+    page, stats = count_queries(
+        lambda session: ItemRepository(session).read_page(None, 10, ["name", "categories"])
+    )
+    assert len(page) == 10
+    assert (stats.statements, stats.rows) == (2, 10 * (1 + ITEM_CATEGORIES))
+
+
+def test_read_placed_page(count_queries):
+    """
+    Placed Orders with customers, their Items and categories of the Items take three queries.
+    """
+    orders, stats = count_queries(
+        lambda session: OrderRepository(session).read_placed_page(None, 10)
+    )
+
+    assert len(orders) == 10
+    assert stats.statements == 3
@@ -0,0 +1,87 @@
+import re
+import sqlite3
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from ufo_delivery.repositories.db.items import ItemRepository
+from ufo_delivery.repositories.db.orders import OrderRepository
+from ufo_delivery.repositories.db.users import UserRepository
+
+
+def query_plans(database, call) -> list[list[str]]:
+    """
+    Run given coroutine function with a new session of the seeded database.
+
+    Returns:
+        Details of EXPLAIN QUERY PLAN of every statement it executed, in order of execution.
+    """
+    executed = []
+
+    async def run() -> None:
+        engine = create_async_engine(database.url, poolclass=NullPool)
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, parameters, *args: executed.append(
+                (statement, parameters)
+            ),
+        )
+        try:
+            async with AsyncSession(engine) as session:
+                await call(session)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+    with sqlite3.connect(make_url(database.url).database) as connection:
+        return [
+            [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            for statement, parameters in executed
+        ]
+
+
+def uses_index(plan: list[str], table: str, index: str) -> bool:
+    """
+    Whether given plan searches given table, under its name or an alias, through given index.
+    """
+    pattern = re.compile(rf"SEARCH {table}(_\d+)? USING (COVERING )?INDEX {index} ")
+    return any(pattern.match(detail) for detail in plan)
+
+
+def test_user_by_phone(database):
+    """
+    Users logging in are found by the unique index of phone numbers.
+    """
+    phone = database.dataset.customer_phones[0]
+    plans = query_plans(database, lambda session: UserRepository(session).get_by_phone(phone))
+
+    assert uses_index(plans[0], "users", "ix_users_phone")
+
+
+def test_open_order(database):
+    """
+    The cart of a User is found by the index of User and placement, without reading orders.
+    """
+    user_id = database.sizes.operators + 1
+    plans = query_plans(
+        database, lambda session: OrderRepository(session).get_open_order_id(user_id)
+    )
+
+    assert uses_index(plans[0], "orders", "ix_orders_user_id_is_placed")
+
+
+def test_items_in_category(database):
+    """
+    Items of a category are found by the index of categories of Items.
+    """
+    category_id = database.dataset.category_ids[0]
+    plans = query_plans(
+        database,
+        lambda session: ItemRepository(session).read_page(None, 10, ["name"], category_id),
+    )
+    assert uses_index(plans[0], "item_category", "ix_item_category_category_id")
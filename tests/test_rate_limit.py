@@ -0,0 +1,223 @@
+import os
+import socket
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from main import build_app
+from ufo_delivery.core.redis import RedisClient, RedisUnavailable
+from ufo_delivery.core.exceptions import TooManyRequestsException
+from ufo_delivery.core.rate_limit import InMemoryRateLimiter, LoginLimiter, RedisRateLimiter
+from ufo_delivery.core.dependencies.db import session_manager
+from ufo_delivery.core.dependencies.auth.login_limiter import get_login_limiter
+from ufo_delivery.core.dependencies.auth.authentication_manager import hashing_executor
+
+# Server speaking the Redis protocol to run the token bucket script against,
+# e.g. redis://localhost:6379/15.
+REDIS_URL = os.environ.get("TEST_REDIS_URL")
+
+
+class Clock:
+    """
+    Clock standing still until moved by a test.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _serve_once(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Replies to the first command like a server would, then closes the connection
+    # like a server dropping idle clients.
+    await reader.readuntil(b"\r\n")
+    writer.write(b"+PONG\r\n")
+    await writer.drain()
+    writer.close()
+
+
+def test_dead_pooled_connection_is_replaced():
+    """
+    A command sent over a pooled connection the server has closed is sent again over a new one.
+    """
+    async def run() -> list:
+        server = await asyncio.start_server(_serve_once, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = RedisClient(f"redis://127.0.0.1:{port}", pool_size=1, timeout=1)
+        async with server:
+            replies = [await client.execute("PING")]
+            await asyncio.sleep(0.05)
+            replies.append(await client.execute("PING"))
+            await client.close()
+        return replies
+
+    assert asyncio.run(run()) == [b"PONG", b"PONG"]
+
+
+def test_unavailable_server_allows_attempts():
+    """
+    Attempts are allowed while the server can not be reached.
+    """
+    # Nothing listens on a port released right after binding, connections are refused.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    async def run() -> float:
+        client = RedisClient(f"redis://127.0.0.1:{port}", timeout=1)
+        with pytest.raises(RedisUnavailable):
+            await client.execute("PING")
+
+        limiter = RedisRateLimiter(client, burst=1, rate=1, prefix="test")
+        return await limiter.acquire(b"key")
+
+    assert asyncio.run(run()) == 0
+
+
+@pytest.mark.skipif(REDIS_URL is None, reason="TEST_REDIS_URL is not set")
+def test_token_bucket_script():
+    """
+    Burst attempts are allowed at once, the next one has to wait until a token is refilled.
+    """
+    async def run() -> list[float]:
+        client = RedisClient(REDIS_URL)
+        key = os.urandom(8)
+        limiter = RedisRateLimiter(client, burst=3, rate=0.5, prefix="test-login-limit")
+        try:
+            return [await limiter.acquire(key) for _ in range(4)]
+        finally:
+            await client.execute("DEL", b"test-login-limit:" + key)
+            await limiter.close()
+
+    *allowed, retry_after = asyncio.run(run())
+    assert allowed == [0, 0, 0]
+    assert 1.9 < retry_after <= 2
+
+
+def test_memory_burst_and_refill():
+    """
+    Burst attempts are allowed at once, then one more for every refilled token.
+    """
+    clock = Clock()
+    limiter = InMemoryRateLimiter(burst=3, rate=0.5, max_keys=10, clock=clock)
+
+    async def run() -> list[float]:
+        retries = [await limiter.acquire(b"key") for _ in range(4)]
+        clock.now += 1
+        retries.append(await limiter.acquire(b"key"))
+        clock.now += 1
+        retries.append(await limiter.acquire(b"key"))
+        retries.append(await limiter.acquire(b"other"))
+        return retries
+
+    assert asyncio.run(run()) == [0, 0, 0, 2, 1, 0, 0]
+
+
+def test_memory_bucket_expires_when_full():
+    """
+    A bucket idle until it is full again is dropped and starts over with the whole burst.
+    """
+    clock = Clock()
+    limiter = InMemoryRateLimiter(burst=2, rate=1, max_keys=10, clock=clock)
+
+    async def run() -> list[float]:
+        retries = [await limiter.acquire(b"key") for _ in range(3)]
+        clock.now += limiter.refill_time
+        retries.extend([await limiter.acquire(b"key") for _ in range(3)])
+        return retries
+
+    assert asyncio.run(run()) == [0, 0, 1, 0, 0, 1]
+
+
+def test_memory_least_recently_used_evicted():
+    """
+    At most max_keys buckets are kept, the least recently used one is forgotten first.
+    """
+    limiter = InMemoryRateLimiter(burst=1, rate=0.1, max_keys=2, clock=Clock())
+
+    async def run() -> list[float]:
+        retries = [await limiter.acquire(key) for key in (b"a", b"b", b"a", b"c")]
+        # Bucket of b was used least recently when c was added.
+        retries.extend([await limiter.acquire(key) for key in (b"a", b"b")])
+        return retries
+
+    assert asyncio.run(run()) == [0, 0, 10, 0, 10, 0]
+
+
+def test_login_limits_by_phone_and_client():
+    """
+    Attempts are limited for every phone number and for every client address apart.
+    """
+    clock = Clock()
+    limiter = LoginLimiter(
+        InMemoryRateLimiter(burst=1, rate=0.1, max_keys=10, clock=clock),
+        InMemoryRateLimiter(burst=2, rate=0.25, max_keys=10, clock=clock),
+    )
+
+    async def check(phone: str, client_host: str | None) -> str | None:
+        try:
+            await limiter.check(phone, client_host)
+        except TooManyRequestsException as error:
+            return error.headers["Retry-After"]
+        return None
+
+    async def run() -> list[str | None]:
+        return [
+            await check("+10000000001", "10.0.0.1"),
+            # Same phone from another client.
+            await check("+10000000001", "10.0.0.2"),
+            await check("+10000000002", "10.0.0.1"),
+            # Another phone from a client whose attempts are exhausted.
+            await check("+10000000003", "10.0.0.1"),
+            await check("+10000000004", None),
+        ]
+
+    assert asyncio.run(run()) == [None, "10", None, "4", None]
+
+
+def test_limited_login_costs_nothing(database, monkeypatch):
+    """
+    A rejected login attempt is answered with 429 and Retry-After,
+    without querying the database or hashing the password.
+    """
+    phone = database.dataset.customer_phones[0]
+    limiter = LoginLimiter(
+        InMemoryRateLimiter(burst=1, rate=1 / 60, max_keys=10, clock=Clock()),
+        None,
+    )
+    asyncio.run(limiter.check(phone, None))
+
+    engine = create_async_engine(database.url, poolclass=NullPool)
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    monkeypatch.setattr(session_manager, "session_factory", async_sessionmaker(engine))
+
+    hashes = []
+
+    async def run(function, *args):
+        hashes.append(function)
+        return function(*args)
+
+    monkeypatch.setattr(hashing_executor, "run", run)
+
+    app = build_app()
+    app.dependency_overrides[get_login_limiter] = lambda: limiter
+    response = TestClient(app).post(
+        "/auth/login", json={"phone": phone, "password": database.dataset.password}
+    )
+    asyncio.run(engine.dispose())
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert not statements
+    assert not hashes
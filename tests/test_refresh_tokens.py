@@ -0,0 +1,134 @@
+import asyncio
+from time import time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from ufo_delivery.core.exceptions import InvalidCredentialsException
+from ufo_delivery.core.rate_limit import LoginLimiter
+from ufo_delivery.core.dependencies.auth.authentication_manager import authentication_manager
+from ufo_delivery.core.dependencies.auth.password_rehash import password_rehashes
+from ufo_delivery.models.db.users import RefreshToken
+from ufo_delivery.models.dto.users import LoginCredentials
+from ufo_delivery.repositories.db.users import UserRepository
+from ufo_delivery.repositories.db.refresh_tokens import RefreshTokenRepository
+from ufo_delivery.services.auth_service import AuthService
+
+DAY = 24 * 60 * 60
+
+
+def build_auth_service(session: AsyncSession, refresh_token_ttl: int = DAY) -> AuthService:
+    """
+    Returns:
+        AuthService over given session without login limits.
+    """
+    return AuthService(
+        UserRepository(session),
+        RefreshTokenRepository(session),
+        authentication_manager,
+        password_rehashes,
+        LoginLimiter(None, None),
+        refresh_token_ttl,
+    )
+
+
+async def count_refresh_tokens(session: AsyncSession) -> int:
+    """
+    Returns:
+        Amount of stored RefreshTokens.
+    """
+    return len((await session.scalars(select(RefreshToken.id))).all())
+
+
+def run_with_session(url: str, call):
+    """
+    Runs given coroutine function with a new session of the database with given URL.
+    """
+    async def run():
+        engine = create_async_engine(url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                return await call(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_rotation(writable_database):
+    """
+    A Refresh Token is exchanged once for a new one, which is exchanged in turn.
+    """
+    credentials = LoginCredentials(
+        phone=writable_database.dataset.customer_phones[0],
+        password=writable_database.dataset.password,
+    )
+
+    async def call(session: AsyncSession) -> list[str]:
+        service = build_auth_service(session)
+        tokens = [(await service.login(credentials, None)).refresh_token]
+        for _ in range(2):
+            tokens.append((await service.refresh(tokens[-1])).refresh_token)
+        return tokens
+
+    tokens = run_with_session(writable_database.url, call)
+    assert len(set(tokens)) == 3
+
+
+def test_replay_revokes_family(writable_database):
+    """
+    Presenting a rotated Refresh Token again revokes every token of its family,
+    the one it was rotated to included, and no other family.
+    """
+    phones = writable_database.dataset.customer_phones[:2]
+
+    async def call(session: AsyncSession) -> tuple:
+        service = build_auth_service(session)
+        first, other = [
+            (await service.login(
+                LoginCredentials(phone=phone, password=writable_database.dataset.password),
+                None,
+            )).refresh_token
+            for phone in phones
+        ]
+        rotated = (await service.refresh(first)).refresh_token
+        before = await count_refresh_tokens(session)
+
+        for token in (first, rotated):
+            with pytest.raises(InvalidCredentialsException):
+                await service.refresh(token)
+
+        after = await count_refresh_tokens(session)
+        await service.refresh(other)
+        return before, after
+
+    before, after = run_with_session(writable_database.url, call)
+    # Both tokens of the replayed family are deleted, the other family is kept.
+    assert before - after == 2
+
+
+def test_expired_token_rejected_and_swept(writable_database):
+    """
+    An expired Refresh Token is refused and deleted by the sweep of expired tokens.
+    """
+    credentials = LoginCredentials(
+        phone=writable_database.dataset.customer_phones[0],
+        password=writable_database.dataset.password,
+    )
+
+    async def call(session: AsyncSession) -> tuple:
+        # Tokens issued with no lifetime expire the moment they are issued.
+        service = build_auth_service(session, refresh_token_ttl=0)
+        token = (await service.login(credentials, None)).refresh_token
+        with pytest.raises(InvalidCredentialsException):
+            await service.refresh(token)
+
+        before = await count_refresh_tokens(session)
+        swept = await RefreshTokenRepository(session).delete_expired(int(time()))
+        await session.commit()
+        return before, swept, await count_refresh_tokens(session)
+
+    # The seeded database has no Refresh Tokens of its own.
+    assert run_with_session(writable_database.url, call) == (1, 1, 0)